@@ -15,19 +15,19 @@
     :license: MIT, see LICENSE for more details.
 """
 
-from collections import deque
-from math import floor, log
-
 import operator
 
 
 class MinMaxHeap(object):
     def __init__(self, elements, min_at_root=True):
-        self._elements = deque(elements)
+        self._elements = list(elements)
         self._min_at_even_level = True if min_at_root else False
         if self._elements:
             self._build()
 
+    def __len__(self):
+        return len(self._elements)
+
     def __repr__(self):
         return 'Min-max heap: {0}'.format(self.elements)
 
@@ -36,28 +36,26 @@ class MinMaxHeap(object):
         return list(self._elements)
 
     def delete_max(self):
+        """Deletes and returns the maximum value in the heap."""
         maximum = self.maximum()
-        self._elements.remove(maximum)
+        self._delete(self._extreme_index(min_value=False))
         return maximum
 
     def delete_min(self):
+        """Deletes and returns the minimum value in the heap."""
         minimum = self.minimum()
-        self._elements.popleft()
+        self._delete(self._extreme_index(min_value=True))
         return minimum
 
     def minimum(self):
         if not self._elements:
             raise ValueError('Heap is empty')
-        return self._elements[0]
+        return self._elements[self._extreme_index(min_value=True)]
 
     def maximum(self):
         if not self._elements:
             raise ValueError('Heap is empty')
-        maximum = self._elements[0]
-        for child in self._get_children(0):
-            if self._elements[child] > maximum:
-                maximum = self._elements[child]
-        return maximum
+        return self._elements[self._extreme_index(min_value=False)]
 
     def insert(self, value):
         """Insert a new value into the heap."""
@@ -83,7 +81,7 @@ class MinMaxHeap(object):
         return child > (2 * index + 2)
 
     def _is_min_level(self, index):
-        level = floor(log(index + 1, 2))
+        level = (index + 1).bit_length() - 1
         if level % 2 == 0:
             if self._min_at_even_level:
                 return True
@@ -144,6 +142,63 @@ class MinMaxHeap(object):
         else:
             return False
 
+    def _extreme_index(self, min_value):
+        """Returns the index of the minimum (or the maximum) value, which is
+        either the root or one of its children.
+        """
+        if self._is_min_level(0) == min_value:
+            return 0
+
+        children = self._get_children(0)
+        if not children:
+            return 0
+        extreme = min if min_value else max
+        return extreme(children, key=self._elements.__getitem__)
+
+    def _delete(self, index):
+        """Deletes the value at ``index``, the root or one of its children, by
+        moving the last leaf to ``index`` and trickling it down.
+        """
+        last = self._elements.pop()
+        if index < len(self._elements):
+            self._elements[index] = last
+            self._push_down(index, operator.lt if self._is_min_level(index)
+                            else operator.gt)
+
+    def _push_down(self, index, cmp):
+        """Moves the value at ``index`` down to its place, on the min levels
+        for ``cmp`` as ``operator.lt`` and on the max levels for
+        ``operator.gt``.
+        """
+        elements = self._elements
+        size = len(elements)
+        while True:
+            first = 2 * index + 1
+            if first >= size:
+                return
+
+            # The smallest (or largest) of the children and grand-children,
+            # the grand-children being contiguous from 2 * first + 1.
+            best = first
+            for descendant in range(first + 1, min(first + 2, size)) + \
+                    range(2 * first + 1, min(2 * first + 5, size)):
+                if cmp(elements[descendant], elements[best]):
+                    best = descendant
+
+            value = elements[index]
+            if not cmp(elements[best], value):
+                return
+            elements[index], elements[best] = elements[best], value
+            if best <= first + 1:
+                return
+
+            # The value may now be on the wrong side of its new parent, which
+            # is on a level of the other kind.
+            parent = self._parent_index(best)
+            if cmp(elements[parent], value):
+                elements[best], elements[parent] = elements[parent], value
+            index = best
+
     def _build(self):
         heap_size = len(self._elements)
         mid = heap_size / 2 - 1
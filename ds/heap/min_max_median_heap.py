@@ -4,18 +4,152 @@
     zahlen.ds.heap.min_max_median_heap
     ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-    This module implements the Min-max-median heap data structure.
+    This module implements the Min-max-median heap data structure and a
+    sliding window median over a stream of timestamped values.
+
+    The values are split into a lower and an upper half, each stored in a
+    min-max heap, such that every value of the lower half is not greater than
+    the values of the upper half. The minimum, the median and the maximum are
+    the minimum and the maximum of the lower half and the maximum of the
+    upper half, found in O(1) time, and an insert or a delete takes O(log n)
+    time.
+
+    The median is generalised to the pth percentile by the nearest-rank
+    method, i.e. the lower half holds the ceil(p * n / 100) smallest values.
+
+    A value is deleted lazily: it is counted as deleted and removed only when
+    it becomes the minimum or the maximum of its half, and a half is rebuilt
+    when more than half of its values are deleted. Hence a value can be
+    deleted without searching for it, in amortized O(log n) time, which lets
+    ``SlidingWindowMedian`` expire the values leaving the window.
 
     :copyright: (c) 2014 by Subhajit Ghosh.
     :license: MIT, see LICENSE for more details.
 """
 
+from collections import deque
+
+from min_max_heap import MinMaxHeap
+
+
+class _LazyMinMaxHeap(MinMaxHeap):
+    """A min-max heap which deletes a value lazily.
+
+    The minimum and the maximum are always values which are not deleted.
+    """
 
-class MinMaxMedianHeap(object):
     def __init__(self):
-        self._min_max_heap = None
-        self._max_min_heap = None
-        self._median = None
+        super(_LazyMinMaxHeap, self).__init__([])
+        self.size = 0
+        self._deleted = {}
+        self._deleted_count = 0
+
+    def min(self):
+        return self.minimum()
+
+    def max(self):
+        return self.maximum()
+
+    def insert(self, value):
+        super(_LazyMinMaxHeap, self).insert(value)
+        self.size += 1
+
+    def delete_min(self):
+        minimum = super(_LazyMinMaxHeap, self).delete_min()
+        self.size -= 1
+        self._purge()
+        return minimum
+
+    def delete_max(self):
+        maximum = super(_LazyMinMaxHeap, self).delete_max()
+        self.size -= 1
+        self._purge()
+        return maximum
+
+    def delete(self, value):
+        """Deletes an occurrence of ``value``, which must be in the heap."""
+        self.size -= 1
+        self._deleted[value] = self._deleted.get(value, 0) + 1
+        self._deleted_count += 1
+
+        if self._deleted_count > self.size:
+            self._rebuild()
+        else:
+            self._purge()
+
+    def _purge(self):
+        """Removes the deleted values at the minimum and the maximum."""
+        deleted = self._deleted
+        while deleted and self._elements:
+            value = self.minimum()
+            if value not in deleted:
+                value = self.maximum()
+                if value not in deleted:
+                    return
+                super(_LazyMinMaxHeap, self).delete_max()
+            else:
+                super(_LazyMinMaxHeap, self).delete_min()
+
+            self._deleted_count -= 1
+            if deleted[value] == 1:
+                del deleted[value]
+            else:
+                deleted[value] -= 1
+
+    def _rebuild(self):
+        """Builds the heap again from the values which are not deleted."""
+        deleted = self._deleted
+        elements = []
+        for value in self._elements:
+            if value in deleted:
+                if deleted[value] == 1:
+                    del deleted[value]
+                else:
+                    deleted[value] -= 1
+            else:
+                elements.append(value)
+
+        self._elements = elements
+        self._deleted_count = 0
+        if elements:
+            self._build()
+
+
+class MinMaxMedianHeap(object):
+    """Represents a heap which finds the minimum, the median and the maximum
+    of its values.
+
+    If the no. of values is even, the median is the smaller of the two mid
+    values.
+
+    Example usage::
+        mmmh = MinMaxMedianHeap([5, 1, 4])
+
+        mmmh.insert(3)
+        mmmh.delete(4)
+        mmmh.median()
+
+        # 90th percentile
+        mmmh = MinMaxMedianHeap(values, percentile=90)
+        mmmh.median()
+
+    :param elements: (optional) iterable of the initial values
+    :param percentile: (optional) percentile between 0 and 100 returned as
+        the median
+    """
+
+    def __init__(self, elements=None, percentile=50):
+        if not 0 <= percentile <= 100:
+            raise ValueError('Percentile must be between 0 and 100')
+
+        self._percentile = percentile
+        self._min_max_heap = _LazyMinMaxHeap()
+        self._max_min_heap = _LazyMinMaxHeap()
+        for value in elements or []:
+            self.insert(value)
+
+    def __len__(self):
+        return self._min_max_heap.size + self._max_min_heap.size
 
     def min(self):
         """Returns the minimum value in the heap."""
@@ -23,10 +157,12 @@ class MinMaxMedianHeap(object):
 
     def median(self):
         """Returns the median in the heap."""
-        return self._median
+        return self._min_max_heap.max()
 
     def max(self):
         """Returns the maximum element in the heap."""
+        if not self._max_min_heap.size:
+            return self._min_max_heap.max()
         return self._max_min_heap.max()
 
     def delete_min(self):
@@ -41,57 +177,167 @@ class MinMaxMedianHeap(object):
         If the no. of elements in the heap is even, the deleted value is the
         smaller of the two mid elements.
         """
-        diff = self._min_max_heap.size - self._max_min_heap.size
-        if diff == 1:
-            median = self._min_max_heap.max()
-        elif diff == -1:
-            median = self._max_min_heap.min()
-        else:
-            left = self._min_max_heap.max()
-            right = self._max_min_heap.min()
-            median = self._min_max_heap.delete_max() if left < right \
-                else self._max_min_heap.delete_min()
+        median = self._min_max_heap.delete_max()
         self._balance()
-        self._set_median()
         return median
 
     def delete_max(self):
         """Deletes and returns the maximum value in the heap."""
+        if not self._max_min_heap.size:
+            return self.delete_median()
+
         maximum = self._max_min_heap.delete_max()
         self._balance()
         return maximum
 
+    def delete(self, value):
+        """Deletes an occurrence of ``value`` from the heap.
+
+        The value is not searched for. It must be in the heap, else a
+        ``KeyError`` is raised only if it is outside the range of the values
+        in the half of the heap it would belong to.
+        """
+        if self._min_max_heap.size and value <= self._min_max_heap.max():
+            heap = self._min_max_heap
+        else:
+            heap = self._max_min_heap
+
+        if not heap.size or value < heap.min() or heap.max() < value:
+            raise KeyError('Value: {0} not found in heap'.format(value))
+
+        heap.delete(value)
+        self._balance()
+
     def insert(self, value):
         """Inserts ``value`` into the heap."""
-        if value >= self._median:
+        if self._min_max_heap.size and value > self._min_max_heap.max():
             self._max_min_heap.insert(value)
         else:
             self._min_max_heap.insert(value)
 
         self._balance()
-        self._set_median()
 
     def _balance(self):
-        """Balances the sizes of the min-max heap and the max-min heap if the
-        difference is greater than 1.
+        """Moves the values between the min-max heap and the max-min heap
+        until the min-max heap holds the ceil(p * n / 100) smallest values, but
+        at least 1.
+        """
+        lower, upper = self._min_max_heap, self._max_min_heap
+        size = -(-self._percentile * len(self) // 100)    # ceil(p * n / 100)
+        size = max(1, int(size)) if len(self) else 0
+
+        while lower.size > size:
+            upper.insert(lower.delete_max())
+        while lower.size < size:
+            lower.insert(upper.delete_min())
+
+
+class SlidingWindowMedian(object):
+    """Represents the median of the values of a stream of events in a
+    sliding time window.
+
+    An event at time ``t`` stays in the window while the latest timestamp is
+    less than ``t + window``.
+
+    Example usage::
+        swm = SlidingWindowMedian(60)
+
+        swm.insert(0, 12.5)
+        swm.insert(30, 10.0)
+        swm.insert(75, 11.0)    # Expires the event at 0
+        swm.median()
+
+    :param window: length of the window, in the unit of the timestamps
+    :param percentile: (optional) percentile between 0 and 100 returned as
+        the median
+    """
+
+    def __init__(self, window, percentile=50):
+        if window <= 0:
+            raise ValueError('Window must be greater than 0')
+
+        self._window = window
+        self._heap = MinMaxMedianHeap(percentile=percentile)
+        self._events = deque()
+
+    def __len__(self):
+        return len(self._events)
+
+    def min(self):
+        """Returns the minimum value in the window."""
+        return self._heap.min()
+
+    def median(self):
+        """Returns the median in the window."""
+        return self._heap.median()
+
+    def max(self):
+        """Returns the maximum value in the window."""
+        return self._heap.max()
+
+    def insert(self, timestamp, value):
+        """Adds an event with value ``value`` at time ``timestamp``, which
+        must not be before the previous event, and expires the events which
+        left the window.
         """
-        diff = self._min_max_heap.size - self._max_min_heap.size
-        if diff > 1:
-            self._max_min_heap.insert(self._min_max_heap.delete_max())
-        elif diff < -1:
-            self._min_max_heap.insert(self._max_min_heap.delete_min())
+        if self._events and timestamp < self._events[-1][0]:
+            raise ValueError('Timestamp: {0} is before the previous '
+                             'event'.format(timestamp))
+
+        self._events.append((timestamp, value))
+        self._heap.insert(value)
+        self.expire(timestamp)
+
+    def expire(self, now):
+        """Removes the events which are not in the window at time ``now``."""
+        events = self._events
+        while events and events[0][0] <= now - self._window:
+            self._heap.delete(events.popleft()[1])
+
 
-    def _set_median(self):
-        """Calculates and sets the median in the heap.
+if __name__ == '__main__':
+    # Benchmark the sliding window median of a stream of events against a
+    # window kept in a sorted list. The no. of events (10^7 by default) and the
+    # window length can be passed as arguments.
+    from bisect import bisect_left, insort
+    import random
+    import sys
+    import time
 
-        If the no. of elements in the heap is even, the median is the smaller of
-        the two mid elements.
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+    window = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    def events():
+        """Yields the same stream of (timestamp, value) events, about 1 event
+        per unit of time, on every call.
         """
-        diff = self._min_max_heap.size - self._max_min_heap.size
-        if diff == 1:
-            median = self._min_max_heap.max()
-        elif diff == -1:
-            median = self._max_min_heap.min()
-        else:
-            median = min(self._min_max_heap.max(), self._max_min_heap.min())
-        self._median = median
\ No newline at end of file
+        generator = random.Random(size)
+        timestamp = 0
+        for _ in xrange(size):
+            timestamp += generator.randrange(3)
+            yield timestamp, generator.gauss(100, 15)
+
+    swm = SlidingWindowMedian(window)
+    start = time.time()
+    checksum = 0
+    for timestamp, value in events():
+        swm.insert(timestamp, value)
+        checksum += swm.median()
+    elapsed = time.time() - start
+    print '{0:<20} {1:.0f} events/s (checksum {2:.1f})'.format(
+        'SlidingWindowMedian', size / elapsed, checksum)
+
+    window_events = deque()
+    sorted_values = []
+    start = time.time()
+    checksum = 0
+    for timestamp, value in events():
+        window_events.append((timestamp, value))
+        insort(sorted_values, value)
+        while window_events[0][0] <= timestamp - window:
+            del sorted_values[bisect_left(sorted_values,
+                                          window_events.popleft()[1])]
+        checksum += sorted_values[(len(sorted_values) - 1) // 2]
+    elapsed = time.time() - start
+    print '{0:<20} {1:.0f} events/s (checksum {2:.1f})'.format(
+        'Sorted list', size / elapsed, checksum)
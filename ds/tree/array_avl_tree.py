@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.array_avl_tree
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements the AVL tree and the Order Statistics tree over an
+    array-backed node pool.
+
+    A node of ``zahlen.ds.tree.avl_tree.AVLTree`` is a Python object with an
+    attribute dict, which takes a few hundred bytes. Here a node is an integer
+    id and the key, children, parent, height and weight of all the nodes are
+    stored in parallel typed arrays of a ``NodePool``, which takes about 25
+    bytes per node (plus the key objects). The ids of the deleted nodes are
+    chained in a free list and reused by the later inserts.
+
+    The trees have the same shape as an ``AVLTree`` built with the same
+    operations.
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from array import array
+import sys
+
+
+# Id of an absent node.
+_NIL = -1
+
+
+class NodePool(object):
+    """Stores the nodes of a binary tree in parallel arrays indexed by the
+    node id.
+
+    :param key_typecode: (optional) typecode of an array to store the keys,
+        e.g. 'l' for integer keys. The keys are stored in a list by default.
+    :param weighted: (optional) if True, stores the weight of every node
+    """
+
+    def __init__(self, key_typecode=None, weighted=False):
+        self.keys = array(key_typecode) if key_typecode else []
+        self.left = array('i')
+        self.right = array('i')
+        self.parent = array('i')
+        self.height = array('b')
+        self.weight = array('i') if weighted else None
+
+        # Head of the free list. The next free id is stored in ``left``.
+        self._free = _NIL
+        self._size = 0
+
+    def __len__(self):
+        """Returns the no. of allocated nodes."""
+        return self._size
+
+    def allocate(self, key):
+        """Allocates a leaf node and returns its id."""
+        self._size += 1
+        node = self._free
+        if node != _NIL:
+            self._free = self.left[node]
+            self.keys[node] = key
+            self.left[node] = self.right[node] = self.parent[node] = _NIL
+            self.height[node] = 0
+            if self.weight is not None:
+                self.weight[node] = 1
+            return node
+
+        self.keys.append(key)
+        self.left.append(_NIL)
+        self.right.append(_NIL)
+        self.parent.append(_NIL)
+        self.height.append(0)
+        if self.weight is not None:
+            self.weight.append(1)
+        return len(self.left) - 1
+
+    def release(self, node):
+        """Puts a node on the free list."""
+        self._size -= 1
+        self.left[node] = self._free
+        self._free = node
+        if isinstance(self.keys, list):
+            self.keys[node] = None
+
+    def memory(self):
+        """Returns the no. of bytes used by the arrays, excluding the key
+        objects.
+        """
+        arrays = [self.keys, self.left, self.right, self.parent, self.height]
+        if self.weight is not None:
+            arrays.append(self.weight)
+        return sum(sys.getsizeof(values) for values in arrays)
+
+
+class ArrayAVLTree(object):
+    """Represents an AVL tree whose nodes are stored in a ``NodePool``.
+
+    :param key_typecode: (optional) typecode of an array to store the keys
+    """
+
+    weighted = False
+
+    def __init__(self, key_typecode=None):
+        self._pool = NodePool(key_typecode, self.weighted)
+        self._root = _NIL
+
+    def __len__(self):
+        return len(self._pool)
+
+    def __iter__(self):
+        """Yields the keys in sorted order."""
+        node = self._root
+        if node == _NIL:
+            return
+
+        keys, left, right, parent = (self._pool.keys, self._pool.left,
+                                     self._pool.right, self._pool.parent)
+        while left[node] != _NIL:
+            node = left[node]
+        while node != _NIL:
+            yield keys[node]
+            if right[node] != _NIL:
+                node = right[node]
+                while left[node] != _NIL:
+                    node = left[node]
+            else:
+                while parent[node] != _NIL and node == right[parent[node]]:
+                    node = parent[node]
+                node = parent[node]
+
+    @property
+    def height(self):
+        """Returns the height of the tree, -1 for an empty tree."""
+        return self._height(self._root)
+
+    def memory_per_node(self):
+        """Returns the average no. of bytes used by a node, excluding the key
+        objects.
+        """
+        return float(self._pool.memory()) / max(1, len(self._pool))
+
+    def insert(self, key):
+        """Inserts key ``key`` in the tree."""
+        pool = self._pool
+        keys, left, right = pool.keys, pool.left, pool.right
+
+        node = pool.allocate(key)
+        if self._root == _NIL:
+            self._root = node
+            return
+
+        current = self._root
+        while True:
+            if key < keys[current]:
+                if left[current] == _NIL:
+                    left[current] = node
+                    break
+                current = left[current]
+            else:
+                if right[current] == _NIL:
+                    right[current] = node
+                    break
+                current = right[current]
+
+        pool.parent[node] = current
+        self._rebalance_up(current)
+
+    def delete(self, key):
+        """Deletes key ``key`` from the tree."""
+        pool = self._pool
+        left, right, parent = pool.left, pool.right, pool.parent
+
+        node = self._search_node(key)
+        if node == _NIL:
+            raise KeyError('Key: {0} not found in tree'.format(key))
+
+        # For a complete internal node, replace node's key by inorder
+        # successor's key and remove the successor.
+        if left[node] != _NIL and right[node] != _NIL:
+            successor = right[node]
+            while left[successor] != _NIL:
+                successor = left[successor]
+            pool.keys[node] = pool.keys[successor]
+            node = successor
+
+        child = left[node] if left[node] != _NIL else right[node]
+        node_parent = parent[node]
+        if child != _NIL:
+            parent[child] = node_parent
+        self._replace_child(node_parent, node, child)
+        pool.release(node)
+        self._rebalance_up(node_parent)
+
+    def search(self, key):
+        """Returns True if key `key` exists in the tree, else False."""
+        return self._search_node(key) != _NIL
+
+    def sorted_keys(self):
+        """Returns a sorted list of the keys in the tree."""
+        return list(self)
+
+    def is_balanced(self):
+        """Returns true if the stored heights are correct and the heights of
+        the children of every node differ by at most 1.
+        """
+        return self._check_height(self._root) is not None
+
+    def _check_height(self, node):
+        if node == _NIL:
+            return -1
+
+        left_height = self._check_height(self._pool.left[node])
+        right_height = self._check_height(self._pool.right[node])
+        if left_height is None or right_height is None or \
+                abs(left_height - right_height) > 1 or \
+                self._pool.height[node] != 1 + max(left_height, right_height):
+            return None
+        return self._pool.height[node]
+
+    def _search_node(self, key):
+        """Returns the id of the node with key ``key``, or ``_NIL``."""
+        keys, left, right = self._pool.keys, self._pool.left, self._pool.right
+        node = self._root
+        while node != _NIL:
+            if keys[node] == key:
+                break
+            node = left[node] if key < keys[node] else right[node]
+        return node
+
+    def _height(self, node):
+        return self._pool.height[node] if node != _NIL else -1
+
+    def _update(self, node):
+        """Recalculates the attributes of a node from its children."""
+        pool = self._pool
+        pool.height[node] = 1 + max(self._height(pool.left[node]),
+                                    self._height(pool.right[node]))
+
+    def _rebalance_up(self, node):
+        """Updates and balances a node and all its ancestors."""
+        parent = self._pool.parent
+        while node != _NIL:
+            self._update(node)
+            node = parent[self._balance(node)]
+
+    def _balance(self, node):
+        """Balances a node and returns the root of its subtree."""
+        left, right = self._pool.left, self._pool.right
+        difference = self._height(left[node]) - self._height(right[node])
+
+        if difference > 1:
+            # If left child is right heavy, first make it left heavy.
+            child = left[node]
+            if self._height(right[child]) > self._height(left[child]):
+                self._rotate_left(child)
+            return self._rotate_right(node)
+        elif difference < -1:
+            # If right child is left heavy, first make it right heavy.
+            child = right[node]
+            if self._height(left[child]) > self._height(right[child]):
+                self._rotate_right(child)
+            return self._rotate_left(node)
+        return node
+
+    def _rotate_left(self, node):
+        """Rotates ``node`` to make it the left child of its right child and
+        returns the right child.
+        """
+        left, right, parent = self._pool.left, self._pool.right, \
+            self._pool.parent
+        child = right[node]
+        node_parent = parent[node]
+
+        right[node] = left[child]
+        if left[child] != _NIL:
+            parent[left[child]] = node
+
+        left[child] = node
+        parent[node] = child
+        parent[child] = node_parent
+        self._replace_child(node_parent, node, child)
+
+        self._update(node)
+        self._update(child)
+        return child
+
+    def _rotate_right(self, node):
+        """Rotates ``node`` to make it the right child of its left child and
+        returns the left child.
+        """
+        left, right, parent = self._pool.left, self._pool.right, \
+            self._pool.parent
+        child = left[node]
+        node_parent = parent[node]
+
+        left[node] = right[child]
+        if right[child] != _NIL:
+            parent[right[child]] = node
+
+        right[child] = node
+        parent[node] = child
+        parent[child] = node_parent
+        self._replace_child(node_parent, node, child)
+
+        self._update(node)
+        self._update(child)
+        return child
+
+    def _replace_child(self, parent, node, child):
+        """Replaces ``node`` by ``child`` as a child of ``parent``."""
+        if parent == _NIL:
+            self._root = child
+        elif self._pool.left[parent] == node:
+            self._pool.left[parent] = child
+        else:
+            self._pool.right[parent] = child
+
+
+class ArrayOrderStatisticsTree(ArrayAVLTree):
+    """Represents an Order statistics tree whose nodes are stored in a
+    ``NodePool``.
+    """
+
+    weighted = True
+
+    def kth_smallest_key(self, k):
+        """Returns the kth smallest element in the tree."""
+        if self._root == _NIL:
+            raise Exception('Tree is empty!')
+
+        pool = self._pool
+        if not 1 <= k <= pool.weight[self._root]:
+            raise IndexError('Rank must be a positive value less than: '
+                             '{0}'.format(pool.weight[self._root] + 1))
+
+        node = self._root
+        while True:
+            left_weight = self._weight(pool.left[node])
+            if k <= left_weight:
+                node = pool.left[node]
+            else:
+                k -= left_weight + 1
+                if k == 0:
+                    return pool.keys[node]
+                node = pool.right[node]
+
+    def rank(self, key):
+        """Returns the no. of keys smaller than ``key``."""
+        pool = self._pool
+        count = 0
+        node = self._root
+        while node != _NIL:
+            if pool.keys[node] < key:
+                count += self._weight(pool.left[node]) + 1
+                node = pool.right[node]
+            else:
+                node = pool.left[node]
+        return count
+
+    def _weight(self, node):
+        return self._pool.weight[node] if node != _NIL else 0
+
+    def _update(self, node):
+        super(ArrayOrderStatisticsTree, self)._update(node)
+        pool = self._pool
+        pool.weight[node] = 1 + self._weight(pool.left[node]) + \
+            self._weight(pool.right[node])
+
+
+if __name__ == '__main__':
+    # Report the memory per node and the insert throughput against the
+    # OrderStatisticsTree. The no. of keys can be passed as an argument.
+    import random
+    import time
+
+    import order_statistics_tree
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    keys = random.sample(xrange(10 * size), size)
+
+    ost = order_statistics_tree.OrderStatisticsTree(
+        order_statistics_tree.Node)
+    start = time.time()
+    for key in keys:
+        ost.insert(key)
+    elapsed = time.time() - start
+    node = ost.root
+    node_bytes = sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+    print '{0:<26} {1:.0f} bytes/node, {2:.0f} inserts/s'.format(
+        'OrderStatisticsTree', node_bytes, size / elapsed)
+
+    for name, typecode in [('ArrayOrderStatisticsTree', None),
+                           ("  with keys in array('l')", 'l')]:
+        tree = ArrayOrderStatisticsTree(typecode)
+        start = time.time()
+        for key in keys:
+            tree.insert(key)
+        elapsed = time.time() - start
+        print '{0:<26} {1:.0f} bytes/node, {2:.0f} inserts/s'.format(
+            name, tree.memory_per_node(), size / elapsed)
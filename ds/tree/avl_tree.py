@@ -6,6 +6,15 @@
 
     This module implements the AVL tree data structure.
 
+    Besides insert and delete, an AVL tree supports joining two trees and
+    splitting a tree at a key in O(log n) time. The union, intersection and
+    difference of two trees of sizes m <= n are built on these in
+    O(m log(n / m + 1)) time, by splitting the larger tree at the root of the
+    smaller one and recursing on both the halves.
+
+    References:
+    - Blelloch, Ferizovic, Sun: Just Join for Parallel Ordered Sets, SPAA 2016
+
     :copyright: (c) 2014 by Subhajit Ghosh.
     :license: MIT, see LICENSE for more details.
 """
@@ -93,25 +102,198 @@ class AVLTree(binary_search_tree.BinarySearchTree):
 
         return is_balanced
 
+    def join(self, other):
+        """Moves all the keys of ``other``, which must be greater than the keys
+        in the tree, to the tree. ``other`` becomes empty.
+
+        :param other: tree of the same type
+        """
+        if not other.root:
+            return
+        if self.root:
+            if not self._max_node(self.root).key < \
+                    self._min_node(other.root).key:
+                raise ValueError('Keys of the joined tree must be greater '
+                                 'than the keys in the tree')
+        self.root = self._join_trees(self.root, other.root)
+        other.root = None
+
+    def split(self, key):
+        """Splits the tree at ``key``. The keys smaller than ``key`` remain in
+        the tree and the other keys are moved to a new tree, which is
+        returned.
+        """
+        smaller, match, larger = self._split_node(self.root, key)
+        if match:
+            larger = self._join_nodes(None, match, larger)
+
+        self.root = self._detach(smaller)
+        tree = self.__class__(self._Node)
+        tree.root = self._detach(larger)
+        return tree
+
+    def union(self, other):
+        """Moves the keys of ``other`` which are not in the tree to the tree.
+        ``other`` becomes empty.
+        """
+        self.root = self._detach(self._union(self.root, other.root))
+        other.root = None
+
+    def intersection(self, other):
+        """Removes the keys which are not in ``other`` from the tree.
+        ``other`` becomes empty.
+        """
+        self.root = self._detach(self._intersection(self.root, other.root))
+        other.root = None
+
+    def difference(self, other):
+        """Removes the keys which are in ``other`` from the tree. ``other``
+        becomes empty.
+        """
+        self.root = self._detach(self._difference(self.root, other.root))
+        other.root = None
+
+    def _union(self, node, other):
+        if not node:
+            return other
+        if not other:
+            return node
+
+        left, right = self._take_children(other)
+        smaller, match, larger = self._split_node(node, other.key)
+        return self._join_nodes(self._union(smaller, left), other,
+                                self._union(larger, right))
+
+    def _intersection(self, node, other):
+        if not node or not other:
+            return None
+
+        left, right = self._take_children(other)
+        smaller, match, larger = self._split_node(node, other.key)
+        smaller = self._intersection(smaller, left)
+        larger = self._intersection(larger, right)
+        if match:
+            return self._join_nodes(smaller, match, larger)
+        return self._join_trees(smaller, larger)
+
+    def _difference(self, node, other):
+        if not node or not other:
+            return node
+
+        left, right = self._take_children(other)
+        smaller, match, larger = self._split_node(node, other.key)
+        return self._join_trees(self._difference(smaller, left),
+                                self._difference(larger, right))
+
+    def _join_nodes(self, left, middle, right):
+        """Joins the subtrees ``left`` and ``right`` with a detached node
+        ``middle`` and returns the root of the joined subtree.
+
+        The keys of ``left`` must be smaller than the key of ``middle`` and the
+        keys of ``right`` greater. The taller subtree is descended until a
+        node of about the height of the other subtree, which is replaced by
+        ``middle``, and the nodes on the way are rebalanced.
+        """
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
+
+        if left_height > right_height + 1:
+            left.right = self._join_nodes(left.right, middle, right)
+            left.update()
+            return self._balance_node(left)
+        elif right_height > left_height + 1:
+            right.left = self._join_nodes(left, middle, right.left)
+            right.update()
+            return self._balance_node(right)
+
+        middle.left = left
+        middle.right = right
+        middle.update()
+        return middle
+
+    def _join_trees(self, left, right):
+        """Joins the subtrees ``left`` and ``right`` and returns the root of
+        the joined subtree.
+        """
+        if not left:
+            return right
+        if not right:
+            return left
+
+        left, last = self._split_last(left)
+        return self._join_nodes(left, last, right)
+
+    def _split_last(self, node):
+        """Removes the node with the largest key from a subtree and returns
+        the root of the remaining subtree and the removed node.
+        """
+        left, right = self._take_children(node)
+        if not right:
+            return left, node
+
+        right, last = self._split_last(right)
+        return self._join_nodes(left, node, right), last
+
+    def _split_node(self, node, key):
+        """Splits a subtree at ``key``.
+
+        Returns the roots of the subtrees with the keys smaller and greater
+        than ``key``, and the detached node with ``key`` (or None) between
+        them.
+        """
+        if not node:
+            return None, None, None
+
+        left, right = self._take_children(node)
+        if key == node.key:
+            return left, node, right
+        elif key < node.key:
+            smaller, match, larger = self._split_node(left, key)
+            return smaller, match, self._join_nodes(larger, node, right)
+        else:
+            smaller, match, larger = self._split_node(right, key)
+            return self._join_nodes(left, node, smaller), match, larger
+
+    def _take_children(self, node):
+        """Detaches a node from its parent and children, and returns the
+        children.
+        """
+        left, right = node.left, node.right
+        node.left = node.right = None
+        node.parent = None
+        return self._detach(left), self._detach(right)
+
+    def _detach(self, node):
+        """Marks a node as the root of a subtree."""
+        if node:
+            node.parent = None
+        return node
+
     def _balance(self, node):
         """Balances a node and all its ancestors."""
         parent = node.parent
+        self._balance_node(node)
+
+        if parent:
+            self._balance(parent)
 
+    def _balance_node(self, node):
+        """Balances a node and returns the root of its subtree."""
         if node.is_left_heavy():
             # If left child is right heavy, first make it left heavy.
             if node.left.is_right_heavy(diff=0):
                 self._rotate_left(node.left, node.left.right)
 
             self._rotate_right(node, node.left)
+            return node.parent
         elif node.is_right_heavy():
             # If right child is left heavy, first make it right heavy.
             if node.right.is_left_heavy(diff=0):
                 self._rotate_right(node.right, node.right.left)
 
             self._rotate_left(node, node.right)
-
-        if parent:
-            self._balance(parent)
+            return node.parent
+        return node
 
     def _rotate_left(self, node, heavy_child):
         """Rotates ``node`` to make it the left child of ``heavy_child``."""
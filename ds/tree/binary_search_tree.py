@@ -6,6 +6,10 @@
 
     This module implements the Binary Search Tree data structure.
 
+    The keys are iterated lazily in sorted (or reverse) order by following
+    the parent pointers from a node to its in-order successor (or
+    predecessor), which takes O(1) amortized time per key and no stack.
+
     :copyright: (c) 2014 by Subhajit Ghosh.
     :license: MIT, see LICENSE for more details.
 """
@@ -51,6 +55,14 @@ class Node(object):
         """Returns true if node is a leaf node."""
         return self.left is None and self.right is None
 
+    def update(self):
+        """Recalculates the attributes of a node from its children.
+
+        This method is a hook for the sub-classes of Node which maintain
+        attributes of the subtree of a node (e.g. height for an AVL tree).
+        """
+        pass
+
 
 class BinarySearchTree(object):
     """Represents the Binary Search Tree data structure."""
@@ -62,6 +74,44 @@ class BinarySearchTree(object):
     def __str__(self):
         return self.draw(self.root)
 
+    def __iter__(self):
+        """Yields the keys in sorted order.
+
+        The tree must not be modified during the iteration.
+        """
+        node = self._min_node(self.root) if self.root else None
+        while node:
+            yield node.key
+            node = self._next_node(node)
+
+    def __reversed__(self):
+        """Yields the keys in reverse sorted order."""
+        node = self._max_node(self.root) if self.root else None
+        while node:
+            yield node.key
+            node = self._previous_node(node)
+
+    @classmethod
+    def from_sorted(cls, keys, node_type):
+        """Builds a balanced tree from keys in increasing order in O(n) time.
+
+        The middle key becomes the root and the keys before and after it
+        build its left and right subtrees, so the subtrees of every node
+        differ in size by at most 1.
+
+        :param keys: iterable of keys in strictly increasing order
+        :param node_type: type of the nodes of the tree
+        """
+        keys = list(keys)
+        for index in xrange(1, len(keys)):
+            if not keys[index - 1] < keys[index]:
+                raise ValueError('Expected keys in increasing order without '
+                                 'duplicates')
+
+        tree = cls(node_type)
+        tree.root = tree._build_balanced(keys, 0, len(keys) - 1)
+        return tree
+
     def insert(self, key):
         """Inserts key ``key`` in the tree."""
 
@@ -92,9 +142,67 @@ class BinarySearchTree(object):
 
     def sorted_keys(self):
         """Returns a sorted list of the keys in the tree."""
-        keys = []
-        self.inorder_walk(self.root, keys)
-        return keys
+        return list(self)
+
+    def irange(self, low=None, high=None, inclusive=(True, True),
+               reverse=False):
+        """Yields the keys between ``low`` and ``high`` in sorted order.
+
+        The first key is found in O(log n) time and every next key in O(1)
+        amortized time.
+
+        :param low: (optional) lower bound, None for no lower bound
+        :param high: (optional) upper bound, None for no upper bound
+        :param inclusive: (optional) pair of booleans, whether the lower and
+            the upper bound are included. Defaults to (True, True).
+        :param reverse: (optional) if True, yields the keys in reverse order
+        """
+        include_low, include_high = inclusive
+
+        def above_low(key):
+            return low is None or low < key or include_low and low == key
+
+        def below_high(key):
+            return high is None or key < high or include_high and key == high
+
+        if reverse:
+            if high is None:
+                node = self._max_node(self.root) if self.root else None
+            else:
+                node = self._floor_node(high, include_high)
+            while node and above_low(node.key):
+                yield node.key
+                node = self._previous_node(node)
+        else:
+            if low is None:
+                node = self._min_node(self.root) if self.root else None
+            else:
+                node = self._ceiling_node(low, include_low)
+            while node and below_high(node.key):
+                yield node.key
+                node = self._next_node(node)
+
+    def floor(self, key):
+        """Returns the largest key less than or equal to ``key``, or None."""
+        node = self._floor_node(key, True)
+        return node.key if node else None
+
+    def ceiling(self, key):
+        """Returns the smallest key greater than or equal to ``key``, or
+        None.
+        """
+        node = self._ceiling_node(key, True)
+        return node.key if node else None
+
+    def predecessor(self, key):
+        """Returns the largest key less than ``key``, or None."""
+        node = self._floor_node(key, False)
+        return node.key if node else None
+
+    def successor(self, key):
+        """Returns the smallest key greater than ``key``, or None."""
+        node = self._ceiling_node(key, False)
+        return node.key if node else None
 
     def inorder_walk(self, node, keys):
         if node:
@@ -119,6 +227,20 @@ class BinarySearchTree(object):
 
         return node_str
 
+    def _build_balanced(self, keys, start, end):
+        """Builds a balanced subtree of ``keys[start:end + 1]`` and returns
+        its root.
+        """
+        if start > end:
+            return None
+
+        mid = (start + end) // 2
+        node = self._Node(keys[mid])
+        node.left = self._build_balanced(keys, start, mid - 1)
+        node.right = self._build_balanced(keys, mid + 1, end)
+        node.update()
+        return node
+
     def _delete_node(self, node):
         """Deletes a leaf node or an internal node."""
         if node.is_leaf():
@@ -183,6 +305,62 @@ class BinarySearchTree(object):
 
         return node
 
+    def _floor_node(self, key, inclusive):
+        """Returns the last node in sorted order whose key is less than (or
+        equal to, if ``inclusive``) ``key``, or None.
+        """
+        node = self.root
+        result = None
+        while node:
+            if node.key < key or inclusive and node.key == key:
+                result = node
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    def _ceiling_node(self, key, inclusive):
+        """Returns the first node in sorted order whose key is greater than
+        (or equal to, if ``inclusive``) ``key``, or None.
+        """
+        node = self.root
+        result = None
+        while node:
+            if key < node.key or inclusive and node.key == key:
+                result = node
+                node = node.left
+            else:
+                node = node.right
+        return result
+
+    def _min_node(self, node):
+        """Returns the node with the smallest key in a subtree."""
+        while node.left:
+            node = node.left
+        return node
+
+    def _max_node(self, node):
+        """Returns the node with the largest key in a subtree."""
+        while node.right:
+            node = node.right
+        return node
+
+    def _next_node(self, node):
+        """Returns the in-order successor of a node, or None."""
+        if node.right:
+            return self._min_node(node.right)
+        while node.parent and node is node.parent.right:
+            node = node.parent
+        return node.parent
+
+    def _previous_node(self, node):
+        """Returns the in-order predecessor of a node, or None."""
+        if node.left:
+            return self._max_node(node.left)
+        while node.parent and node is node.parent.left:
+            node = node.parent
+        return node.parent
+
     def _bubble_up_node_attrs(self, node):
         """Updates node attributes and bubbles up the updated values up to the
         root.
@@ -15,12 +15,20 @@ import binary_search_tree
 
 
 class Node(binary_search_tree.Node):
+    """A node in a binary search tree with duplicate keys.
+
+    The node stores a key once and the no. of occurrences of the key in
+    ``_count``.
+    """
+
     def __init__(self, key):
         super(Node, self).__init__(key)
         self._count = 1
 
     def __str__(self):
-        pass
+        parent_key = self.parent.key if self.parent else -1
+        return 'key:{0},count:{1},parent:{2}'.format(self.key, self._count,
+                                                     parent_key)
 
 
 class BinarySearchTreeDupKeys(binary_search_tree.BinarySearchTree):
@@ -28,10 +36,19 @@ class BinarySearchTreeDupKeys(binary_search_tree.BinarySearchTree):
 
     def insert(self, key):
         """Inserts ``key`` in the tree."""
-        if not self._root:
-            self._root = self._Node(key)
+        self.insert_many(key, 1)
+
+    def insert_many(self, key, n):
+        """Inserts ``n`` occurrences of ``key`` in the tree in O(log n)
+        time.
+        """
+        if n < 1:
+            raise ValueError('No. of occurrences must be greater than 0')
+
+        if not self.root:
+            self.root = self._new_node(key, n)
         else:
-            node = self._root
+            node = self.root
             parent = None
 
             while node:
@@ -43,14 +60,19 @@ class BinarySearchTreeDupKeys(binary_search_tree.BinarySearchTree):
                 node = node.left if key < node.key else node.right
 
             if key == parent.key:
-                parent._count += 1
+                parent._count += n
             elif key < parent.key:
-                parent.left = self._Node(key)
+                parent.left = self._new_node(key, n)
             else:
-                parent.right = self._Node(key)
+                parent.right = self._new_node(key, n)
 
             self._bubble_up_node_attrs(parent)
 
+    def count(self, key):
+        """Returns the no. of occurrences of ``key`` in the tree."""
+        node = self._search_node(key)
+        return node._count if node else 0
+
     def delete(self, key, delete_all=False):
         """Deletes key ``key`` from the tree.
 
@@ -65,4 +87,25 @@ class BinarySearchTreeDupKeys(binary_search_tree.BinarySearchTree):
         elif node.is_leaf():
             self._delete_leaf_node(node)
         else:
-            self._delete_internal_node(node)
\ No newline at end of file
+            self._delete_internal_node(node)
+
+    def _new_node(self, key, count):
+        node = self._Node(key)
+        node._count = count
+        node.update()
+        return node
+
+    def _delete_internal_node(self, node):
+        """Deletes an internal node with 1 or 2 children.
+
+        A complete internal node takes both the key and the count of its
+        inorder successor.
+        """
+        if node.left and node.right:
+            successor = self._min_node(node.right)
+            key, count = successor.key, successor._count
+            self._delete_node(successor)
+            node.key, node._count = key, count
+            self._bubble_up_node_attrs(node)
+        else:
+            super(BinarySearchTreeDupKeys, self)._delete_internal_node(node)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.dynamic_segment_tree
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements a dynamic (implicit) Segment Tree over a range of
+    integer coordinates, e.g. timestamps, which is too large to be allocated.
+
+    The nodes are allocated only when an element below them is updated, so k
+    updates allocate O(k log U) nodes for a range of U coordinates. A node is
+    an integer id and the children and the aggregates of all the nodes are
+    stored in flat pools. An absent child is id 0, which is the root and never
+    a child.
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from array import array
+
+from lazy_segment_tree import SUM
+
+
+class DynamicSegmentTree(object):
+    """Construct a dynamic segment tree over the coordinates [start, end].
+
+    Every coordinate holds the identity of the aggregate function until it is
+    updated.
+
+    Example usage::
+        st = DynamicSegmentTree(0, 2 ** 62, SUM)
+
+        # Assign a value to a coordinate
+        st.update(1400000000, 5)
+
+        # Aggregate the values within a range of coordinates
+        st.query(start, end)
+
+    :param start: first coordinate
+    :param end: last coordinate
+    :param monoid: (optional) the aggregate function, defaults to ``SUM``
+    """
+
+    def __init__(self, start, end, monoid=SUM):
+
+        if start > end:
+            raise ValueError('Invalid range: [{0}, {1}]'.format(start, end))
+
+        self._start = start
+        self._end = end
+        self._monoid = monoid
+
+        self._left = array('l', [0])
+        self._right = array('l', [0])
+        self._values = [monoid.identity]
+
+    def __len__(self):
+        """Returns the no. of allocated nodes."""
+        return len(self._values)
+
+    def update(self, index, value):
+        """Assign ``value`` at the coordinate ``index``."""
+
+        if not self._start <= index <= self._end:
+            raise IndexError('Invalid index: {0}'.format(index))
+
+        left, right, values = self._left, self._right, self._values
+
+        # Walk down to the leaf, allocating the missing nodes on the way.
+        path = []
+        node = 0
+        range_start, range_end = self._start, self._end
+        while range_start < range_end:
+            path.append(node)
+            mid = (range_start + range_end) // 2
+            if index <= mid:
+                if not left[node]:
+                    left[node] = self._new_node()
+                node = left[node]
+                range_end = mid
+            else:
+                if not right[node]:
+                    right[node] = self._new_node()
+                node = right[node]
+                range_start = mid + 1
+        values[node] = value
+
+        combine = self._monoid.combine
+        identity = self._monoid.identity
+        for node in reversed(path):
+            values[node] = combine(
+                values[left[node]] if left[node] else identity,
+                values[right[node]] if right[node] else identity)
+
+    def query(self, start, end):
+        """Return the aggregate of the values within the specified range of
+        coordinates.
+
+        :param start: range start coordinate
+        :param end: range end coordinate (inclusive)
+        """
+
+        if not self._start <= start <= end:
+            raise IndexError('Invalid start index: {0}'.format(start))
+
+        if not start <= end <= self._end:
+            raise IndexError('Invalid end index: {0}'.format(end))
+
+        left, right, values = self._left, self._right, self._values
+        combine = self._monoid.combine
+        result = self._monoid.identity
+
+        # The right child is pushed before the left, so that the ranges are
+        # combined from left to right.
+        stack = [(0, self._start, self._end)]
+        while stack:
+            node, range_start, range_end = stack.pop()
+            if start <= range_start and range_end <= end:
+                result = combine(result, values[node])
+                continue
+
+            mid = (range_start + range_end) // 2
+            if end > mid and right[node]:
+                stack.append((right[node], mid + 1, range_end))
+            if start <= mid and left[node]:
+                stack.append((left[node], range_start, mid))
+        return result
+
+    def _new_node(self):
+        """Allocate a node and return its id."""
+        self._left.append(0)
+        self._right.append(0)
+        self._values.append(self._monoid.identity)
+        return len(self._values) - 1
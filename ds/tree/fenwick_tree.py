@@ -11,14 +11,17 @@
     :license: MIT, see LICENSE for more details.
 """
 
+from array import array
+from itertools import izip
+
 
 class FenwickTree(object):
     """Construct a Fenwick tree.
 
-    This implementation of the Fenwick Tree uses a fixed length array to
-    represent the tree. The size of the tree is specified during the
-    construction of the tree and cannot be modified i.e. new elements cannot be
-    added but existing elements can be modified.
+    This implementation of the Fenwick Tree uses an array to represent the
+    tree. The size of the tree is specified during the construction of the
+    tree. Existing elements can be modified and new elements can be appended
+    at the end in O(log n) time.
 
     Example usage::
         # Construct the tree
@@ -29,6 +32,21 @@ class FenwickTree(object):
 
         # Read the value at an index
         ft.read(index)
+
+        # Append a new element
+        ft.append(value)
+
+        # Read or update in batches
+        ft.read_many(indices)
+        ft.update_many(indices, values)
+
+        # Construct the tree from a list of initial values in O(n)
+        ft = FenwickTree.from_values([1, 0, 2, 1])
+
+        # Sum of the values within a range and the first index at which the
+        # running sum reaches a value
+        ft.range_sum(start, end)
+        ft.lower_bound(prefix)
     """
 
     def __init__(self, size):
@@ -42,10 +60,75 @@ class FenwickTree(object):
         self._size = size
         self._tree = [0] * self._size
 
+    @classmethod
+    def from_values(cls, values):
+        """Construct a tree holding the specified initial values in O(n)
+        time.
+        """
+
+        values = list(values)
+        tree = cls(len(values))
+        tree._add_deltas(values)
+        return tree
+
     @property
     def size(self):
         return self._size
 
+    def append(self, value):
+        """Append a new element with the specified value.
+
+        The new position n + 1 (one-indexed) covers the elements
+        (n + 1 - lowbit(n + 1), n + 1], so it holds the value plus the sum of
+        the existing elements in that range, which are read from the tree.
+        """
+
+        position = self._size + 1   # position w.r.t a one-indexed array.
+        value += self._prefix_sum(position - 1) - \
+            self._prefix_sum(position - (position & -position))
+        self._tree.append(value)
+        self._size += 1
+
+    def range_sum(self, start, end):
+        """Return the sum of the values within the specified range.
+
+        :param start: range start index
+        :param end: range end index (inclusive)
+        """
+
+        if not 0 <= start <= end:
+            raise IndexError('Invalid start index: {0}'.format(start))
+
+        if not start <= end < self._size:
+            raise IndexError('Invalid end index: {0}'.format(end))
+
+        value = self.read(end)
+        if start:
+            value -= self.read(start - 1)
+        return value
+
+    def lower_bound(self, prefix):
+        """Return the smallest index at which the running sum of the values is
+        not less than ``prefix``, or the size of the tree if there is none.
+
+        The values must not be negative. The index is found in O(log n) by
+        descending the implicit tree from the largest power of 2, e.g. to
+        sample an index with probability proportional to its value, call
+        ``lower_bound(r)`` with r drawn uniformly from (0, total].
+        """
+
+        tree = self._tree
+        position = 0
+        step = 1 << (self._size.bit_length() - 1)
+        while step:
+            next_position = position + step
+            if next_position <= self._size and \
+                    tree[next_position - 1] < prefix:
+                position = next_position
+                prefix -= tree[next_position - 1]
+            step >>= 1
+        return position
+
     def read(self, index):
         """Read the value at the specified index.
 
@@ -77,3 +160,169 @@ class FenwickTree(object):
         while index <= self._size:
             self._tree[index - 1] += value
             index += (index & -index)
+
+    def read_many(self, indices, typecode=None):
+        """Read the values at many indices.
+
+        The batch is validated once and the values are read in a loop without
+        any per index method call.
+
+        :param indices: sequence of indices
+        :param typecode: (optional) typecode of the returned array. By default
+            it is 'd' if any of the values read is a float, else 'l'.
+        :returns: array of the values, one per index
+        """
+
+        self._check_indices(indices)
+
+        tree = self._tree
+        values = []
+        for index in indices:
+            value = 0
+            index += 1  # position w.r.t a one-indexed array.
+            while index > 0:
+                value += tree[index - 1]
+                index &= index - 1
+            values.append(value)
+
+        if typecode is None:
+            is_float = any(isinstance(value, float) for value in values)
+            typecode = 'd' if is_float else 'l'
+        return array(typecode, values)
+
+    def update_many(self, indices, values):
+        """Update the values at many indices.
+
+        The batch is validated once. If the batch is large compared to the
+        tree, the values are first accumulated per index and then pushed to
+        the tree in a single O(n) pass instead of O(log n) per value.
+
+        :param indices: sequence of indices
+        :param values: sequence of values to be added at the indices
+        """
+
+        if len(indices) != len(values):
+            raise ValueError('Expected as many values as indices')
+        self._check_indices(indices)
+
+        size = self._size
+        tree = self._tree
+        if len(indices) * size.bit_length() < size:
+            for index, value in izip(indices, values):
+                index += 1  # position w.r.t a one-indexed array.
+                while index <= size:
+                    tree[index - 1] += value
+                    index += (index & -index)
+        else:
+            deltas = [0] * size
+            for index, value in izip(indices, values):
+                deltas[index] += value
+            self._add_deltas(deltas)
+
+    def _add_deltas(self, deltas):
+        """Add a value to every index in O(n).
+
+        Every position passes its accumulated value on to its parent, i.e. the
+        next position it is added to in ``update()``. The positions are
+        visited in increasing order so that a position has received the values
+        of all its children before it is added to the tree.
+
+        :param deltas: list of values to be added, one per index. It is
+            modified in place.
+        """
+
+        size = self._size
+        tree = self._tree
+        for position in xrange(1, size + 1):
+            delta = deltas[position - 1]
+            tree[position - 1] += delta
+            parent = position + (position & -position)
+            if parent <= size:
+                deltas[parent - 1] += delta
+
+    def _prefix_sum(self, position):
+        """Return the sum of the first ``position`` elements."""
+
+        value = 0
+        while position > 0:
+            value += self._tree[position - 1]
+            position &= position - 1
+        return value
+
+    def _check_indices(self, indices):
+        """Validate a batch of indices at once."""
+
+        if indices:
+            if min(indices) < 0:
+                raise IndexError('Invalid index: {0}'.format(min(indices)))
+            if max(indices) > self._size - 1:
+                raise IndexError('Invalid index: {0}'.format(max(indices)))
+
+
+class RangeFenwickTree(object):
+    """Construct a Fenwick tree which supports adding a value to every element
+    in a range and reading the sum of a range.
+
+    The tree is a pair of Fenwick trees. Adding ``v`` to the range [l, r] adds
+    ``v`` at l and ``-v`` at r + 1 in the first tree, i.e. the first tree
+    holds the differences of the elements. As the prefix sums of the
+    differences are counted once per index, the second tree holds the
+    correction ``v * l`` at l and ``-v * (r + 1)`` at r + 1. The sum of the
+    first i + 1 elements is then ``(i + 1) * first.read(i) - second.read(i)``.
+
+    Example usage::
+        ft = RangeFenwickTree(10)
+
+        # Add a value to every element in a range
+        ft.range_add(start, end, value)
+
+        # Read the sum of a range
+        ft.range_sum(start, end)
+    """
+
+    def __init__(self, size):
+        """
+        :param size: no. of elements to be contained in the tree
+        """
+
+        self._differences = FenwickTree(size)
+        self._corrections = FenwickTree(size)
+
+    @property
+    def size(self):
+        return self._differences.size
+
+    def read(self, index):
+        """Read the sum of the elements upto the specified index."""
+
+        return (index + 1) * self._differences.read(index) - \
+            self._corrections.read(index)
+
+    def range_add(self, start, end, value):
+        """Add ``value`` to every element within the specified range."""
+
+        if not 0 <= start <= end:
+            raise IndexError('Invalid start index: {0}'.format(start))
+
+        if not start <= end < self.size:
+            raise IndexError('Invalid end index: {0}'.format(end))
+
+        self._differences.update(start, value)
+        self._corrections.update(start, value * start)
+        if end + 1 < self.size:
+            self._differences.update(end + 1, -value)
+            self._corrections.update(end + 1, -value * (end + 1))
+
+    def range_sum(self, start, end):
+        """Return the sum of the elements within the specified range."""
+
+        if not 0 <= start <= end:
+            raise IndexError('Invalid start index: {0}'.format(start))
+
+        if not start <= end < self.size:
+            raise IndexError('Invalid end index: {0}'.format(end))
+
+        value = self.read(end)
+        if start:
+            value -= self.read(start - 1)
+        return value
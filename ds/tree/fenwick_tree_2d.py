@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.fenwick_tree_2d
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements the 2-dimensional Fenwick tree, which supports
+    adding a value at a cell of a grid and reading the sum of a rectangle in
+    O(log n * log m) time.
+
+    ``FenwickTree2D`` stores the whole grid in a flat list, row after row.
+    ``SparseFenwickTree2D`` is built for a known set of cells, e.g. the
+    (time, shard) pairs which will ever be updated, and allocates O(k log k)
+    space for k cells irrespective of the size of the grid. The row coordinates
+    are compressed and every node of the Fenwick tree over the rows holds a
+    Fenwick tree over only the columns of the cells below it.
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class FenwickTree2D(object):
+    """Construct a 2-dimensional Fenwick tree.
+
+    Example usage::
+        ft = FenwickTree2D(rows, columns)
+
+        # Add a value at a cell
+        ft.update(row, column, value)
+
+        # Sum of the rectangle from (0, 0) to a cell
+        ft.read(row, column)
+
+        # Sum of the rectangle with corners (top, left) and (bottom, right)
+        ft.range_sum(top, left, bottom, right)
+    """
+
+    def __init__(self, rows, columns):
+        """
+        :param rows: no. of rows in the grid
+        :param columns: no. of columns in the grid
+        """
+
+        if rows < 1 or columns < 1:
+            raise ValueError('Size must be greater than 0')
+
+        self._rows = rows
+        self._columns = columns
+        self._tree = [0] * (rows * columns)
+
+    @property
+    def shape(self):
+        return self._rows, self._columns
+
+    def read(self, row, column):
+        """Read the sum of the rectangle from (0, 0) to (row, column)."""
+
+        self._check_cell(row, column)
+
+        tree = self._tree
+        columns = self._columns
+        value = 0
+        row += 1    # position w.r.t a one-indexed array.
+        while row > 0:
+            offset = (row - 1) * columns - 1
+            position = column + 1
+            while position > 0:
+                value += tree[offset + position]
+                position &= position - 1
+            row &= row - 1
+        return value
+
+    def update(self, row, column, value):
+        """Add ``value`` at the cell (row, column)."""
+
+        self._check_cell(row, column)
+
+        tree = self._tree
+        columns = self._columns
+        row += 1    # position w.r.t a one-indexed array.
+        while row <= self._rows:
+            offset = (row - 1) * columns - 1
+            position = column + 1
+            while position <= columns:
+                tree[offset + position] += value
+                position += (position & -position)
+            row += (row & -row)
+
+    def range_sum(self, top, left, bottom, right):
+        """Return the sum of the rectangle with the corners (top, left) and
+        (bottom, right), both inclusive.
+        """
+
+        if not (0 <= top <= bottom and 0 <= left <= right):
+            raise IndexError('Invalid rectangle: ({0}, {1}), ({2}, {3})'
+                             .format(top, left, bottom, right))
+        self._check_cell(bottom, right)
+
+        value = self.read(bottom, right)
+        if top:
+            value -= self.read(top - 1, right)
+        if left:
+            value -= self.read(bottom, left - 1)
+        if top and left:
+            value += self.read(top - 1, left - 1)
+        return value
+
+    def _check_cell(self, row, column):
+        if not 0 <= row < self._rows:
+            raise IndexError('Invalid row: {0}'.format(row))
+        if not 0 <= column < self._columns:
+            raise IndexError('Invalid column: {0}'.format(column))
+
+
+class SparseFenwickTree2D(object):
+    """Construct a 2-dimensional Fenwick tree for a known set of cells.
+
+    The coordinates can be any comparable values, e.g. timestamps. Only the
+    cells supplied during the construction can be updated, but any rectangle
+    can be queried.
+
+    Example usage::
+        ft = SparseFenwickTree2D([(1000000, 7), (5, 3), (2 ** 40, 7)])
+
+        ft.update(5, 3, 10)
+        ft.range_sum(top, left, bottom, right)
+    """
+
+    def __init__(self, cells):
+        """
+        :param cells: iterable of the (row, column) cells which can be updated
+        """
+
+        cells = set(cells)
+        if not cells:
+            raise ValueError('Expected a non-empty list of cells')
+
+        self._rows = sorted(set(row for row, _ in cells))
+        size = len(self._rows)
+
+        # Columns below every node of the Fenwick tree over the rows.
+        node_columns = [[] for _ in xrange(size)]
+        for row, column in cells:
+            position = bisect_left(self._rows, row) + 1
+            while position <= size:
+                node_columns[position - 1].append(column)
+                position += (position & -position)
+
+        # The sorted columns of all the nodes and their Fenwick trees are
+        # stored one after the other in flat lists.
+        self._offsets = array('l', [0])
+        self._columns = []
+        for columns in node_columns:
+            self._columns.extend(sorted(set(columns)))
+            self._offsets.append(len(self._columns))
+        self._tree = [0] * len(self._columns)
+
+    def update(self, row, column, value):
+        """Add ``value`` at the cell (row, column).
+
+        The cell must be one of the cells supplied during the construction.
+        """
+
+        rank = bisect_left(self._rows, row)
+        if rank == len(self._rows) or self._rows[rank] != row:
+            raise KeyError('Row: {0} not found in tree'.format(row))
+
+        columns = self._columns
+        tree = self._tree
+        position = rank + 1
+        while position <= len(self._rows):
+            start = self._offsets[position - 1]
+            end = self._offsets[position]
+            index = bisect_left(columns, column, start, end)
+            if index == end or columns[index] != column:
+                raise KeyError('Cell: ({0}, {1}) not found in tree'
+                               .format(row, column))
+
+            size = end - start
+            index -= start - 1  # position w.r.t a one-indexed array.
+            while index <= size:
+                tree[start + index - 1] += value
+                index += (index & -index)
+            position += (position & -position)
+
+    def read(self, row, column):
+        """Read the sum of all the cells which are at or before (row, column)
+        in both the dimensions.
+        """
+        return self._prefix(bisect_right(self._rows, row), column, True)
+
+    def range_sum(self, top, left, bottom, right):
+        """Return the sum of the cells in the rectangle with the corners
+        (top, left) and (bottom, right), both inclusive.
+        """
+
+        if not (top <= bottom and left <= right):
+            raise IndexError('Invalid rectangle: ({0}, {1}), ({2}, {3})'
+                             .format(top, left, bottom, right))
+
+        upto_bottom = bisect_right(self._rows, bottom)
+        before_top = bisect_left(self._rows, top)
+        return self._prefix(upto_bottom, right, True) - \
+            self._prefix(before_top, right, True) - \
+            self._prefix(upto_bottom, left, False) + \
+            self._prefix(before_top, left, False)
+
+    def _prefix(self, rows, column, inclusive):
+        """Return the sum of the cells in the first ``rows`` rows, with a
+        column before (or at, if ``inclusive``) ``column``.
+        """
+
+        bisect = bisect_right if inclusive else bisect_left
+        columns = self._columns
+        tree = self._tree
+        value = 0
+        position = rows
+        while position > 0:
+            start = self._offsets[position - 1]
+            index = bisect(columns, column, start,
+                           self._offsets[position]) - start
+            while index > 0:
+                value += tree[start + index - 1]
+                index &= index - 1
+            position &= position - 1
+        return value
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.fm_index
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements the FM-index, a compressed full-text index based on
+    the Burrows-Wheeler transform (BWT) of a text.
+
+    The BWT is derived from the suffix array of the text. Patterns are counted
+    by backward search, which needs the no. of occurrences of a character in a
+    prefix of the BWT (rank). Instead of a full occurrence table, the counts are
+    stored only at every ``occ_sample_rate`` positions and the rest is counted
+    in the BWT itself. To locate the occurrences, the suffix array values are
+    kept only for the text positions that are a multiple of
+    ``sa_sample_rate``. The other values are recovered by walking backwards in
+    the text (LF-mapping) until a sampled position is reached.
+
+    The index replaces both the text and its suffix array. It takes one byte
+    per character for the BWT plus the samples, i.e. roughly
+    ``n * (1 + 4 * sigma / occ_sample_rate + 4 / sa_sample_rate + 1 / 8)``
+    bytes for a text of length n over an alphabet of sigma characters.
+
+    References:
+    - http://en.wikipedia.org/wiki/FM-index
+    - Ferragina and Manzini, Opportunistic Data Structures with Applications
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from array import array
+
+from suffix_array import SuffixArray
+
+
+# No. of set bits in every byte value.
+_POPCOUNT = [bin(byte).count('1') for byte in xrange(256)]
+
+# No. of bytes of the bitmap of sampled rows between two rank checkpoints.
+_BITMAP_BLOCK = 8
+
+
+class FMIndex(object):
+    """Construct an FM-index of a text.
+
+    Example usage::
+        fm = FMIndex('abracadabra')
+
+        fm.count('abra')                # 2
+        sorted(fm.locate('abra'))       # [0, 7]
+
+    :param text: text to be indexed
+    :param sentinel: a character which is smaller than every character in
+        ``text`` and does not occur in it
+    :param occ_sample_rate: distance between the stored occurrence counts
+    :param sa_sample_rate: distance between the text positions for which the
+        suffix array values are stored
+    """
+
+    def __init__(self, text, sentinel='\0', occ_sample_rate=128,
+                 sa_sample_rate=32):
+
+        if sentinel in text:
+            raise ValueError('Sentinel must not occur in the text')
+        if text and not sentinel < min(text):
+            raise ValueError('Sentinel must be smaller than every character '
+                             'in the text')
+        if occ_sample_rate < 1 or sa_sample_rate < 1:
+            raise ValueError('Sample rates must be greater than 0')
+
+        self._sentinel = sentinel
+        self._occ_sample_rate = occ_sample_rate
+        self._sa_sample_rate = sa_sample_rate
+
+        suffixes = SuffixArray(text + sentinel).suffixes
+        self._size = len(suffixes)
+
+        self.bwt = ''.join(text[start - 1] if start else sentinel
+                           for start in suffixes)
+        self._build_counts()
+        self._build_samples(suffixes)
+
+    def __len__(self):
+        """Returns the length of the indexed text."""
+        return self._size - 1
+
+    def count(self, pattern):
+        """Returns the no. of occurrences of ``pattern`` in the text."""
+        start, end = self._backward_search(pattern)
+        return end - start
+
+    def locate(self, pattern):
+        """Yields the starting positions of all occurrences of ``pattern`` in
+        the text.
+
+        The positions are generated lazily and in no particular order. Every
+        position takes at most ``sa_sample_rate`` LF-mapping steps.
+        """
+        start, end = self._backward_search(pattern)
+        for row in xrange(start, end):
+            yield self._suffix_start(row)
+
+    def _backward_search(self, pattern):
+        """Returns the range ``[start, end)`` of the rows of the sorted
+        suffixes which start with ``pattern``.
+        """
+        start, end = 0, self._size
+        for char in reversed(pattern):
+            smaller = self._smaller.get(char)
+            if smaller is None or char == self._sentinel:
+                return 0, 0
+            start = smaller + self._rank(char, start)
+            end = smaller + self._rank(char, end)
+            if start >= end:
+                return 0, 0
+        return start, end
+
+    def _rank(self, char, row):
+        """Returns the no. of occurrences of ``char`` in ``bwt[:row]``."""
+        checkpoint = row // self._occ_sample_rate
+        offset = checkpoint * self._occ_sample_rate
+        return self._occurrences[char][checkpoint] + \
+            self.bwt.count(char, offset, row)
+
+    def _suffix_start(self, row):
+        """Returns the text position of the suffix at ``row`` by walking back
+        to the nearest sampled position.
+        """
+        steps = 0
+        while not self._is_sampled(row):
+            char = self.bwt[row]
+            row = self._smaller[char] + self._rank(char, row)
+            steps += 1
+        return self._samples[self._sampled_rank(row)] + steps
+
+    def _is_sampled(self, row):
+        return self._sampled[row >> 3] & (1 << (row & 7))
+
+    def _sampled_rank(self, row):
+        """Returns the no. of sampled rows before ``row``."""
+        byte = row >> 3
+        block = byte // _BITMAP_BLOCK
+        sampled = self._sampled
+        rank = self._sampled_checkpoints[block]
+        for index in xrange(block * _BITMAP_BLOCK, byte):
+            rank += _POPCOUNT[sampled[index]]
+        return rank + _POPCOUNT[sampled[byte] & ((1 << (row & 7)) - 1)]
+
+    def _build_counts(self):
+        """Build the table of smaller characters and the sampled occurrence
+        counts of every character in the BWT.
+        """
+        bwt = self.bwt
+        rate = self._occ_sample_rate
+        alphabet = sorted(set(bwt))
+
+        self._smaller = {}
+        total = 0
+        for char in alphabet:
+            self._smaller[char] = total
+            total += bwt.count(char)
+
+        self._occurrences = {}
+        for char in alphabet:
+            counts = array('i', [0])
+            count = 0
+            for offset in xrange(0, self._size, rate):
+                count += bwt.count(char, offset, offset + rate)
+                counts.append(count)
+            self._occurrences[char] = counts
+
+    def _build_samples(self, suffixes):
+        """Store the suffix array values which are a multiple of the sample
+        rate, with a bitmap marking their rows.
+        """
+        rate = self._sa_sample_rate
+        self._sampled = bytearray((self._size >> 3) + 1)
+        self._samples = array('i')
+        for row in xrange(self._size):
+            start = suffixes[row]
+            if start % rate == 0:
+                self._sampled[row >> 3] |= 1 << (row & 7)
+                self._samples.append(start)
+
+        self._sampled_checkpoints = array('i')
+        rank = 0
+        for index, byte in enumerate(self._sampled):
+            if index % _BITMAP_BLOCK == 0:
+                self._sampled_checkpoints.append(rank)
+            rank += _POPCOUNT[byte]
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.interval_tree
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements the Interval Tree data structure, which finds all
+    the intervals overlapping a point or an interval.
+
+    The tree is an AVL tree of the intervals ordered by (start, end), in which
+    every node is augmented with the largest end of the intervals in its
+    subtree. An interval is stored once with its no. of occurrences, as in
+    ``zahlen.ds.tree.binary_search_tree_with_dup``. The augmented value is maintained in ``Node.update`` the same way
+    as the weight of an order statistics tree node.
+
+    A query walks the tree in order and skips a subtree if its largest end is
+    before the query start, and stops at the first interval which starts
+    after the query end. It yields the k overlapping intervals lazily in
+    sorted order, visiting O(log n) nodes to find the first one and
+    O(min(n, k log n)) nodes in all.
+
+    References:
+    - Cormen, Leiserson, Rivest, Stein: Introduction to Algorithms, Chapter 14
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import avl_tree
+import binary_search_tree_with_dup
+
+
+class Node(binary_search_tree_with_dup.Node, avl_tree.Node):
+    """A node in an interval tree.
+
+    The key of the node is an interval (start, end). The node maintains an
+    additional attribute ``max_end``, which is the largest end of the
+    intervals in the subtree with the node as the root.
+    """
+
+    def __init__(self, key):
+        super(Node, self).__init__(key)
+        self.max_end = key[1]
+
+    def update(self):
+        """Recalculates and updates the largest end of a node."""
+        super(Node, self).update()
+        max_end = self.key[1]
+        if self.left and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+
+
+class IntervalTree(binary_search_tree_with_dup.BinarySearchTreeDupKeys,
+                   avl_tree.AVLTree):
+    """Represents an interval tree which is also an AVL tree.
+
+    The intervals are closed i.e. the intervals (1, 3) and (3, 5) overlap. An
+    interval may be inserted more than once, and is then yielded by the
+    queries once per occurrence.
+
+    Example usage::
+        it = IntervalTree(Node)
+
+        it.insert((1, 5))
+        it.insert((4, 9))
+
+        # Intervals overlapping a point or an interval
+        list(it.stab(4))
+        list(it.overlap(6, 10))
+
+        # Build a balanced tree from intervals sorted by (start, end)
+        it = IntervalTree.from_sorted(intervals, Node)
+    """
+
+    def insert_many(self, key, n):
+        """Inserts ``n`` occurrences of the interval ``key``, a pair
+        (start, end), in the tree.
+        """
+        if not key[0] <= key[1]:
+            raise ValueError('Invalid interval: {0}'.format(key))
+        super(IntervalTree, self).insert_many(key, n)
+
+    def overlap(self, start, end):
+        """Yields the intervals overlapping the interval [start, end] in
+        sorted order.
+        """
+        if not start <= end:
+            raise ValueError('Invalid interval: {0}'.format((start, end)))
+
+        stack = []
+        node = self.root
+        while True:
+            # A subtree whose intervals end before ``start`` is skipped.
+            if node and node.max_end >= start:
+                stack.append(node)
+                node = node.left
+                continue
+
+            if not stack:
+                return
+            node = stack.pop()
+
+            # The rest of the intervals start after ``end``.
+            if node.key[0] > end:
+                return
+            if node.key[1] >= start:
+                for _ in xrange(node._count):
+                    yield node.key
+            node = node.right
+
+    def stab(self, point):
+        """Yields the intervals containing ``point`` in sorted order."""
+        return self.overlap(point, point)
+
+
+if __name__ == '__main__':
+    # Benchmark the point and the range queries against a linear scan. The no.
+    # of intervals can be passed as an argument.
+    import random
+    import sys
+    import time
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    span = 100 * size
+    intervals = set()
+    while len(intervals) < size:
+        start = random.randrange(span)
+        intervals.add((start, start + random.randrange(1000)))
+    intervals = sorted(intervals)
+
+    start = time.time()
+    it = IntervalTree.from_sorted(intervals, Node)
+    print 'IntervalTree bulk build {0:.2f}s'.format(time.time() - start)
+
+    def linear_scan(start, end):
+        return [interval for interval in intervals
+                if interval[0] <= end and interval[1] >= start]
+
+    queries = []
+    for _ in xrange(100):
+        start = random.randrange(span)
+        queries.append((start, start + random.randrange(10000)))
+
+    for name, query in [('IntervalTree', lambda s, e: list(it.overlap(s, e))),
+                        ('Linear scan', linear_scan)]:
+        start = time.time()
+        found = 0
+        for left, right in queries:
+            found += len(query(left, right))
+        print '{0:<14} {1:.0f} queries/s ({2} intervals found)'.format(
+            name, len(queries) / (time.time() - start), found)
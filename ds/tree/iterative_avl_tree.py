@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.iterative_avl_tree
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements a non-recursive AVL tree.
+
+    Unlike ``zahlen.ds.tree.avl_tree.AVLTree``, which recomputes the heights
+    of all the ancestors of a modified node and re-checks the balance of every
+    ancestor, a node stores only its balance factor (height of the right
+    subtree minus height of the left subtree). An insert or a delete retraces
+    the path to the root only while the height of the subtree changes, and
+    stops at the first ancestor whose height is unchanged. An insert does at
+    most one (single or double) rotation.
+
+    The nodes use ``__slots__`` and plain attributes for the children, which
+    saves the memory of an attribute dict and the cost of a property call per
+    child access.
+
+    The tree has the same shape as an ``AVLTree`` built with the same
+    operations.
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+
+class Node(object):
+    """A node in an iterative AVL tree.
+
+    :param key: value stored in the node
+    :param parent: (optional) parent node
+    """
+
+    __slots__ = ('key', 'left', 'right', 'parent', 'balance')
+
+    def __init__(self, key, parent=None):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.parent = parent
+        self.balance = 0
+
+    def __str__(self):
+        parent_key = self.parent.key if self.parent else -1
+        return 'key:{0},parent:{1}'.format(self.key, parent_key)
+
+    def is_leaf(self):
+        """Returns true if node is a leaf node."""
+        return self.left is None and self.right is None
+
+
+class IterativeAVLTree(object):
+    """Represents an AVL tree with iterative insert and delete."""
+
+    def __init__(self):
+        self.root = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @classmethod
+    def from_sorted(cls, keys):
+        """Builds a balanced tree from keys in increasing order in O(n) time.
+
+        :param keys: iterable of keys in strictly increasing order
+        """
+        keys = list(keys)
+        for index in xrange(1, len(keys)):
+            if not keys[index - 1] < keys[index]:
+                raise ValueError('Expected keys in increasing order without '
+                                 'duplicates')
+
+        tree = cls()
+        tree.root = tree._build_balanced(keys, 0, len(keys) - 1, None)[0]
+        tree._size = len(keys)
+        return tree
+
+    def insert(self, key):
+        """Inserts key ``key`` in the tree."""
+
+        self._size += 1
+        node = self.root
+        if not node:
+            self.root = Node(key)
+            return
+
+        while True:
+            if key < node.key:
+                if not node.left:
+                    child = node.left = Node(key, node)
+                    break
+                node = node.left
+            else:
+                if not node.right:
+                    child = node.right = Node(key, node)
+                    break
+                node = node.right
+
+        # The height of the subtree of ``child`` has increased by 1.
+        parent = node
+        while parent:
+            if child is parent.left:
+                parent.balance -= 1
+            else:
+                parent.balance += 1
+
+            if not parent.balance:
+                break
+            elif parent.balance in (-2, 2):
+                # A rotation restores the height before the insert.
+                self._rebalance(parent)
+                break
+            child = parent
+            parent = parent.parent
+
+    def delete(self, key):
+        """Deletes key ``key`` from the tree."""
+
+        node = self._search_node(key, silent=False)
+
+        # For a complete internal node, replace node's key by inorder
+        # successor's key and remove the successor.
+        if node.left and node.right:
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.key = successor.key
+            node = successor
+
+        self._size -= 1
+        child = node.left or node.right
+        parent = node.parent
+        if child:
+            child.parent = parent
+        if not parent:
+            self.root = child
+            return
+
+        is_left = node is parent.left
+        if is_left:
+            parent.left = child
+        else:
+            parent.right = child
+
+        # The height of the left (or right) subtree of ``parent`` has
+        # decreased by 1.
+        while parent:
+            parent.balance += 1 if is_left else -1
+
+            if parent.balance in (-1, 1):
+                break
+            elif parent.balance in (-2, 2):
+                parent = self._rebalance(parent)
+                if parent.balance:
+                    break
+
+            child = parent
+            parent = parent.parent
+            if parent:
+                is_left = child is parent.left
+
+    def search(self, key):
+        """Returns True if key `key` exists in the tree, else False."""
+        return self._search_node(key) is not None
+
+    def sorted_keys(self):
+        """Returns a sorted list of the keys in the tree."""
+        keys = []
+        stack = []
+        node = self.root
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                keys.append(node.key)
+                node = node.right
+        return keys
+
+    def is_balanced(self):
+        """Returns true if the balance factor of every node is correct and
+        lies in [-1, 1].
+        """
+        return self._height(self.root) is not None
+
+    def _height(self, node):
+        """Returns the height of a subtree, or None if the subtree is not
+        balanced.
+        """
+        if not node:
+            return -1
+
+        left_height = self._height(node.left)
+        right_height = self._height(node.right)
+        if left_height is None or right_height is None or \
+                right_height - left_height != node.balance or \
+                node.balance not in (-1, 0, 1):
+            return None
+        return 1 + max(left_height, right_height)
+
+    def _build_balanced(self, keys, start, end, parent):
+        """Builds a balanced subtree of ``keys[start:end + 1]`` and returns
+        its root and height.
+        """
+        if start > end:
+            return None, -1
+
+        mid = (start + end) // 2
+        node = Node(keys[mid], parent)
+        node.left, left_height = self._build_balanced(keys, start, mid - 1,
+                                                      node)
+        node.right, right_height = self._build_balanced(keys, mid + 1, end,
+                                                        node)
+        node.balance = right_height - left_height
+        return node, 1 + max(left_height, right_height)
+
+    def _search_node(self, key, silent=True):
+        """Return the node with key ``key`` if it exists, else return None.
+
+        :param silent: If False, raises an exception if ``key`` does not exist
+            in the tree.
+        """
+        node = self.root
+        while node:
+            if node.key == key:
+                break
+            node = node.left if key < node.key else node.right
+
+        if not node and not silent:
+            raise KeyError('Key: {0} not found in tree'.format(key))
+
+        return node
+
+    def _rebalance(self, node):
+        """Rotates a node with a balance factor of -2 or 2 and returns the new
+        root of its subtree.
+
+        The root of the subtree has a balance factor of 0 iff the rotation
+        decreased the height of the subtree.
+        """
+        if node.balance > 0:
+            child = node.right
+            if child.balance >= 0:
+                self._rotate_left(node)
+                if child.balance:
+                    node.balance = child.balance = 0
+                else:
+                    node.balance, child.balance = 1, -1
+                return child
+
+            # The left and right subtrees of ``grandchild`` move to ``node``
+            # and ``child`` respectively.
+            grandchild = child.left
+            self._rotate_right(child)
+            self._rotate_left(node)
+            node.balance = -1 if grandchild.balance > 0 else 0
+            child.balance = 1 if grandchild.balance < 0 else 0
+        else:
+            child = node.left
+            if child.balance <= 0:
+                self._rotate_right(node)
+                if child.balance:
+                    node.balance = child.balance = 0
+                else:
+                    node.balance, child.balance = -1, 1
+                return child
+
+            grandchild = child.right
+            self._rotate_left(child)
+            self._rotate_right(node)
+            node.balance = 1 if grandchild.balance < 0 else 0
+            child.balance = -1 if grandchild.balance > 0 else 0
+
+        grandchild.balance = 0
+        return grandchild
+
+    def _rotate_left(self, node):
+        """Rotates ``node`` to make it the left child of its right child."""
+        child = node.right
+        parent = node.parent
+
+        node.right = child.left
+        if child.left:
+            child.left.parent = node
+
+        child.left = node
+        node.parent = child
+        self._replace_child(parent, node, child)
+
+    def _rotate_right(self, node):
+        """Rotates ``node`` to make it the right child of its left child."""
+        child = node.left
+        parent = node.parent
+
+        node.left = child.right
+        if child.right:
+            child.right.parent = node
+
+        child.right = node
+        node.parent = child
+        self._replace_child(parent, node, child)
+
+    def _replace_child(self, parent, node, child):
+        """Replaces ``node`` by ``child`` as a child of ``parent``."""
+        child.parent = parent
+        if not parent:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+
+
+if __name__ == '__main__':
+    # Benchmark random inserts and deletes against the AVLTree. The no. of
+    # keys can be passed as an argument.
+    import random
+    import sys
+    import time
+
+    import avl_tree
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    keys = random.sample(xrange(10 * size), size)
+
+    for name, tree in [('AVLTree', avl_tree.AVLTree(avl_tree.Node)),
+                       ('IterativeAVLTree', IterativeAVLTree())]:
+        start = time.time()
+        for key in keys:
+            tree.insert(key)
+        insert = time.time() - start
+
+        start = time.time()
+        for key in keys:
+            tree.delete(key)
+        delete = time.time() - start
+
+        print '{0:<18} {1:.0f} inserts/s, {2:.0f} deletes/s'.format(
+            name, size / insert, size / delete)
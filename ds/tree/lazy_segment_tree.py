@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.lazy_segment_tree
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements a generic Segment Tree with lazy propagation.
+
+    The tree aggregates the elements with any associative function which has an
+    identity element (a monoid), e.g. sum, minimum, maximum or gcd. Besides
+    point updates, a range of elements can be assigned a value or incremented
+    by a value in O(log n) time. The update of a range is recorded at the
+    nodes covering the range and pushed down to the children only when a later
+    operation visits them.
+
+    The nodes are stored in flat lists preallocated at construction, with the
+    children of node ``i`` at ``2i`` and ``2i + 1``.
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from fractions import gcd
+
+import operator
+
+
+class Monoid(object):
+    """An associative function with an identity element.
+
+    :param combine: associative function of two aggregates
+    :param identity: value ``e`` such that ``combine(e, x) == x``
+    :param add: (optional) function ``add(aggregate, value, length)`` which
+        returns the aggregate of ``length`` elements after ``value`` is added
+        to each of them. Required for range increments.
+    """
+
+    def __init__(self, combine, identity, add=None):
+        self.combine = combine
+        self.identity = identity
+        self.add = add
+
+    def repeat(self, value, length):
+        """Returns the aggregate of ``length`` copies of ``value``."""
+        result = self.identity
+        while length:
+            if length & 1:
+                result = self.combine(result, value)
+            value = self.combine(value, value)
+            length >>= 1
+        return result
+
+
+SUM = Monoid(operator.add, 0, lambda total, value, length: total + value * length)
+MIN = Monoid(min, float('inf'), lambda least, value, length: least + value)
+MAX = Monoid(max, float('-inf'), lambda most, value, length: most + value)
+GCD = Monoid(gcd, 0)
+
+
+class LazySegmentTree(object):
+    """Construct a segment tree with lazy propagation.
+
+    Example usage::
+        elements = [2, 1, 3, 6, 0, -1, -2]
+
+        # Build the segment tree for range sums.
+        st = LazySegmentTree(elements, SUM)
+
+        # Add 5 to every element in a range and assign 0 to another range.
+        st.range_add(1, 4, 5)
+        st.range_assign(5, 6, 0)
+
+        # Query the sum of a range
+        st.query(start, end)
+
+    :param elements: initial list of elements
+    :param monoid: (optional) the aggregate function, defaults to ``SUM``
+    """
+
+    def __init__(self, elements, monoid=SUM):
+
+        if not elements:
+            raise ValueError('Expected a non-empty list of input elements')
+
+        self._monoid = monoid
+        self._length = len(elements)
+
+        size = 1
+        while size < self._length:
+            size *= 2
+        self._leaves = size
+
+        # Aggregate of every node. The leaves start at index ``size``.
+        self._tree = [monoid.identity] * (2 * size)
+        self._tree[size:size + self._length] = elements
+        for node in xrange(size - 1, 0, -1):
+            self._tree[node] = monoid.combine(self._tree[2 * node],
+                                              self._tree[2 * node + 1])
+
+        # Pending assignment (None if there isn't one) and increment of the
+        # internal nodes, not yet pushed down to the children.
+        self._assigned = [None] * size
+        self._added = [0] * size
+
+    def __len__(self):
+        return self._length
+
+    def query(self, start, end):
+        """Return the aggregate of the elements within the specified range.
+
+        :param start: range start index
+        :param end: range end index (inclusive)
+        """
+        self._check_range(start, end)
+        return self._query(1, 0, self._leaves - 1, start, end)
+
+    def update(self, index, element):
+        """Update an element at the specified index."""
+        self.range_assign(index, index, element)
+
+    def range_assign(self, start, end, value):
+        """Assign ``value`` to every element within the specified range."""
+        self._check_range(start, end)
+        self._update(1, 0, self._leaves - 1, start, end, value, 0)
+
+    def range_add(self, start, end, value):
+        """Add ``value`` to every element within the specified range."""
+        if self._monoid.add is None:
+            raise ValueError('Range increments are not supported by the '
+                             'aggregate function')
+        self._check_range(start, end)
+        self._update(1, 0, self._leaves - 1, start, end, None, value)
+
+    def _check_range(self, start, end):
+        if not 0 <= start <= end:
+            raise IndexError('Invalid start index: {0}'.format(start))
+
+        if not start <= end < self._length:
+            raise IndexError('Invalid end index: {0}'.format(end))
+
+    def _apply(self, node, length, assigned, added):
+        """Apply an assignment and/or an increment to all the ``length``
+        elements in the range of a node.
+        """
+        monoid = self._monoid
+        if assigned is not None:
+            self._tree[node] = monoid.repeat(assigned, length)
+            if node < self._leaves:
+                self._assigned[node] = assigned
+                self._added[node] = 0
+
+        if added:
+            self._tree[node] = monoid.add(self._tree[node], added, length)
+            if node < self._leaves:
+                if self._assigned[node] is not None:
+                    self._assigned[node] += added
+                else:
+                    self._added[node] += added
+
+    def _push(self, node, range_start, mid, range_end):
+        """Push the pending updates of a node down to its children."""
+        assigned, added = self._assigned[node], self._added[node]
+        if assigned is None and not added:
+            return
+
+        # Children which only cover the padding after the last element are
+        # left at the identity.
+        for child, start, end in [(2 * node, range_start, mid),
+                                  (2 * node + 1, mid + 1, range_end)]:
+            length = min(end, self._length - 1) - start + 1
+            if length > 0:
+                self._apply(child, length, assigned, added)
+
+        self._assigned[node] = None
+        self._added[node] = 0
+
+    def _query(self, node, range_start, range_end, start, end):
+        """Return the aggregate of [start, end] within the range
+        [range_start, range_end] of a node.
+        """
+        if start <= range_start and range_end <= end:
+            return self._tree[node]
+
+        mid = (range_start + range_end) // 2
+        self._push(node, range_start, mid, range_end)
+
+        if end <= mid:
+            return self._query(2 * node, range_start, mid, start, end)
+        elif start > mid:
+            return self._query(2 * node + 1, mid + 1, range_end, start, end)
+        else:
+            return self._monoid.combine(
+                self._query(2 * node, range_start, mid, start, end),
+                self._query(2 * node + 1, mid + 1, range_end, start, end))
+
+    def _update(self, node, range_start, range_end, start, end, assigned,
+                added):
+        """Apply an update to [start, end] within the range
+        [range_start, range_end] of a node.
+        """
+        if start <= range_start and range_end <= end:
+            length = min(range_end, self._length - 1) - range_start + 1
+            self._apply(node, length, assigned, added)
+            return
+
+        mid = (range_start + range_end) // 2
+        self._push(node, range_start, mid, range_end)
+
+        if start <= mid:
+            self._update(2 * node, range_start, mid, start, end, assigned,
+                         added)
+        if end > mid:
+            self._update(2 * node + 1, mid + 1, range_end, start, end,
+                         assigned, added)
+
+        self._tree[node] = self._monoid.combine(self._tree[2 * node],
+                                                self._tree[2 * node + 1])
@@ -11,20 +11,23 @@
 """
 
 import avl_tree
+import binary_search_tree_with_dup
 
 
-class Node(avl_tree.Node):
-    """A node in a order statistics tree.
+class Weighted(object):
+    """Maintains the ``weight`` of a node, which is the total number of nodes
+    in the subtree with the node as the root.
 
-    An order statistics tree is a binary tree. This implementation of the Order
-    statistics tree is also a AVL tree. A node in a Order statistics tree
-    maintains an additional attribute ``weight``. The weight of a node is the
-    total number of nodes in the subtree with the node as the root. E.g. A
-    leaf node has weight 1. A node with 2 leaf nodes as children has weight 3.
+    This is mixed into a node class of a binary search tree whose nodes
+    recalculate their attributes in ``update``, e.g. ``Node`` mixes it into
+    the AVL tree node. If the node class counts the occurrences of its key in
+    ``_count``, the weight is the total number of occurrences instead.
     """
 
+    _count = 1
+
     def __init__(self, key):
-        super(Node, self).__init__(key)
+        super(Weighted, self).__init__(key)
         self.weight = 1
 
     @property
@@ -37,16 +40,26 @@ class Node(avl_tree.Node):
 
     def update(self):
         """Recalculates and updates the size of a node."""
-        super(Node, self).update()
-        self.weight = 1 + self.left_weight + self.right_weight
+        super(Weighted, self).update()
+        self.weight = self._count + self.left_weight + self.right_weight
 
 
-class OrderStatisticsTree(avl_tree.AVLTree):
-    """Implements an Order statistics tree which is also an AVL tree.
+class Node(Weighted, avl_tree.Node):
+    """A node in a order statistics tree.
 
-    The underlying tree can also be implemented as a simple binary tree
-    ``BinarySearchTree`` or a binary tree with duplicates
-    ``BinarySearchTreeDupKeys``
+    An order statistics tree is a binary tree. This implementation of the Order
+    statistics tree is also a AVL tree. A node in a Order statistics tree
+    maintains an additional attribute ``weight``. The weight of a node is the
+    total number of nodes in the subtree with the node as the root. E.g. A
+    leaf node has weight 1. A node with 2 leaf nodes as children has weight 3.
+    """
+
+
+class OrderStatistics(object):
+    """Implements the order statistics queries on the weights of the nodes.
+
+    This is mixed into a binary search tree class whose nodes are
+    ``Weighted``.
     """
 
     def kth_smallest_key(self, k, root=None):
@@ -69,35 +82,115 @@ class OrderStatisticsTree(avl_tree.AVLTree):
             if k <= left_subtree_weight:
                 root = root.left        # Smallest element in the left subtree
             else:
-                k -= (left_subtree_weight + 1)  # 1 is for the root element
-                if k == 0:
+                k -= (left_subtree_weight + root._count)   # root element(s)
+                if k <= 0:
                     return root.key     # Smallest element is the root
                 else:
                     root = root.right   # Smallest element in the right subtree
 
+    def kth_largest_key(self, k):
+        """Returns the kth largest element in the tree."""
+        if not self.root:
+            raise Exception('Tree is empty!')
+
+        if not 1 <= k <= self.root.weight:
+            raise IndexError('Rank must be a positive value less than: '
+                             '{0}'.format(self.root.weight + 1))
+
+        return self.kth_smallest_key(self.root.weight - k + 1)
+
     def kth_successor(self, k, key):
-        """Returns the kth-successor of a key."""
+        """Returns the kth-successor of a key.
+
+        The successor is selected by its rank in O(log n) time.
+        """
         if k < 0:
             raise IndexError('Successor index must be greater than 0')
         if not self.root:
             raise Exception('Tree is empty!')
 
-        node = self._search_node(key, silent=False)
+        self._search_node(key, silent=False)
 
-        while True:
-            if k == 0:
-                return node.key
+        position = self.rank(key) + 1 + k
+        if position > self.root.weight:
+            raise IndexError('Invalid successor index: {0}'.format(k))
+        return self.kth_smallest_key(position)
+
+    def rank(self, key):
+        """Returns the no. of keys smaller than ``key``.
+
+        ``key`` need not exist in the tree. If it exists, it is the
+        (rank + 1)th smallest key.
+        """
+        return self._count_smaller(key, False)
+
+    def count_range(self, low, high):
+        """Returns the no. of keys between ``low`` and ``high``, both
+        inclusive.
+        """
+        if high < low:
+            return 0
+        return self._count_smaller(high, True) - \
+            self._count_smaller(low, False)
+
+    def percentile(self, p):
+        """Returns the pth percentile of the keys by the nearest-rank method,
+        i.e. the smallest key such that at least p percent of the keys are
+        less than or equal to it.
+
+        :param p: percentile between 0 and 100
+        """
+        if not 0 <= p <= 100:
+            raise ValueError('Percentile must be between 0 and 100')
+        if not self.root:
+            raise Exception('Tree is empty!')
+
+        k = -(-p * self.root.weight // 100)     # ceil(p * n / 100)
+        return self.kth_smallest_key(max(1, int(k)))
+
+    def _count_smaller(self, key, inclusive):
+        """Returns the no. of keys smaller than (or equal to, if
+        ``inclusive``) ``key``.
+        """
+        count = 0
+        node = self.root
+        while node:
+            if node.key < key or inclusive and node.key == key:
+                count += node.left_weight + node._count
+                node = node.right
             else:
-                if k > node.right_weight:
-                    k -= (node.right_weight + 1)
-
-                    # Go to the ancestor node
-                    while node.parent:
-                        node = node.parent
-                        if node.key > key:
-                            break
-                    if node.key < key:
-                        raise IndexError('Invalid successor index: {0}'
-                                         .format(k))
-                else:
-                    return self.kth_smallest_key(k, node.right)
\ No newline at end of file
+                node = node.left
+        return count
+
+
+class OrderStatisticsTree(OrderStatistics, avl_tree.AVLTree):
+    """Implements an Order statistics tree which is also an AVL tree.
+
+    The underlying tree can also be implemented as a simple binary tree
+    ``BinarySearchTree`` or a binary tree with duplicates
+    ``BinarySearchTreeDupKeys``, or as the other balanced trees e.g.
+    ``zahlen.ds.tree.red_black_tree.OrderStatisticsRedBlackTree``.
+    """
+
+
+class DupKeysNode(Weighted, binary_search_tree_with_dup.Node, avl_tree.Node):
+    """A node in an order statistics tree with duplicate keys, whose weight
+    is the total number of occurrences of the keys in its subtree.
+    """
+
+
+class OrderStatisticsTreeDupKeys(OrderStatistics,
+                                 binary_search_tree_with_dup.
+                                 BinarySearchTreeDupKeys,
+                                 avl_tree.AVLTree):
+    """Implements a multiset as an Order statistics tree which is also an AVL
+    tree.
+
+    A key is stored once with its no. of occurrences, and the order
+    statistics count the occurrences e.g. the 2nd and the 3rd smallest keys
+    of {1, 1, 2} are 1 and 2. The nodes must be ``DupKeysNode``.
+    """
+
+    def __len__(self):
+        """Returns the total no. of occurrences of the keys."""
+        return self.root.weight if self.root else 0
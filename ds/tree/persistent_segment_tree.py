@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.persistent_segment_tree
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements a persistent (versioned) Segment Tree for range
+    minimum queries.
+
+    Every update creates a new version of the tree and leaves the older
+    versions unchanged. Only the nodes on the path from the root to the updated
+    leaf are copied (path copying) and the copies share all the other nodes
+    with the older version, so a version costs O(log n) new nodes.
+
+    A node is an integer id and the children and the minimum of all the nodes
+    are stored in flat pools. Every node counts the parents and the versions
+    which refer to it. When a version is dropped, the nodes which are no longer
+    referred to are put on a free list and reused by the later updates.
+
+    References:
+    - http://en.wikipedia.org/wiki/Persistent_data_structure#Path_copying
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from array import array
+
+
+class PersistentSegmentTree(object):
+    """Construct a persistent segment tree.
+
+    The queries return the same indices as
+    ``zahlen.ds.tree.segment_tree.SegmentTree`` i.e. if there is more than one
+    minimum within a range, the highest index is returned.
+
+    Example usage::
+        elements = [2, 1, 3, 6, 0, -1, -2]
+
+        # Build the segment tree, which is version 0
+        st = PersistentSegmentTree(elements)
+
+        # Update an element, which creates and returns a new version
+        version = st.update(index, new_value)
+
+        # Query the minimum index within a range as of a version
+        st.query(start, end, version)
+
+        # Release the nodes used only by a version
+        st.drop(version)
+    """
+
+    def __init__(self, elements):
+
+        if not elements:
+            raise ValueError('Expected a non-empty list of input elements')
+
+        self._size = len(elements)
+
+        # Node pools. A leaf has no children (-1).
+        self._left = array('l')
+        self._right = array('l')
+        self._min_index = array('l')
+        self._min_value = []
+        self._references = array('l')
+        self._free = []
+
+        root = self._build(elements, 0, self._size - 1)
+        self._references[root] += 1
+        self._roots = [root]
+
+    def __len__(self):
+        """Returns the no. of elements."""
+        return self._size
+
+    @property
+    def latest_version(self):
+        return len(self._roots) - 1
+
+    @property
+    def versions(self):
+        """Returns the versions which have not been dropped."""
+        return [version for version, root in enumerate(self._roots)
+                if root is not None]
+
+    @property
+    def node_count(self):
+        """Returns the no. of nodes used by all the versions."""
+        return len(self._left) - len(self._free)
+
+    def update(self, index, element, version=None):
+        """Update an element at the specified index and return the new
+        version.
+
+        :param index: index of the element
+        :param element: the new element
+        :param version: (optional) the version which is updated, defaults to
+            the latest version
+        """
+
+        if not 0 <= index < self._size:
+            raise IndexError('Invalid index: {0}'.format(index))
+
+        left, right = self._left, self._right
+
+        # Walk down to the leaf.
+        path = []
+        node = self._root(version)
+        start, end = 0, self._size - 1
+        while start < end:
+            mid = (start + end) // 2
+            if index <= mid:
+                path.append((node, True))
+                node = left[node]
+                end = mid
+            else:
+                path.append((node, False))
+                node = right[node]
+                start = mid + 1
+
+        # Copy the path bottom up. A copy shares the child which is not on the
+        # path with the original node.
+        references = self._references
+        node = self._new_node(-1, -1, index, element)
+        for parent, is_left in reversed(path):
+            references[node] += 1
+            if is_left:
+                sibling = right[parent]
+                node = self._new_parent(node, sibling)
+            else:
+                sibling = left[parent]
+                node = self._new_parent(sibling, node)
+            references[sibling] += 1
+
+        references[node] += 1
+        self._roots.append(node)
+        return len(self._roots) - 1
+
+    def query(self, start, end, version=None):
+        """Return the index of the minimum within the specified range as of a
+        version.
+
+        :param start: range start index
+        :param end: range end index
+        :param version: (optional) defaults to the latest version
+        """
+
+        if not 0 <= start <= end:
+            raise IndexError("Invalid start index:" + str(start))
+
+        if not start <= end < self._size:
+            raise IndexError("Invalid end index: " + str(end))
+
+        left, right = self._left, self._right
+        min_index, min_value = self._min_index, self._min_value
+
+        # The right child is pushed before the left, so that a later (higher)
+        # index wins a tie.
+        result = -1
+        stack = [(self._root(version), 0, self._size - 1)]
+        while stack:
+            node, range_start, range_end = stack.pop()
+            if start <= range_start and range_end <= end:
+                if result < 0 or not min_value[result] < min_value[node]:
+                    result = node
+                continue
+
+            mid = (range_start + range_end) // 2
+            if end > mid:
+                stack.append((right[node], mid + 1, range_end))
+            if start <= mid:
+                stack.append((left[node], range_start, mid))
+        return min_index[result]
+
+    def element(self, index, version=None):
+        """Return the element at the specified index as of a version."""
+
+        if not 0 <= index < self._size:
+            raise IndexError('Invalid index: {0}'.format(index))
+
+        node = self._root(version)
+        start, end = 0, self._size - 1
+        while start < end:
+            mid = (start + end) // 2
+            if index <= mid:
+                node = self._left[node]
+                end = mid
+            else:
+                node = self._right[node]
+                start = mid + 1
+        return self._min_value[node]
+
+    def drop(self, version):
+        """Drop a version and release the nodes which are not used by any
+        other version.
+        """
+
+        root = self._root(version)
+        self._roots[version] = None
+
+        left, right = self._left, self._right
+        references = self._references
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            references[node] -= 1
+            if not references[node]:
+                if left[node] >= 0:
+                    stack.append(left[node])
+                    stack.append(right[node])
+                self._min_value[node] = None
+                self._free.append(node)
+
+    def _root(self, version):
+        if version is None:
+            version = len(self._roots) - 1
+        if not 0 <= version < len(self._roots) or \
+                self._roots[version] is None:
+            raise KeyError('Version: {0} not found in tree'.format(version))
+        return self._roots[version]
+
+    def _build(self, elements, start, end):
+        """Build the nodes of the range [start, end] and return the id of its
+        root.
+        """
+        if start == end:
+            return self._new_node(-1, -1, start, elements[start])
+
+        mid = (start + end) // 2
+        left = self._build(elements, start, mid)
+        right = self._build(elements, mid + 1, end)
+        self._references[left] += 1
+        self._references[right] += 1
+        return self._new_parent(left, right)
+
+    def _new_parent(self, left, right):
+        """Allocate a node with the specified children."""
+        if self._min_value[left] < self._min_value[right]:
+            child = left
+        else:
+            child = right
+        return self._new_node(left, right, self._min_index[child],
+                              self._min_value[child])
+
+    def _new_node(self, left, right, min_index, min_value):
+        """Allocate a node, from the free list if possible, and return its
+        id.
+        """
+        if self._free:
+            node = self._free.pop()
+            self._left[node] = left
+            self._right[node] = right
+            self._min_index[node] = min_index
+            self._min_value[node] = min_value
+            self._references[node] = 0
+            return node
+
+        self._left.append(left)
+        self._right.append(right)
+        self._min_index.append(min_index)
+        self._min_value.append(min_value)
+        self._references.append(0)
+        return len(self._min_value) - 1
+
+
+if __name__ == '__main__':
+    # Benchmark the memory used by the versions. The no. of versions can be
+    # passed as an argument.
+    import random
+    import sys
+    import time
+
+    size = 1000
+    versions = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    elements = [random.randint(0, size) for _ in xrange(size)]
+
+    st = PersistentSegmentTree(elements)
+    base = st.node_count
+
+    start = time.time()
+    for _ in xrange(versions):
+        st.update(random.randrange(size), random.randint(0, size))
+    elapsed = time.time() - start
+
+    # A node takes an item in four arrays and a reference in the list of the
+    # (shared) min values.
+    node_bytes = 5 * st._left.itemsize
+    print '{0} versions: {1:.0f} updates/s, {2:.1f} nodes/version, ' \
+        '~{3:.0f} bytes/version'.format(
+            versions, versions / elapsed,
+            float(st.node_count - base) / versions,
+            float(st.node_count - base) * node_bytes / versions)
+
+    start = time.time()
+    for _ in xrange(versions // 10):
+        st.query(0, random.randrange(size), random.randint(0, versions))
+    print '{0:.0f} historical queries/s'.format(
+        versions // 10 / (time.time() - start))
+
+    # Keep only the latest version.
+    for version in xrange(versions):
+        st.drop(version)
+    print 'nodes after dropping all but the latest version: {0} ' \
+        '(version 0 had {1})'.format(st.node_count, base)
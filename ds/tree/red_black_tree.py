@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.red_black_tree
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements the Red-Black tree data structure.
+
+    A red-black tree colors every node red or black such that a red node has
+    no red child and every path from a node to a leaf has the same no. of
+    black nodes, which keeps the height below 2 log(n + 1). An insert needs at
+    most 2 rotations and a delete at most 3, while the rest of the rebalancing
+    only recolors the nodes, so it rotates far less than an AVL tree under a
+    write heavy load.
+
+    References:
+    - Cormen, Leiserson, Rivest, Stein: Introduction to Algorithms, Chapter 13
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import binary_search_tree
+from order_statistics_tree import OrderStatistics, Weighted
+
+
+class Node(binary_search_tree.Node):
+    """A node in a red-black tree.
+
+    A new node is red. An absent child (None) is black.
+    """
+
+    def __init__(self, key):
+        super(Node, self).__init__(key)
+        self.red = True
+
+
+class WeightedNode(Weighted, Node):
+    """A node in a red-black tree which maintains the weight of its
+    subtree.
+    """
+
+
+def _is_red(node):
+    return node is not None and node.red
+
+
+class RedBlackTree(binary_search_tree.BinarySearchTree):
+    """Represents a red-black tree which is a binary search tree."""
+
+    @classmethod
+    def from_sorted(cls, keys, node_type):
+        """Builds a balanced tree from keys in increasing order in O(n) time.
+
+        The leaves of the balanced tree are on its last two levels, so the
+        nodes on the last level are colored red if the level is incomplete
+        and all the other nodes black.
+
+        :param keys: iterable of keys in strictly increasing order
+        :param node_type: type of the nodes of the tree
+        """
+        tree = super(RedBlackTree, cls).from_sorted(keys, node_type)
+
+        level = [tree.root] if tree.root else []
+        width = 1
+        while level:
+            children = [child for node in level
+                        for child in (node.left, node.right) if child]
+            for node in level:
+                node.red = not children and len(level) < width
+            level = children
+            width *= 2
+        return tree
+
+    def insert(self, key):
+        """Inserts key ``key`` in the tree."""
+        node = self._Node(key)
+
+        parent = None
+        current = self.root
+        while current:
+            parent = current
+            current = current.left if key < current.key else current.right
+
+        if not parent:
+            self.root = node
+        elif key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+
+        self._bubble_up_node_attrs(parent)
+        self._insert_fixup(node)
+
+    def delete(self, key):
+        """Deletes key ``key`` from the tree."""
+        node = self._search_node(key, silent=False)
+
+        # For a complete internal node, replace node's key by inorder
+        # successor's key and remove the successor.
+        if node.left and node.right:
+            successor = self._min_node(node.right)
+            node.key = successor.key
+            node = successor
+
+        child = node.left or node.right
+        parent = node.parent
+        self._replace_child(parent, node, child)
+        self._bubble_up_node_attrs(parent)
+
+        # Removing a black node leaves a path short of a black node.
+        if not node.red:
+            if _is_red(child):
+                child.red = False
+            else:
+                self._delete_fixup(child, parent)
+
+    def is_balanced(self):
+        """Returns true if the root is black, no red node has a red child and
+        every path from the root to a leaf has the same no. of black nodes.
+        """
+        return not _is_red(self.root) and \
+            self._black_height(self.root) is not None
+
+    def _black_height(self, node):
+        """Returns the no. of black nodes on every path from a node to a leaf,
+        or None if the paths differ or a red node has a red child.
+        """
+        if not node:
+            return 0
+
+        left_height = self._black_height(node.left)
+        right_height = self._black_height(node.right)
+        if left_height is None or left_height != right_height:
+            return None
+        if node.red and (_is_red(node.left) or _is_red(node.right)):
+            return None
+        return left_height + (0 if node.red else 1)
+
+    def _insert_fixup(self, node):
+        """Restores the red-black properties after inserting a red node."""
+        while _is_red(node.parent):
+            parent = node.parent
+            grandparent = parent.parent
+
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if _is_red(uncle):
+                    # Move the red up to the grandparent.
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+
+                if node is parent.right:
+                    node = parent
+                    self._rotate_left(node)
+                    parent = node.parent
+                parent.red = False
+                grandparent.red = True
+                self._rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+                if _is_red(uncle):
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+
+                if node is parent.left:
+                    node = parent
+                    self._rotate_right(node)
+                    parent = node.parent
+                parent.red = False
+                grandparent.red = True
+                self._rotate_left(grandparent)
+
+        self.root.red = False
+
+    def _delete_fixup(self, node, parent):
+        """Restores the red-black properties when the paths through ``node``,
+        a child of ``parent``, are short of a black node.
+        """
+        while node is not self.root and not _is_red(node):
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotate_left(parent)
+                    sibling = parent.right
+
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    # Move the missing black up to the parent.
+                    sibling.red = True
+                    node = parent
+                    parent = node.parent
+                    continue
+
+                if not _is_red(sibling.right):
+                    sibling.left.red = False
+                    sibling.red = True
+                    self._rotate_right(sibling)
+                    sibling = parent.right
+                sibling.red = parent.red
+                parent.red = False
+                sibling.right.red = False
+                self._rotate_left(parent)
+            else:
+                sibling = parent.left
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotate_right(parent)
+                    sibling = parent.left
+
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    sibling.red = True
+                    node = parent
+                    parent = node.parent
+                    continue
+
+                if not _is_red(sibling.left):
+                    sibling.right.red = False
+                    sibling.red = True
+                    self._rotate_left(sibling)
+                    sibling = parent.left
+                sibling.red = parent.red
+                parent.red = False
+                sibling.left.red = False
+                self._rotate_right(parent)
+            node = self.root
+
+        if node:
+            node.red = False
+
+    def _rotate_left(self, node):
+        """Rotates ``node`` to make it the left child of its right child."""
+        child = node.right
+        parent = node.parent
+
+        node.right = child.left
+        child.left = node
+        self._replace_child(parent, node, child)
+
+        node.update()
+        child.update()
+
+    def _rotate_right(self, node):
+        """Rotates ``node`` to make it the right child of its left child."""
+        child = node.left
+        parent = node.parent
+
+        node.left = child.right
+        child.right = node
+        self._replace_child(parent, node, child)
+
+        node.update()
+        child.update()
+
+    def _replace_child(self, parent, node, child):
+        """Replaces ``node`` by ``child`` (which may be None) as a child of
+        ``parent``.
+        """
+        if not parent:
+            self.root = child
+            if child:
+                child.parent = None
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+
+    def _bubble_up_node_attrs(self, node):
+        """Updates node attributes (e.g. the weight) up to the root."""
+        while node:
+            node.update()
+            node = node.parent
+
+
+class OrderStatisticsRedBlackTree(OrderStatistics, RedBlackTree):
+    """Implements an Order statistics tree which is also a red-black tree.
+
+    The nodes must be ``WeightedNode``.
+    """
+
+
+if __name__ == '__main__':
+    # Benchmark a write heavy load of random inserts and deletes against the
+    # AVL tree and the treap, with and without the weights. The no. of keys
+    # can be passed as an argument.
+    import random
+    import sys
+    import time
+
+    import avl_tree
+    import order_statistics_tree
+    import treap
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    keys = random.sample(xrange(10 * size), 2 * size)
+    inserted, deleted = keys[:size], keys[size:]
+
+    for name, tree in [
+            ('AVLTree', avl_tree.AVLTree(avl_tree.Node)),
+            ('RedBlackTree', RedBlackTree(Node)),
+            ('Treap', treap.Treap(treap.Node)),
+            ('OrderStatisticsTree', order_statistics_tree.OrderStatisticsTree(
+                order_statistics_tree.Node)),
+            ('OrderStatisticsRedBlackTree',
+             OrderStatisticsRedBlackTree(WeightedNode)),
+            ('OrderStatisticsTreap',
+             treap.OrderStatisticsTreap(treap.WeightedNode))]:
+        for key in inserted:
+            tree.insert(key)
+
+        # Replace every key, one insert and one delete at a time.
+        start = time.time()
+        for new_key, old_key in zip(deleted, inserted):
+            tree.insert(new_key)
+            tree.delete(old_key)
+        elapsed = time.time() - start
+        print '{0:<28} {1:.0f} updates/s'.format(name, 2 * size / elapsed)
@@ -6,15 +6,49 @@
 
     This module implements the Segment Tree data structure.
 
-    TODO (isubuz)
-    - Support insertion of new elements in the segment tree (if possible).
-    - Range updates
+    See ``zahlen.ds.tree.lazy_segment_tree`` for a segment tree with range
+    updates over any associative aggregate function.
+
+    ``BottomUpSegmentTree`` is an array backed segment tree which also supports
+    appending new elements.
 
     :copyright: (c) 2014 by Subhajit Ghosh.
     :license: MIT, see LICENSE for more details.
 """
 
+from array import array
 from collections import deque
+from itertools import imap, izip
+
+import operator
+
+
+def _check_ranges(starts, ends, size):
+    """Validate a batch of ranges at once."""
+
+    if len(starts) != len(ends):
+        raise ValueError('Expected as many start indices as end indices')
+
+    if starts:
+        if min(starts) < 0:
+            raise IndexError('Invalid start index: {0}'.format(min(starts)))
+        if max(ends) >= size:
+            raise IndexError('Invalid end index: {0}'.format(max(ends)))
+        if any(imap(operator.gt, starts, ends)):
+            raise IndexError('Invalid start index: greater than end index')
+
+
+def _check_updates(indices, elements, size):
+    """Validate a batch of updates at once."""
+
+    if len(indices) != len(elements):
+        raise ValueError('Expected as many elements as indices')
+
+    if indices:
+        if min(indices) < 0:
+            raise IndexError('Invalid index: {0}'.format(min(indices)))
+        if max(indices) >= size:
+            raise IndexError('Invalid index: {0}'.format(max(indices)))
 
 
 class SegmentTree(object):
@@ -23,6 +57,7 @@ class SegmentTree(object):
     Note that this implementation of a Segment Tree does not support addition
     of new elements in the tree. All elements must be supplied in a list during
     the segment tree creation. An element at a specified index can be updated.
+    See ``BottomUpSegmentTree`` for a segment tree which supports appends.
 
     Example usage::
         elements = [2, 1, 3, 6, 0, -1, -2]
@@ -37,6 +72,10 @@ class SegmentTree(object):
 
         # Query the minimum index within a range
         st.query(start, end)
+
+        # Query or update in batches
+        st.query_many(starts, ends)
+        st.update_many(indices, new_values)
     """
 
     def __init__(self, elements):
@@ -100,18 +139,41 @@ class SegmentTree(object):
         range_index = self._leaves_range_indices[index]
         self._elements[index] = element
 
+        # The minimum of every ancestor range is recomputed from its children,
+        # as an increased element may no longer be the minimum of a range.
         while True:
-            parent_range_index = self._parent_range_index(range_index)
-            if parent_range_index < 0:
+            range_index = self._parent_range_index(range_index)
+            if range_index < 0:
                 break
+            self._update_min_index(range_index)
 
-            parent_min = self._min_range_indices[parent_range_index]
+    def update_many(self, indices, elements):
+        """Update the elements at many indices.
 
-            if element > self._elements[parent_min]:
-                break
-            else:
-                self._min_range_indices[parent_range_index] = index
-                range_index = parent_range_index
+        The batch is validated once. The ancestors of all the updated leaves
+        are then recomputed once each, from the deepest to the root, i.e. the
+        work on the paths shared by the leaves is not repeated.
+
+        :param indices: sequence of indices
+        :param elements: sequence of new elements for the indices
+        """
+
+        _check_updates(indices, elements, self._size)
+
+        ancestors = set()
+        for index, element in izip(indices, elements):
+            self._elements[index] = element
+
+            range_index = self._leaves_range_indices[index]
+            while range_index > 0:
+                range_index = self._parent_range_index(range_index)
+                if range_index in ancestors:
+                    break
+                ancestors.add(range_index)
+
+        # A child's range index is always greater than its parent's.
+        for range_index in sorted(ancestors, reverse=True):
+            self._update_min_index(range_index)
 
     def query(self, start, end):
         """Return the index of the minimum within the specified range.
@@ -132,6 +194,23 @@ class SegmentTree(object):
 
         return self._query_from_root(start, end, 0, 0, self._size - 1)
 
+    def query_many(self, starts, ends):
+        """Return the indices of the minimum within many ranges.
+
+        The batch is validated once instead of once per range.
+
+        :param starts: sequence of range start indices
+        :param ends: sequence of range end indices
+        :returns: array of the minimum indices, one per range
+        """
+
+        _check_ranges(starts, ends, self._size)
+
+        query = self._query_from_root
+        last = self._size - 1
+        return array('l', (query(start, end, 0, 0, last)
+                           for start, end in izip(starts, ends)))
+
     def _build(self, range_index, start, end):
         """Build the heap structure for the segment tree.
 
@@ -163,6 +242,15 @@ class SegmentTree(object):
             self._min_range_indices[range_index] = left_min_index \
                 if left_range_min < right_range_min else right_min_index
 
+    def _update_min_index(self, range_index):
+        """Recompute the minimum index of a range from its children."""
+
+        left_min_index = self._min_range_indices[2 * range_index + 1]
+        right_min_index = self._min_range_indices[2 * range_index + 2]
+        self._min_range_indices[range_index] = left_min_index \
+            if self._elements[left_min_index] < \
+            self._elements[right_min_index] else right_min_index
+
     @staticmethod
     def _parent_range_index(range_index):
         """Return the parent index for the child range index."""
@@ -222,4 +310,239 @@ class SegmentTree(object):
                         self._elements[right_min_index]:
                     return left_min_index
                 else:
-                    return right_min_index
\ No newline at end of file
+                    return right_min_index
+
+
+class BottomUpSegmentTree(object):
+    """Construct a segment tree which is built, queried and updated without
+    recursion.
+
+    The tree is stored in a contiguous array of size 2c, where the capacity c
+    is the smallest power of 2 not less than the no. of elements. The leaves
+    are at positions [c, 2c) and the node at position i is the parent of the
+    nodes at 2i and 2i + 1. Every node stores the index of the minimum element
+    in its range, or -1 if the range only covers the unused capacity. A query
+    starts at the two leaves bounding the range and walks up to the root, and
+    an update walks up from a single leaf.
+
+    Unlike ``SegmentTree``, new elements can be appended. An append fills the
+    next unused leaf in O(log n) time, and when the capacity is exhausted it
+    is doubled and the tree is rebuilt in O(n) time, i.e. O(log n) amortized.
+
+    The tree returns the same indices as ``SegmentTree`` i.e. if there is more
+    than one minimum within a range, the highest index is returned.
+
+    Example usage::
+        elements = [2, 1, 3, 6, 0, -1, -2]
+
+        st = BottomUpSegmentTree(elements)
+        st.update(index, new_value)
+        st.append(new_value)
+        st.query(start, end)
+
+        # Query or update in batches
+        st.query_many(starts, ends)
+        st.update_many(indices, new_values)
+    """
+
+    def __init__(self, elements):
+
+        if not elements:
+            raise ValueError('Expected a non-empty list of input elements')
+
+        self._size = len(elements)
+        self._elements = list(elements)
+        self._build()
+
+    def __len__(self):
+        return self._size
+
+    def append(self, element):
+        """Append an element after the last element."""
+
+        self._elements.append(element)
+        self._size += 1
+
+        if self._size > self._capacity:
+            self._build()
+        else:
+            tree = self._tree
+            node = self._size - 1 + self._capacity
+            tree[node] = self._size - 1
+            node >>= 1
+            while node:
+                tree[node] = self._min_index(tree[2 * node],
+                                             tree[2 * node + 1])
+                node >>= 1
+
+    def update(self, index, element):
+        """Update an element at the specified index."""
+
+        if not 0 <= index <= self._size - 1:
+            raise IndexError('Invalid index: {0}'.format(index))
+
+        self._elements[index] = element
+
+        tree = self._tree
+        node = (index + self._capacity) >> 1
+        while node:
+            tree[node] = self._min_index(tree[2 * node], tree[2 * node + 1])
+            node >>= 1
+
+    def update_many(self, indices, elements):
+        """Update the elements at many indices.
+
+        The batch is validated once and every ancestor of the updated leaves is
+        recomputed once.
+
+        :param indices: sequence of indices
+        :param elements: sequence of new elements for the indices
+        """
+
+        _check_updates(indices, elements, self._size)
+
+        ancestors = set()
+        for index, element in izip(indices, elements):
+            self._elements[index] = element
+
+            node = (index + self._capacity) >> 1
+            while node and node not in ancestors:
+                ancestors.add(node)
+                node >>= 1
+
+        # A child's position is always greater than its parent's.
+        tree = self._tree
+        for node in sorted(ancestors, reverse=True):
+            tree[node] = self._min_index(tree[2 * node], tree[2 * node + 1])
+
+    def query(self, start, end):
+        """Return the index of the minimum within the specified range.
+
+        :param start: range start index
+        :param end: range end index
+        """
+
+        if not 0 <= start <= end:
+            raise IndexError("Invalid start index:" + str(start))
+
+        if not start <= end < self._size:
+            raise IndexError("Invalid end index: " + str(end))
+
+        tree = self._tree
+        minimum = end
+        left, right = start + self._capacity, end + self._capacity + 1
+        while left < right:
+            if left & 1:
+                minimum = self._min_index(minimum, tree[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                minimum = self._min_index(minimum, tree[right])
+            left >>= 1
+            right >>= 1
+        return minimum
+
+    def query_many(self, starts, ends):
+        """Return the indices of the minimum within many ranges.
+
+        The batch is validated once and the ranges are queried in a loop
+        without any per range method call.
+
+        :param starts: sequence of range start indices
+        :param ends: sequence of range end indices
+        :returns: array of the minimum indices, one per range
+        """
+
+        _check_ranges(starts, ends, self._size)
+
+        tree = self._tree
+        elements = self._elements
+        capacity = self._capacity
+        minimums = array('l')
+        for start, end in izip(starts, ends):
+            minimum = end
+            left, right = start + capacity, end + capacity + 1
+            while left < right:
+                if left & 1:
+                    index = tree[left]
+                    if elements[index] < elements[minimum] or (
+                            index > minimum and
+                            not elements[minimum] < elements[index]):
+                        minimum = index
+                    left += 1
+                if right & 1:
+                    right -= 1
+                    index = tree[right]
+                    if elements[index] < elements[minimum] or (
+                            index > minimum and
+                            not elements[minimum] < elements[index]):
+                        minimum = index
+                left >>= 1
+                right >>= 1
+            minimums.append(minimum)
+        return minimums
+
+    def _build(self):
+        """Build the tree with the smallest capacity which can hold all the
+        elements.
+        """
+        capacity = 1
+        while capacity < self._size:
+            capacity *= 2
+        self._capacity = capacity
+
+        tree = array('l', [-1]) * (2 * capacity)
+        tree[capacity:capacity + self._size] = array('l', xrange(self._size))
+        for node in xrange(capacity - 1, 0, -1):
+            tree[node] = self._min_index(tree[2 * node], tree[2 * node + 1])
+        self._tree = tree
+
+    def _min_index(self, left, right):
+        """Return the index of the smaller element, or the higher index if the
+        elements are equal. An index of -1 stands for no element.
+        """
+        if left < 0:
+            return right
+        elif right < 0:
+            return left
+
+        elements = self._elements
+        if elements[left] < elements[right]:
+            return left
+        elif elements[right] < elements[left]:
+            return right
+        return max(left, right)
+
+
+if __name__ == '__main__':
+    # Benchmark construction, queries and updates against SegmentTree. The no.
+    # of elements can be passed as an argument.
+    import random
+    import sys
+    import time
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    elements = [random.randint(0, size) for _ in xrange(size)]
+    ranges = [sorted((random.randrange(size), random.randrange(size)))
+              for _ in xrange(size)]
+    updates = [(random.randrange(size), random.randint(0, size))
+               for _ in xrange(size)]
+
+    for cls in [SegmentTree, BottomUpSegmentTree]:
+        start = time.time()
+        st = cls(elements[:])
+        build = time.time() - start
+
+        start = time.time()
+        for left, right in ranges:
+            st.query(left, right)
+        query = time.time() - start
+
+        start = time.time()
+        for index, value in updates:
+            st.update(index, value)
+        update = time.time() - start
+
+        print '{0:<20} build {1:.2f}s, {2:.0f} queries/s, {3:.0f} ' \
+            'updates/s'.format(cls.__name__, build, size / query,
+                               size / update)
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.segment_tree_2d
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements the 2-dimensional Segment Tree, which supports
+    updating a cell of a grid and aggregating a rectangle in
+    O(log n * log m) time.
+
+    The tree is a segment tree over the rows in which every node is a segment
+    tree over the columns. Both are bottom-up segment trees (the children of
+    node i are 2i and 2i + 1, the leaves start at the size) and all the nodes
+    are stored in a single flat list of size 2n * 2m.
+
+    The aggregate function is a ``zahlen.ds.tree.lazy_segment_tree.Monoid``
+    and must be commutative (e.g. sum, minimum, maximum or gcd) as the nodes
+    of a rectangle are not combined in the order of the cells.
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from lazy_segment_tree import SUM
+
+
+class SegmentTree2D(object):
+    """Construct a 2-dimensional segment tree.
+
+    Example usage::
+        grid = [[1, 2, 3],
+                [4, 5, 6]]
+
+        st = SegmentTree2D(grid, SUM)
+
+        # Assign a value to a cell
+        st.update(row, column, value)
+
+        # Aggregate the rectangle with corners (top, left) and (bottom, right)
+        st.query(top, left, bottom, right)
+
+    :param grid: list of rows of the initial elements
+    :param monoid: (optional) the aggregate function, defaults to ``SUM``
+    """
+
+    def __init__(self, grid, monoid=SUM):
+
+        if not grid or not grid[0]:
+            raise ValueError('Expected a non-empty grid of input elements')
+
+        self._monoid = monoid
+        self._rows = rows = len(grid)
+        self._columns = columns = len(grid[0])
+        self._width = width = 2 * columns
+
+        combine = monoid.combine
+        tree = [monoid.identity] * (2 * rows * width)
+
+        # Leaf rows: leaves from the elements, then the column trees.
+        for row, elements in enumerate(grid):
+            if len(elements) != columns:
+                raise ValueError('Expected rows of equal length')
+            offset = (rows + row) * width
+            tree[offset + columns:offset + width] = elements
+            for column in xrange(columns - 1, 0, -1):
+                tree[offset + column] = combine(
+                    tree[offset + 2 * column], tree[offset + 2 * column + 1])
+
+        # Internal rows combine the two child rows node by node.
+        for row in xrange(rows - 1, 0, -1):
+            offset = row * width
+            left = 2 * row * width
+            right = left + width
+            for column in xrange(1, width):
+                tree[offset + column] = combine(tree[left + column],
+                                                tree[right + column])
+
+        self._tree = tree
+
+    @property
+    def shape(self):
+        return self._rows, self._columns
+
+    def update(self, row, column, value):
+        """Assign ``value`` to the cell (row, column)."""
+
+        self._check_cell(row, column)
+
+        combine = self._monoid.combine
+        tree = self._tree
+        width = self._width
+
+        # Update the column tree of the leaf row.
+        row += self._rows
+        offset = row * width
+        position = column + self._columns
+        tree[offset + position] = value
+        position >>= 1
+        while position:
+            tree[offset + position] = combine(
+                tree[offset + 2 * position], tree[offset + 2 * position + 1])
+            position >>= 1
+
+        # Update the same column path in every ancestor row.
+        row >>= 1
+        while row:
+            offset = row * width
+            left = 2 * row * width
+            right = left + width
+            position = column + self._columns
+            while position:
+                tree[offset + position] = combine(tree[left + position],
+                                                  tree[right + position])
+                position >>= 1
+            row >>= 1
+
+    def query(self, top, left, bottom, right):
+        """Return the aggregate of the rectangle with the corners (top, left)
+        and (bottom, right), both inclusive.
+        """
+
+        if not (0 <= top <= bottom and 0 <= left <= right):
+            raise IndexError('Invalid rectangle: ({0}, {1}), ({2}, {3})'
+                             .format(top, left, bottom, right))
+        self._check_cell(bottom, right)
+
+        result = self._monoid.identity
+        start, end = top + self._rows, bottom + self._rows + 1
+        while start < end:
+            if start & 1:
+                result = self._monoid.combine(
+                    result, self._query_row(start, left, right))
+                start += 1
+            if end & 1:
+                end -= 1
+                result = self._monoid.combine(
+                    result, self._query_row(end, left, right))
+            start >>= 1
+            end >>= 1
+        return result
+
+    def _query_row(self, row, left, right):
+        """Aggregate the columns [left, right] in the column tree of a row
+        node.
+        """
+        combine = self._monoid.combine
+        tree = self._tree
+        offset = row * self._width
+        result = self._monoid.identity
+        start, end = left + self._columns, right + self._columns + 1
+        while start < end:
+            if start & 1:
+                result = combine(result, tree[offset + start])
+                start += 1
+            if end & 1:
+                end -= 1
+                result = combine(result, tree[offset + end])
+            start >>= 1
+            end >>= 1
+        return result
+
+    def _check_cell(self, row, column):
+        if not 0 <= row < self._rows:
+            raise IndexError('Invalid row: {0}'.format(row))
+        if not 0 <= column < self._columns:
+            raise IndexError('Invalid column: {0}'.format(column))
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.sorted_list
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements a sorted container as a list of sorted lists, an
+    alternative to the binary search trees for a large no. of keys.
+
+    The keys are stored in order in buckets of between half and twice the
+    load factor (1000 by default) keys. The last key of every bucket is kept
+    in a separate list, so a key is located with a binary search over the
+    buckets followed by a binary search within a bucket. An insert or a delete
+    shifts the keys of only one bucket, which is a fast memory move, and a
+    bucket is split or merged with its neighbour when its size leaves the
+    bounds. The keys are stored contiguously, so there is no per node object
+    and far fewer cache misses than in a tree of nodes.
+
+    The order statistics are answered with a ``FenwickTree`` over the bucket
+    sizes, which is rebuilt in O(n / load) time after a split or a merge.
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+
+from fenwick_tree import FenwickTree
+
+
+_LOAD = 1000
+
+
+class SortedList(object):
+    """Represents a sorted list of keys, which may be repeated.
+
+    It provides the same interface as
+    ``zahlen.ds.tree.order_statistics_tree.OrderStatisticsTree``.
+
+    Example usage::
+        sl = SortedList([5, 1, 4])
+
+        sl.insert(3)
+        sl.delete(4)
+        sl.search(3)
+        sl.sorted_keys()
+
+        # Order statistics
+        sl.kth_smallest_key(k)
+        sl.rank(key)
+
+    :param keys: (optional) iterable of the initial keys
+    :param load: (optional) load factor i.e. the target bucket size
+    """
+
+    def __init__(self, keys=None, load=_LOAD):
+        if load < 2:
+            raise ValueError('Load factor must be greater than 1')
+
+        self._load = load
+        keys = sorted(keys) if keys else []
+        self._lists = [keys[start:start + load]
+                       for start in xrange(0, len(keys), load)]
+        self._maxes = [values[-1] for values in self._lists]
+        self._size = len(keys)
+        self._index = None
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        return chain.from_iterable(reversed(values)
+                                   for values in reversed(self._lists))
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def insert(self, key):
+        """Inserts key ``key`` in the list."""
+        lists, maxes = self._lists, self._maxes
+        self._size += 1
+
+        if not maxes:
+            lists.append([key])
+            maxes.append(key)
+            self._index = None
+            return
+
+        position = bisect_right(maxes, key)
+        if position == len(maxes):
+            position -= 1
+            lists[position].append(key)
+            maxes[position] = key
+        else:
+            insort(lists[position], key)
+
+        if len(lists[position]) > 2 * self._load:
+            self._split(position)
+        elif self._index is not None:
+            self._index.update(position, 1)
+
+    def delete(self, key):
+        """Deletes an occurrence of key ``key`` from the list."""
+        lists, maxes = self._lists, self._maxes
+
+        position = bisect_left(maxes, key)
+        if position == len(maxes):
+            raise KeyError('Key: {0} not found in tree'.format(key))
+
+        values = lists[position]
+        index = bisect_left(values, key)
+        if values[index] != key:
+            raise KeyError('Key: {0} not found in tree'.format(key))
+
+        del values[index]
+        self._size -= 1
+
+        if not values:
+            del lists[position]
+            del maxes[position]
+            self._index = None
+        elif len(values) < self._load // 2 and len(lists) > 1:
+            self._merge(position)
+        else:
+            maxes[position] = values[-1]
+            if self._index is not None:
+                self._index.update(position, -1)
+
+    def search(self, key):
+        """Returns True if key `key` exists in the list, else False."""
+        position = bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            return False
+        values = self._lists[position]
+        return values[bisect_left(values, key)] == key
+
+    def sorted_keys(self):
+        """Returns a sorted list of the keys."""
+        return list(self)
+
+    def kth_smallest_key(self, k):
+        """Returns the kth smallest key."""
+        if not self._size:
+            raise Exception('Tree is empty!')
+
+        if not 1 <= k <= self._size:
+            raise IndexError('Rank must be a positive value less than: '
+                             '{0}'.format(self._size + 1))
+
+        position, index = self._locate(k - 1)
+        return self._lists[position][index]
+
+    def kth_largest_key(self, k):
+        """Returns the kth largest key."""
+        if not self._size:
+            raise Exception('Tree is empty!')
+
+        if not 1 <= k <= self._size:
+            raise IndexError('Rank must be a positive value less than: '
+                             '{0}'.format(self._size + 1))
+
+        return self.kth_smallest_key(self._size - k + 1)
+
+    def kth_successor(self, k, key):
+        """Returns the kth-successor of a key."""
+        if k < 0:
+            raise IndexError('Successor index must be greater than 0')
+        if not self._size:
+            raise Exception('Tree is empty!')
+        if not self.search(key):
+            raise KeyError('Key: {0} not found in tree'.format(key))
+
+        position = self.rank(key) + 1 + k
+        if position > self._size:
+            raise IndexError('Invalid successor index: {0}'.format(k))
+        return self.kth_smallest_key(position)
+
+    def rank(self, key):
+        """Returns the no. of keys smaller than ``key``."""
+        return self._count_smaller(key, bisect_left)
+
+    def count_range(self, low, high):
+        """Returns the no. of keys between ``low`` and ``high``, both
+        inclusive.
+        """
+        if high < low:
+            return 0
+        return self._count_smaller(high, bisect_right) - \
+            self._count_smaller(low, bisect_left)
+
+    def percentile(self, p):
+        """Returns the pth percentile of the keys by the nearest-rank method.
+
+        :param p: percentile between 0 and 100
+        """
+        if not 0 <= p <= 100:
+            raise ValueError('Percentile must be between 0 and 100')
+        if not self._size:
+            raise Exception('Tree is empty!')
+
+        k = -(-p * self._size // 100)     # ceil(p * n / 100)
+        return self.kth_smallest_key(max(1, int(k)))
+
+    def _count_smaller(self, key, bisect):
+        """Returns the no. of keys before the position of ``key`` found by
+        ``bisect`` i.e. smaller than ``key`` for ``bisect_left`` and smaller
+        than or equal to ``key`` for ``bisect_right``.
+        """
+        position = bisect(self._maxes, key)
+        if position == len(self._maxes):
+            return self._size
+
+        count = self._sizes().read(position - 1) if position else 0
+        return count + bisect(self._lists[position], key)
+
+    def _locate(self, index):
+        """Returns the bucket and the position within the bucket of the key
+        at ``index`` in sorted order.
+        """
+        sizes = self._sizes()
+        position = sizes.lower_bound(index + 1)
+        if position:
+            index -= sizes.read(position - 1)
+        return position, index
+
+    def _sizes(self):
+        """Returns the Fenwick tree of the bucket sizes."""
+        if self._index is None:
+            self._index = FenwickTree.from_values(
+                len(values) for values in self._lists)
+        return self._index
+
+    def _split(self, position):
+        """Splits a bucket into two halves."""
+        values = self._lists[position]
+        half = len(values) // 2
+        self._lists.insert(position + 1, values[half:])
+        del values[half:]
+        self._maxes.insert(position, values[-1])
+        self._index = None
+
+    def _merge(self, position):
+        """Merges a small bucket with its neighbour, which is split again if
+        the merged bucket is too large.
+        """
+        lists, maxes = self._lists, self._maxes
+        if position:
+            position -= 1
+        lists[position].extend(lists[position + 1])
+        maxes[position] = lists[position][-1]
+        del lists[position + 1]
+        del maxes[position + 1]
+        self._index = None
+
+        if len(lists[position]) > 2 * self._load:
+            self._split(position)
+
+
+if __name__ == '__main__':
+    # Benchmark inserts, lookups and deletes against the AVL trees. The no. of
+    # keys can be passed as an argument.
+    import random
+    import sys
+    import time
+
+    from avl_tree import AVLTree, Node
+    from iterative_avl_tree import IterativeAVLTree
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    keys = random.sample(xrange(10 * size), size)
+
+    for name, tree in [('AVLTree', AVLTree(Node)),
+                       ('IterativeAVLTree', IterativeAVLTree()),
+                       ('SortedList', SortedList())]:
+        timings = []
+        for operation in [tree.insert, tree.search, tree.delete]:
+            start = time.time()
+            for key in keys:
+                operation(key)
+            timings.append(size / (time.time() - start))
+        print '{0:<18} {1:.0f} inserts/s, {2:.0f} searches/s, ' \
+            '{3:.0f} deletes/s'.format(name, *timings)
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.sparse_table
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements the Sparse Table data structure for range minimum
+    queries (RMQ) over a list of elements which is not modified.
+
+    A sparse table stores the index of the minimum of every range whose length
+    is a power of 2. Any range is covered by two (overlapping) such ranges, so a
+    query takes O(1) time after an O(n log n) construction.
+
+    The block decomposed variant splits the elements into blocks of 32 and
+    builds a sparse table only over the minimum of every block. A query within
+    a block is answered in O(1) time with a bitmask, for every index, of the
+    elements which are the minimum of a range ending at the index. This reduces
+    the space to O(n) while keeping O(1) queries.
+
+    Both return the same indices as ``zahlen.ds.tree.segment_tree.SegmentTree``
+    i.e. if there is more than one minimum within a range, the highest index is
+    returned.
+
+    References:
+    - http://community.topcoder.com/tc?module=Static&d1=tutorials&d2=lowestCommonAncestor
+    - http://en.wikipedia.org/wiki/Range_minimum_query
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from array import array
+
+
+_BLOCK_SIZE = 32
+
+
+def _min_index(elements, left, right):
+    """Return the index of the smaller element, or the higher index if the
+    elements are equal.
+    """
+    if elements[left] < elements[right]:
+        return left
+    elif elements[right] < elements[left]:
+        return right
+    return max(left, right)
+
+
+def _build_levels(elements, indices):
+    """Build the levels of a sparse table in a flat array.
+
+    The j-th entry of level k is the index of the minimum of the elements at
+    ``indices[j:j + 2 ** k]``.
+    """
+    size = len(indices)
+    table = array('l', indices)
+    offset, width = 0, 1
+    while 2 * width <= size:
+        for j in xrange(size - 2 * width + 1):
+            table.append(_min_index(elements, table[offset + j],
+                                    table[offset + j + width]))
+        offset += size - width + 1
+        width *= 2
+    return table
+
+
+def _level_offsets(size):
+    """Return the offset of every level of a sparse table in its flat
+    array.
+    """
+    offsets = []
+    offset, width = 0, 1
+    while width <= size:
+        offsets.append(offset)
+        offset += size - width + 1
+        width *= 2
+    return offsets
+
+
+class SparseTable(object):
+    """Construct a sparse table.
+
+    Example usage::
+        elements = [2, 1, 3, 6, 0, -1, -2]
+
+        st = SparseTable(elements)
+
+        # Query the minimum index within a range
+        st.query(start, end)
+    """
+
+    def __init__(self, elements):
+
+        if not elements:
+            raise ValueError('Expected a non-empty list of input elements')
+
+        self._size = len(elements)
+        self._elements = elements
+        self._table = _build_levels(elements, xrange(self._size))
+        self._offsets = _level_offsets(self._size)
+
+    def query(self, start, end):
+        """Return the index of the minimum within the specified range.
+
+        :param start: range start index
+        :param end: range end index
+        """
+
+        if not 0 <= start <= end:
+            raise IndexError("Invalid start index:" + str(start))
+
+        if not start <= end < self._size:
+            raise IndexError("Invalid end index: " + str(end))
+
+        level = (end - start + 1).bit_length() - 1
+        offset = self._offsets[level]
+        return _min_index(self._elements,
+                          self._table[offset + start],
+                          self._table[offset + end - (1 << level) + 1])
+
+
+class BlockSparseTable(object):
+    """Construct a block decomposed sparse table, which takes O(n) space.
+
+    Example usage::
+        elements = [2, 1, 3, 6, 0, -1, -2]
+
+        st = BlockSparseTable(elements)
+
+        # Query the minimum index within a range
+        st.query(start, end)
+    """
+
+    def __init__(self, elements):
+
+        if not elements:
+            raise ValueError('Expected a non-empty list of input elements')
+
+        self._size = len(elements)
+        self._elements = elements
+
+        # Bit (j - s) of masks[i], where s is the start of the block of i, is
+        # set if elements[j] is smaller than every element in (j, i]. These
+        # are the positions on a stack of increasing minimums, maintained from
+        # the start of the block to i.
+        self._masks = array('L', [0]) * self._size
+        block_minimums = []
+        for block_start in xrange(0, self._size, _BLOCK_SIZE):
+            stack = []
+            mask = 0
+            for index in xrange(block_start,
+                                min(block_start + _BLOCK_SIZE, self._size)):
+                while stack and not elements[stack[-1]] < elements[index]:
+                    mask ^= 1 << (stack.pop() - block_start)
+                stack.append(index)
+                mask |= 1 << (index - block_start)
+                self._masks[index] = mask
+            block_minimums.append(stack[0])
+
+        self._blocks = len(block_minimums)
+        self._table = _build_levels(elements, block_minimums)
+        self._offsets = _level_offsets(self._blocks)
+
+    def query(self, start, end):
+        """Return the index of the minimum within the specified range.
+
+        :param start: range start index
+        :param end: range end index
+        """
+
+        if not 0 <= start <= end:
+            raise IndexError("Invalid start index:" + str(start))
+
+        if not start <= end < self._size:
+            raise IndexError("Invalid end index: " + str(end))
+
+        start_block = start // _BLOCK_SIZE
+        end_block = end // _BLOCK_SIZE
+        if start_block == end_block:
+            return self._query_block(start, end)
+
+        elements = self._elements
+        minimum = _min_index(
+            elements,
+            self._query_block(start, (start_block + 1) * _BLOCK_SIZE - 1),
+            self._query_block(end_block * _BLOCK_SIZE, end))
+
+        if start_block + 1 < end_block:
+            first, last = start_block + 1, end_block - 1
+            level = (last - first + 1).bit_length() - 1
+            offset = self._offsets[level]
+            minimum = _min_index(
+                elements, minimum,
+                _min_index(elements, self._table[offset + first],
+                           self._table[offset + last - (1 << level) + 1]))
+        return minimum
+
+    def _query_block(self, start, end):
+        """Return the index of the minimum within a range inside a block.
+
+        The lowest position on the stack of ``end`` which is not before
+        ``start`` is the minimum of the range.
+        """
+        shift = start % _BLOCK_SIZE
+        mask = self._masks[end] >> shift
+        return start + (mask & -mask).bit_length() - 1
+
+
+if __name__ == '__main__':
+    # Benchmark construction and queries against the segment trees. The no. of
+    # elements can be passed as an argument.
+    import random
+    import sys
+    import time
+
+    from segment_tree import BottomUpSegmentTree, SegmentTree
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    elements = [random.randint(0, size) for _ in xrange(size)]
+    ranges = [sorted((random.randrange(size), random.randrange(size)))
+              for _ in xrange(size)]
+
+    for cls in [SegmentTree, BottomUpSegmentTree, SparseTable,
+                BlockSparseTable]:
+        start = time.time()
+        st = cls(elements)
+        build = time.time() - start
+
+        start = time.time()
+        for left, right in ranges:
+            st.query(left, right)
+        query = time.time() - start
+
+        print '{0:<20} build {1:.2f}s, {2:.0f} queries/s'.format(
+            cls.__name__, build, size / query)
@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.suffix_array
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements the Suffix Array data structure along with the
+    Longest Common Prefix (LCP) array.
+
+    A suffix array is a compact alternative to a suffix tree. It stores the
+    starting positions of the suffixes of a text in lexicographic order as a
+    flat array of machine integers, i.e. 4 bytes per character (plus another 4
+    for the LCP array) instead of a Python object and a dict per vertex.
+
+    The suffix array is built by prefix doubling. In every round the suffixes
+    are sorted by their first 2k characters using the ranks of the first k
+    characters, with an LSD radix sort of two stable counting sort passes over
+    the pair of ranks. This takes O(n log n) time. The LCP array is computed
+    from the suffix array in O(n) time using Kasai's algorithm.
+
+    The arrays can be saved to a file and memory-mapped when loaded, so an
+    index over a large text does not have to be read into memory.
+
+    References:
+    - http://en.wikipedia.org/wiki/Suffix_array
+    - Kasai et al., Linear-Time Longest-Common-Prefix Computation in Suffix
+      Arrays and Its Applications
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from array import array
+
+import mmap
+import struct
+
+
+_MAGIC = b'ZSA1'
+_HEADER = struct.Struct('<4scxxxQ')     # magic, typecode, no. of suffixes
+
+
+class _MappedArray(object):
+    """A read-only sequence of integers stored in a buffer, e.g. a memory
+    mapped file.
+    """
+
+    def __init__(self, buf, offset, typecode, length):
+        self._buf = buf
+        self._offset = offset
+        self._item = struct.Struct(typecode)
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._length:
+            raise IndexError('Invalid index: {0}'.format(index))
+        return self._item.unpack_from(
+            self._buf, self._offset + index * self._item.size)[0]
+
+    @property
+    def itemsize(self):
+        return self._item.size
+
+
+class SuffixArray(object):
+    """Construct a suffix array and the LCP array of a text.
+
+    Example usage::
+        sa = SuffixArray('banana')
+
+        sa.suffixes                     # array('i', [5, 3, 1, 0, 4, 2])
+        sa.lcp                          # array('i', [0, 1, 3, 0, 0, 2])
+        sa.count('ana')                 # 2
+        sorted(sa.find_all('ana'))      # [1, 3]
+
+        # Persist the index and memory-map it back.
+        sa.save('banana.sa')
+        sa = SuffixArray.load('banana.sa', 'banana')
+
+    :param text: text to be indexed. It can be any sliceable sequence of
+        characters, e.g. a str or a memory-mapped file.
+    """
+
+    def __init__(self, text, suffixes=None, lcp=None):
+        self.text = text
+        if suffixes is None:
+            suffixes = self._build_suffixes(text)
+        if lcp is None:
+            lcp = self._build_lcp(text, suffixes)
+
+        # i-th smallest suffix starts at text[suffixes[i]]. lcp[i] is the
+        # length of the longest common prefix of the i-th and (i-1)th
+        # smallest suffixes.
+        self.suffixes = suffixes
+        self.lcp = lcp
+
+    def __len__(self):
+        return len(self.suffixes)
+
+    @classmethod
+    def load(cls, path, text):
+        """Load a suffix array saved with ``save()``.
+
+        The file is memory-mapped and the arrays are read from it on demand.
+
+        :param path: path of the saved suffix array
+        :param text: text for which the suffix array was built
+        """
+        with open(path, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, typecode, length = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC:
+            raise ValueError('Not a suffix array file: {0}'.format(path))
+        if length != len(text):
+            raise ValueError('Text length {0} does not match the suffix array '
+                             'length {1}'.format(len(text), length))
+
+        typecode = str(typecode.decode('ascii'))
+        itemsize = struct.calcsize(typecode)
+        suffixes = _MappedArray(buf, _HEADER.size, typecode, length)
+        lcp = _MappedArray(buf, _HEADER.size + length * itemsize, typecode,
+                           length)
+        return cls(text, suffixes, lcp)
+
+    def save(self, path):
+        """Save the suffix array and the LCP array to a file.
+
+        The arrays are written in the native byte order of the machine.
+        """
+        typecode = self._typecode(len(self) + 1)
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, typecode.encode('ascii'), len(self)))
+            for values in (self.suffixes, self.lcp):
+                if not isinstance(values, array) or \
+                        values.typecode != typecode:
+                    values = array(typecode,
+                                   (values[i] for i in xrange(len(values))))
+                values.tofile(f)
+
+    def contains(self, pattern):
+        """Returns True if ``pattern`` is a substring of the text."""
+        start, end = self.find_range(pattern)
+        return start < end
+
+    def count(self, pattern):
+        """Returns the no. of occurrences of ``pattern`` in the text."""
+        start, end = self.find_range(pattern)
+        return end - start
+
+    def find_all(self, pattern):
+        """Yields the starting positions of all occurrences of ``pattern`` in
+        the text.
+
+        The positions are generated lazily in the lexicographic order of the
+        suffixes.
+        """
+        start, end = self.find_range(pattern)
+        for index in xrange(start, end):
+            yield self.suffixes[index]
+
+    def find_range(self, pattern):
+        """Returns the range ``[start, end)`` of the suffix array which holds
+        the suffixes starting with ``pattern``.
+
+        The range is found with two binary searches, each comparing
+        ``pattern`` with O(log n) suffixes.
+        """
+        return self._bound(pattern, False), self._bound(pattern, True)
+
+    def longest_repeated_substring(self):
+        """Returns the longest substring which occurs at least twice in the
+        text.
+        """
+        best, best_index = 0, 0
+        for index in xrange(1, len(self.lcp)):
+            if self.lcp[index] > best:
+                best, best_index = self.lcp[index], index
+
+        start = self.suffixes[best_index] if best else 0
+        return self.text[start:start + best]
+
+    def _bound(self, pattern, upper):
+        """Returns the index of the first suffix which is greater than (if
+        ``upper``) or not less than ``pattern`` when compared on the first
+        ``len(pattern)`` characters.
+        """
+        text = self.text
+        suffixes = self.suffixes
+        size = len(pattern)
+
+        low, high = 0, len(suffixes)
+        while low < high:
+            mid = (low + high) // 2
+            start = suffixes[mid]
+            prefix = text[start:start + size]
+            if prefix < pattern or (upper and prefix == pattern):
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    @staticmethod
+    def _typecode(length):
+        """Returns the array typecode which can hold indices upto
+        ``length``.
+        """
+        return 'i' if length < 2 ** 31 else 'l'
+
+    @classmethod
+    def _build_suffixes(cls, text):
+        """Returns the suffix array of ``text`` built by prefix doubling."""
+
+        size = len(text)
+        typecode = cls._typecode(size + 1)
+        if not size:
+            return array(typecode)
+
+        # Initial ranks are the ranks of the first characters, starting at 1.
+        # Rank 0 is reserved for the empty suffix past the end of the text.
+        alphabet = dict((char, rank) for rank, char
+                        in enumerate(sorted(set(text)), 1))
+        rank = array(typecode, (alphabet[char] for char in text))
+        max_rank = len(alphabet)
+        suffixes = cls._counting_sort(xrange(size), rank, max_rank, typecode)
+
+        k = 1
+        while max_rank < size:
+            # Order by the rank of the second half: the suffixes shorter than k
+            # have an empty second half and come first. The others follow in
+            # the current order of the suffixes starting k characters later.
+            by_second = array(typecode, xrange(size - k, size))
+            by_second.extend(start - k for start in suffixes if start >= k)
+
+            # A stable sort on the rank of the first half completes the radix
+            # sort on the pair of ranks.
+            suffixes = cls._counting_sort(by_second, rank, max_rank, typecode)
+
+            new_rank = array(typecode, [0]) * size
+            max_rank = 1
+            new_rank[suffixes[0]] = 1
+            for index in xrange(1, size):
+                current, previous = suffixes[index], suffixes[index - 1]
+                if rank[current] != rank[previous] or \
+                        (rank[current + k] if current + k < size else 0) != \
+                        (rank[previous + k] if previous + k < size else 0):
+                    max_rank += 1
+                new_rank[current] = max_rank
+            rank = new_rank
+            k *= 2
+
+        return suffixes
+
+    @staticmethod
+    def _counting_sort(indices, keys, max_key, typecode):
+        """Stable sort of ``indices`` by ``keys[index]``, where every key is in
+        the range [1, max_key].
+        """
+        positions = [0] * (max_key + 2)
+        for index in indices:
+            positions[keys[index] + 1] += 1
+        for key in xrange(1, max_key + 2):
+            positions[key] += positions[key - 1]
+
+        result = array(typecode, [0]) * len(keys)
+        for index in indices:
+            key = keys[index]
+            result[positions[key]] = index
+            positions[key] += 1
+        return result
+
+    @classmethod
+    def _build_lcp(cls, text, suffixes):
+        """Returns the LCP array using Kasai's algorithm.
+
+        The suffixes are visited in text order. The LCP of a suffix is at least
+        one less than the LCP of the previous (longer) suffix, so the total no.
+        of character comparisons is linear.
+        """
+        size = len(suffixes)
+        typecode = cls._typecode(size + 1)
+
+        rank = array(typecode, [0]) * size
+        for index in xrange(size):
+            rank[suffixes[index]] = index
+
+        lcp = array(typecode, [0]) * size
+        common = 0
+        for start in xrange(size):
+            index = rank[start]
+            if index == 0:
+                common = 0
+                continue
+
+            previous = suffixes[index - 1]
+            while start + common < size and previous + common < size and \
+                    text[start + common] == text[previous + common]:
+                common += 1
+            lcp[index] = common
+            if common:
+                common -= 1
+        return lcp
+
+
+if __name__ == '__main__':
+    # Compare the memory and throughput with the suffix tree on random texts.
+    # Sizes (in MB) can be passed as arguments, e.g.
+    # ``python suffix_array.py 0.1 1``.
+    import random
+    import sys
+    import time
+
+    from suffix_tree import SuffixTree
+
+    def tree_size(st):
+        total = 0
+        stack = [st._root]
+        while stack:
+            vertex = stack.pop()
+            total += sys.getsizeof(vertex) + sys.getsizeof(vertex.children)
+            stack.extend(vertex.children.itervalues())
+        return total
+
+    sizes = [float(arg) for arg in sys.argv[1:]] or [0.1]
+    for size in sizes:
+        length = int(size * 1024 * 1024)
+        text = ''.join(random.choice('acgt') for _ in xrange(length))
+        patterns = [text[i:i + 8] for i in
+                    random.sample(xrange(length - 8), 10000)]
+
+        start = time.time()
+        sa = SuffixArray(text)
+        sa_build = time.time() - start
+        start = time.time()
+        for pattern in patterns:
+            sa.count(pattern)
+        sa_query = time.time() - start
+        sa_bytes = (sa.suffixes.itemsize + sa.lcp.itemsize) * len(sa)
+
+        st = SuffixTree(text)
+        start = time.time()
+        st.build()
+        st_build = time.time() - start
+        start = time.time()
+        for pattern in patterns:
+            st.count(pattern)
+        st_query = time.time() - start
+        st_bytes = tree_size(st)
+
+        print '{0:.1f} MB text'.format(size)
+        for name, build, query, nbytes in [
+                ('SuffixArray', sa_build, sa_query, sa_bytes),
+                ('SuffixTree', st_build, st_query, st_bytes)]:
+            print '  {0:<12} build {1:7.2f}s  {2:9.0f} queries/s  ' \
+                '{3:6.1f} bytes/char'.format(name, build,
+                                             len(patterns) / query,
+                                             float(nbytes) / length)
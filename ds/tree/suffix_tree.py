@@ -1,17 +1,65 @@
 # -*- coding: utf-8 -*-
 
+"""
+    zahlen.ds.tree.suffix_tree
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements the Suffix Tree data structure using Ukkonen's
+    online construction algorithm.
+
+    Edges are labelled by a pair of indices into the text instead of
+    substrings, so no part of the text is copied during the construction. All
+    the leaves share a single global end which is incremented once per phase,
+    i.e. extending every leaf by the next character is a constant time
+    operation. Together with suffix links and an iterative walk down the tree
+    (canonization), the tree is built in time linear in the length of the text.
+
+    Once built, the tree answers substring queries in time proportional to the
+    length of the pattern (plus the no. of occurrences reported). The no. of
+    leaves below every vertex is computed at the end of the construction so
+    that occurrences can be counted without visiting the leaves.
+
+    References:
+    - http://www.cs.helsinki.fi/u/ukkonen/SuffixT1withFigs.pdf
+    - http://stackoverflow.com/questions/9452701
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
 
 class Vertex(object):
+    """A vertex in a suffix tree.
+
+    The vertex stores the label of the edge from its parent as the half-open
+    range ``[left_index, right_index)`` of the text. A leaf has no right index
+    and ends at the global end of the tree.
+
+    :param left_index: index of the first character of the edge label
+    :param right_index: (optional) index after the last character of the edge
+        label. None for a leaf.
+    """
+
+    __slots__ = ('left_index', 'right_index', 'children', 'suffix',
+                 'leaf_count')
+
     def __init__(self, left_index, right_index=None):
         self.left_index = left_index
         self.right_index = right_index
         self.children = {}
         self.suffix = None
+        self.leaf_count = 1
 
     def __eq__(self, other):
         return self.left_index == other.left_index and \
             self.right_index == other.right_index
 
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return id(self)
+
     def __str__(self):
         return str(self.left_index)
 
@@ -20,132 +68,298 @@ class Vertex(object):
 
 
 class SuffixTree(object):
+    """Construct a suffix tree.
+
+    Example usage::
+        st = SuffixTree('banana')
+        st.build()
+
+        st.contains('nan')                  # True
+        st.count('ana')                     # 2
+        sorted(st.find_all('ana'))          # [1, 3]
+        st.longest_repeated_substring()     # 'ana'
+
+    :param text: text for which the suffix tree is built
+    :param sentinel: a unique character, not present in ``text``, appended to
+        the text so that every suffix ends at a leaf
+    """
+
     def __init__(self, text, sentinel='$'):
         self._root = Vertex(-1, -1)
-        self._active_vertex = self._root
-        self._active_edge = None
-        self._active_length = 0
         self._current_end = 0
-        self._remainder = 0
         self.text = text + sentinel
 
     def all_suffixes(self, vertex=None, prefix=''):
         if not vertex:
             vertex = self._root
 
-        prefix += self.vertex2substring(vertex)
-        if vertex.is_leaf():
-            print prefix
-        else:
-            for child in vertex.children.itervalues():
-                self.all_suffixes(child, prefix)
+        stack = [(vertex, prefix)]
+        while stack:
+            vertex, prefix = stack.pop()
+            prefix += self.vertex2substring(vertex)
+            if vertex.is_leaf():
+                print prefix
+            else:
+                for child in vertex.children.itervalues():
+                    stack.append((child, prefix))
+
+    def contains(self, pattern):
+        """Returns True if ``pattern`` is a substring of the text."""
+        return self._locate(pattern)[0] is not None
+
+    def count(self, pattern):
+        """Returns the no. of occurrences of ``pattern`` in the text.
+
+        The count is the no. of leaves below the match and is precomputed for
+        every vertex, i.e. the query takes time proportional to the length of
+        the pattern.
+        """
+        vertex = self._locate(pattern)[0]
+        return vertex.leaf_count if vertex is not None else 0
+
+    def find_all(self, pattern):
+        """Yields the starting positions of all occurrences of ``pattern`` in
+        the text.
+
+        The positions are generated lazily and in no particular order.
+        """
+        vertex, depth = self._locate(pattern)
+        if vertex is None:
+            return
+
+        length = len(self.text)
+        for leaf, leaf_depth in self._walk(vertex, depth):
+            if leaf.is_leaf():
+                yield length - leaf_depth
+
+    def longest_repeated_substring(self):
+        """Returns the longest substring which occurs at least twice in the
+        text.
+
+        A repeated substring ends at an internal vertex, so the result is the
+        path to the deepest internal vertex.
+        """
+        deepest, deepest_depth = self._root, 0
+        for vertex, depth in self._walk(self._root, 0):
+            if not vertex.is_leaf() and depth > deepest_depth:
+                deepest, deepest_depth = vertex, depth
+
+        end = deepest.right_index if deepest is not self._root else 0
+        return self.text[end - deepest_depth:end]
 
     def build(self):
-        for index, char in enumerate(self.text):
+        """Build the suffix tree in a single left to right pass of the text.
+
+        The active point (``active_vertex``, ``active_edge``,
+        ``active_length``) and the remainder are local variables as they are
+        read and written for every character of the text.
+        """
+
+        text = self.text
+        root = self._root
+        active_vertex = root
+        active_edge = 0         # Index of the first character of the edge.
+        active_length = 0
+        remainder = 0           # No. of suffixes yet to be inserted.
+
+        for index in xrange(len(text)):
+            char = text[index]
+            self._current_end = index + 1   # Extends all leaves at once.
+            remainder += 1
             previous_split_vertex = None
-            self._current_end += 1
-            self._remainder += 1
-            if self._active_edge is None:
-                self._active_edge = char
-
-            while self._remainder > 0:
-                if self._active_edge not in self._active_vertex.children:
-                    self._active_vertex.children[self._active_edge] = \
-                        Vertex(index)
-                    self._set_next_active_point()
+
+            while remainder > 0:
+                if active_length == 0:
+                    active_edge = index
+
+                child = active_vertex.children.get(text[active_edge])
+                if child is None:
+                    active_vertex.children[char] = Vertex(index)
+                    if previous_split_vertex:
+                        previous_split_vertex.suffix = active_vertex
+                        previous_split_vertex = None
                 else:
-                    child = self._active_vertex.children[self._active_edge]
-                    substring = self.vertex2substring(child)
-                    active_char = substring[self._active_length]
+                    # Canonize: walk down while the active length spans the
+                    # whole edge of the child.
+                    child_length = self.vertex_length(child)
+                    if active_length >= child_length:
+                        active_edge += child_length
+                        active_length -= child_length
+                        active_vertex = child
+                        continue
+
+                    active_char = text[child.left_index + active_length]
                     if active_char == char:
-                        # If all characters stored in the child are consumed,
-                        # start searching from the child.
-                        if len(substring) == self._active_length + 1:
-                            self._active_vertex = child
-                            self._active_edge = None
-                            self._active_length = 0
-                        else:
-                            self._active_length += 1
+                        # The suffix is already in the tree (implicitly).
+                        if previous_split_vertex and active_vertex is not root:
+                            previous_split_vertex.suffix = active_vertex
+                        active_length += 1
                         break
-                    else:
-                        child = self._split_vertex(child, active_char, char)
-                        self._set_next_active_point(
-                            substring=self.vertex2substring(child))
-
-                        # If not the first vertex split in the current
-                        # iteration, create a suffix link from the previous
-                        # splitted vertex to the current one.
-                        if previous_split_vertex:
-                            previous_split_vertex.suffix = child
-                        previous_split_vertex = child
+
+                    split_vertex = self._split_vertex(
+                        active_vertex, child, active_length, active_char,
+                        index)
+
+                    # If not the first vertex split in the current iteration,
+                    # create a suffix link from the previous split vertex to
+                    # the current one.
+                    if previous_split_vertex:
+                        previous_split_vertex.suffix = split_vertex
+                    previous_split_vertex = split_vertex
+
+                remainder -= 1
+                if active_vertex is root:
+                    if active_length > 0:
+                        active_length -= 1
+                        active_edge = index - remainder + 1
+                else:
+                    active_vertex = active_vertex.suffix or root
+
+        self._count_leaves()
 
     def vertex_length(self, vertex):
-        right = self._current_end if not vertex.right_index \
+        right = self._current_end if vertex.right_index is None \
             else vertex.right_index
         return right - vertex.left_index
 
     def vertex2substring(self, vertex):
         left = vertex.left_index
-        right = self._current_end if not vertex.right_index \
+        right = self._current_end if vertex.right_index is None \
             else vertex.right_index
-        return self.text[left:right]
+        return self.text[left:right] if left >= 0 else ''
 
-    def _canonize(self, next_active_vertex, substring):
-        self._active_vertex = next_active_vertex
+    def _count_leaves(self):
+        """Set the no. of leaves below every internal vertex."""
 
-        if not self._active_edge or self._active_edge \
-                not in self._active_vertex.children:
-            return
+        # In the reversed pre-order every vertex comes after its children.
+        internal = []
+        stack = [self._root]
+        while stack:
+            vertex = stack.pop()
+            if not vertex.is_leaf():
+                internal.append(vertex)
+                stack.extend(vertex.children.itervalues())
 
-        next_child = next_active_vertex.children[self._active_edge]
-        next_child_length = self.vertex_length(next_child)
+        for vertex in reversed(internal):
+            vertex.leaf_count = sum(child.leaf_count
+                                    for child in vertex.children.itervalues())
 
-        if self._active_length + 1 > next_child_length:
-            if len(substring) == next_child_length:
-                self._active_edge = None
-                self._active_length = 0
-            else:
-                substring = substring[next_child_length:]
-                self._active_edge = substring[0]
-                self._active_length -= next_child_length
+    def _locate(self, pattern):
+        """Match ``pattern`` from the root.
 
-            self._canonize(next_child, substring)
+        Returns the vertex at the end of the edge on which the match ends and
+        the length of the path from the root to that vertex, or (None, 0) if
+        ``pattern`` is not a substring of the text.
 
-    def _set_next_active_point(self, substring=''):
-        self._remainder -= 1
+        The sentinel is not a part of the text, so a pattern containing it is
+        not found.
+        """
+        text = self.text
+        if text[-1] in pattern:
+            return None, 0
 
-        if self._active_vertex != self._root:
-            next_active_vertex = self._root if not self._active_vertex.suffix \
-                else self._active_vertex.suffix
-            self._canonize(next_active_vertex, substring)
-        else:
-            if self._remainder > 0:
-                self._active_edge = \
-                    self.text[self._current_end - self._remainder]
-                self._active_length -= 1
-            else:
-                self._active_edge = None
+        vertex = self._root
+        depth = 0
+        matched = 0
+
+        while matched < len(pattern):
+            child = vertex.children.get(pattern[matched])
+            if child is None:
+                return None, 0
+
+            child_length = self.vertex_length(child)
+            size = min(child_length, len(pattern) - matched)
+            left = child.left_index
+            if text[left:left + size] != pattern[matched:matched + size]:
+                return None, 0
+
+            vertex = child
+            depth += child_length
+            matched += size
+
+        return vertex, depth
 
-    def _split_vertex(self, vertex, active_char, new_char):
-        """Split the input vertex and create two children."""
+    def _walk(self, vertex, depth):
+        """Yields every vertex in the subtree rooted at ``vertex`` with the
+        length of the path from the root to it.
+
+        :param depth: length of the path from the root to ``vertex``
+        """
+        stack = [(vertex, depth)]
+        while stack:
+            vertex, depth = stack.pop()
+            yield vertex, depth
+            for child in vertex.children.itervalues():
+                stack.append((child, depth + self.vertex_length(child)))
+
+    def _split_vertex(self, parent, vertex, length, active_char, index):
+        """Split the edge to ``vertex`` after ``length`` characters and add a
+        new leaf for the character at ``index``.
+        """
 
         # Create and insert the new vertex at the active vertex and active edge
-        new_vertex = Vertex(vertex.left_index,
-                            vertex.left_index + self._active_length)
-        self._active_vertex.children[self._active_edge] = new_vertex
+        new_vertex = Vertex(vertex.left_index, vertex.left_index + length)
+        parent.children[self.text[vertex.left_index]] = new_vertex
 
-        # Create a new vertex for the new character to be inserted which
-        # becomes the left child.
-        new_vertex.children[new_char] = Vertex(self._current_end - 1)
+        # Create a new vertex for the new character to be inserted.
+        new_vertex.children[self.text[index]] = Vertex(index)
 
-        # The old vertex key is updated and becomes the right child
-        vertex.left_index += self._active_length
+        # The old vertex key is updated and becomes the other child
+        vertex.left_index += length
         new_vertex.children[active_char] = vertex
 
         return new_vertex
 
 
-if __name__ == '__main__':
-    st = SuffixTree('cxccc')
+def longest_common_substring(first, second, separator='#', sentinel='$'):
+    """Returns the longest common substring of two texts.
+
+    A generalized suffix tree of both texts is built by joining them with a
+    unique separator. A common substring ends at an internal vertex which has
+    leaves from both texts below it and the result is the deepest such
+    vertex.
+
+    :param separator: a unique character present in neither text
+    :param sentinel: a unique character present in neither text
+    """
+    st = SuffixTree(first + separator + second, sentinel)
     st.build()
-    st.all_suffixes()
+
+    # Bit 1 marks a suffix of the first text and bit 2 of the second.
+    length = len(st.text)
+    boundary = len(first)
+    masks = {}
+    deepest, deepest_depth = None, 0
+
+    vertices = list(st._walk(st._root, 0))
+    for vertex, depth in reversed(vertices):
+        if vertex.is_leaf():
+            masks[vertex] = 1 if length - depth <= boundary else 2
+        else:
+            mask = 0
+            for child in vertex.children.itervalues():
+                mask |= masks.pop(child)
+            masks[vertex] = mask
+            if mask == 3 and depth > deepest_depth:
+                deepest, deepest_depth = vertex, depth
+
+    if deepest is None:
+        return ''
+    return st.text[deepest.right_index - deepest_depth:deepest.right_index]
+
+
+if __name__ == '__main__':
+    # Benchmark the construction on random texts. Sizes (in MB) can be passed
+    # as arguments, e.g. ``python suffix_tree.py 1 10 100``.
+    import random
+    import sys
+    import time
+
+    sizes = [float(arg) for arg in sys.argv[1:]] or [0.1, 1]
+    for size in sizes:
+        length = int(size * 1024 * 1024)
+        text = ''.join(random.choice('acgt') for _ in xrange(length))
+        st = SuffixTree(text)
+        start = time.time()
+        st.build()
+        print '{0:>8.1f} MB: {1:.2f}s'.format(size, time.time() - start)
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.treap
+    ~~~~~~~~~~~~~~~~~~~~
+
+    This module implements the Treap data structure.
+
+    A treap is a binary search tree on the keys and a max-heap on random
+    priorities assigned to the nodes, which makes its shape that of a binary
+    search tree built by inserting the keys in a random order. Its expected
+    height is O(log n) for any sequence of operations.
+
+    The tree is modified only by splitting a subtree at a key and merging two
+    subtrees, in O(log n) expected time each. An insert splits the tree at
+    the key and merges the two parts with the new node, and a delete replaces
+    the node by the merge of its children.
+
+    References:
+    - Seidel, Aragon: Randomized Search Trees, Algorithmica 1996
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import random
+
+import binary_search_tree
+from order_statistics_tree import OrderStatistics, Weighted
+
+
+class Node(binary_search_tree.Node):
+    """A node in a treap with a random priority."""
+
+    def __init__(self, key):
+        super(Node, self).__init__(key)
+        self.priority = random.random()
+
+
+class WeightedNode(Weighted, Node):
+    """A node in a treap which maintains the weight of its subtree."""
+
+
+class Treap(binary_search_tree.BinarySearchTree):
+    """Represents a treap which is a binary search tree."""
+
+    @classmethod
+    def from_sorted(cls, keys, node_type):
+        """Builds a balanced tree from keys in increasing order in O(n log n)
+        time.
+
+        The random priorities of the nodes are sorted and assigned in level
+        order, so the priority of a node is not lower than the priorities of
+        its children.
+
+        :param keys: iterable of keys in strictly increasing order
+        :param node_type: type of the nodes of the tree
+        """
+        tree = super(Treap, cls).from_sorted(keys, node_type)
+
+        nodes = [tree.root] if tree.root else []
+        for node in nodes:
+            nodes.extend(child for child in (node.left, node.right) if child)
+        priorities = sorted((node.priority for node in nodes), reverse=True)
+        for node, priority in zip(nodes, priorities):
+            node.priority = priority
+        return tree
+
+    def insert(self, key):
+        """Inserts key ``key`` in the tree."""
+        node = self._Node(key)
+
+        # Descend to the first node with a lower priority, which is replaced
+        # by the new node with the split of its subtree as the children.
+        parent = None
+        current = self.root
+        while current and current.priority > node.priority:
+            parent = current
+            current = current.left if key < current.key else current.right
+
+        node.left, node.right = self._split(current, key)
+        node.update()
+        if not parent:
+            self.root = node
+            node.parent = None
+        elif key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+        self._bubble_up_node_attrs(parent)
+
+    def delete(self, key):
+        """Deletes key ``key`` from the tree."""
+        node = self._search_node(key, silent=False)
+        parent = node.parent
+        self._replace_child(parent, node, self._merge(node.left, node.right))
+        self._bubble_up_node_attrs(parent)
+
+    def join(self, other):
+        """Moves all the keys of ``other``, which must not be smaller than the
+        keys in the tree, to the tree. ``other`` becomes empty.
+        """
+        if self.root and other.root and \
+                other._min_node(other.root).key < \
+                self._max_node(self.root).key:
+            raise ValueError('Keys of the joined tree must not be smaller '
+                             'than the keys in the tree')
+
+        self._replace_child(None, None, self._merge(self.root, other.root))
+        other.root = None
+
+    def split(self, key):
+        """Splits the tree at ``key``. The keys smaller than ``key`` remain in
+        the tree and the other keys are moved to a new tree, which is
+        returned.
+        """
+        smaller, larger = self._split(self.root, key)
+        self._replace_child(None, None, smaller)
+
+        tree = self.__class__(self._Node)
+        tree._replace_child(None, None, larger)
+        return tree
+
+    def is_balanced(self):
+        """Returns true if the priority of every node is not lower than the
+        priorities of its children, i.e. the tree is a valid treap.
+        """
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            for child in (node.left, node.right):
+                if child:
+                    if child.priority > node.priority:
+                        return False
+                    stack.append(child)
+        return True
+
+    def _split(self, node, key):
+        """Splits a subtree at ``key`` and returns the roots of the subtrees
+        with the keys smaller than ``key`` and the rest.
+        """
+        if not node:
+            return None, None
+
+        if node.key < key:
+            smaller, larger = self._split(node.right, key)
+            node.right = smaller
+            node.update()
+            return node, larger
+        else:
+            smaller, larger = self._split(node.left, key)
+            node.left = larger
+            node.update()
+            return smaller, node
+
+    def _merge(self, left, right):
+        """Merges two subtrees, where the keys of ``left`` are not greater
+        than the keys of ``right``, and returns the root.
+        """
+        if not left:
+            return right
+        if not right:
+            return left
+
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            left.update()
+            return left
+        else:
+            right.left = self._merge(left, right.left)
+            right.update()
+            return right
+
+    def _replace_child(self, parent, node, child):
+        """Replaces ``node`` by ``child`` (which may be None) as a child of
+        ``parent``.
+        """
+        if not parent:
+            self.root = child
+            if child:
+                child.parent = None
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+
+    def _bubble_up_node_attrs(self, node):
+        """Updates node attributes (e.g. the weight) up to the root."""
+        while node:
+            node.update()
+            node = node.parent
+
+
+class OrderStatisticsTreap(OrderStatistics, Treap):
+    """Implements an Order statistics tree which is also a treap.
+
+    The nodes must be ``WeightedNode``.
+    """
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+"""
+    zahlen.ds.tree.wavelet_tree
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    This module implements the Wavelet Tree data structure, which answers the
+    k-th smallest element within a range and the no. of elements smaller than
+    a value within a range of a list which is not modified.
+
+    The elements are replaced by their rank among the distinct elements, so an
+    element is a code of log(σ) bits for σ distinct elements. The tree is
+    stored level by level (also known as the wavelet matrix): level j is a bit
+    vector of the j-th most significant bit of every code, with the codes
+    stably partitioned by the bits of the previous levels, zeros first. A query
+    descends one level at a time by mapping a range to the zeros or the ones of
+    the next level with two rank operations, so it takes O(log σ) time.
+
+    A bit vector packs the bits in 32-bit words and stores the no. of set bits
+    before every word, which answers a rank in O(1) time.
+
+    References:
+    - http://en.wikipedia.org/wiki/Wavelet_Tree
+    - Claude, Navarro: The Wavelet Matrix, SPIRE 2012
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from array import array
+from bisect import bisect_left
+
+
+_WORD_SIZE = 32
+
+
+class _BitVector(object):
+    """A bit vector with O(1) rank support."""
+
+    def __init__(self, bits):
+        """
+        :param bits: list of 0 or 1
+        """
+        size = len(bits)
+        self._words = array('L', [0]) * (size // _WORD_SIZE + 1)
+        for position, bit in enumerate(bits):
+            if bit:
+                self._words[position >> 5] |= 1 << (position & 31)
+
+        # No. of set bits before every word.
+        self._ranks = array('l')
+        rank = 0
+        for word in self._words:
+            self._ranks.append(rank)
+            rank += bin(word).count('1')
+        self.ones = rank
+
+    def rank(self, position):
+        """Returns the no. of set bits before ``position``."""
+        word = position >> 5
+        return self._ranks[word] + bin(
+            self._words[word] & ((1 << (position & 31)) - 1)).count('1')
+
+
+class WaveletTree(object):
+    """Construct a wavelet tree.
+
+    Example usage::
+        elements = [5, 1, 4, 1, 3, 9, 2]
+
+        wt = WaveletTree(elements)
+
+        # The 2nd smallest element within the range [1, 4] (i.e. 1)
+        wt.kth_smallest(1, 4, 2)
+
+        # No. of elements smaller than 4 within the range [0, 6] (i.e. 4)
+        wt.count_less(0, 6, 4)
+    """
+
+    def __init__(self, elements):
+
+        if not elements:
+            raise ValueError('Expected a non-empty list of input elements')
+
+        self._size = len(elements)
+        self._alphabet = sorted(set(elements))
+        self._depth = max(1, (len(self._alphabet) - 1).bit_length())
+
+        ranks = dict((element, rank)
+                     for rank, element in enumerate(self._alphabet))
+        codes = [ranks[element] for element in elements]
+
+        # Level j holds the bit (depth - 1 - j) of the codes.
+        self._levels = []
+        self._zeros = []
+        for shift in xrange(self._depth - 1, -1, -1):
+            bits = [(code >> shift) & 1 for code in codes]
+            level = _BitVector(bits)
+            self._levels.append(level)
+            self._zeros.append(self._size - level.ones)
+            codes = [code for code, bit in zip(codes, bits) if not bit] + \
+                [code for code, bit in zip(codes, bits) if bit]
+
+    def __len__(self):
+        return self._size
+
+    def kth_smallest(self, start, end, k):
+        """Return the k-th smallest element within the specified range.
+
+        :param start: range start index
+        :param end: range end index
+        :param k: rank of the element within the range, starting at 1
+        """
+
+        self._check_range(start, end)
+        end += 1
+        if not 1 <= k <= end - start:
+            raise IndexError('Rank must be a positive value less than: '
+                             '{0}'.format(end - start + 1))
+
+        code = 0
+        for level, zeros in zip(self._levels, self._zeros):
+            start_ones = level.rank(start)
+            end_ones = level.rank(end)
+            range_zeros = (end - start) - (end_ones - start_ones)
+            code <<= 1
+            if k <= range_zeros:
+                start -= start_ones
+                end -= end_ones
+            else:
+                k -= range_zeros
+                code |= 1
+                start = zeros + start_ones
+                end = zeros + end_ones
+        return self._alphabet[code]
+
+    def count_less(self, start, end, value):
+        """Return the no. of elements smaller than ``value`` within the
+        specified range.
+
+        :param start: range start index
+        :param end: range end index
+        :param value: any value comparable with the elements
+        """
+
+        self._check_range(start, end)
+        end += 1
+
+        code = bisect_left(self._alphabet, value)
+        if code == len(self._alphabet):
+            return end - start
+
+        count = 0
+        shift = self._depth
+        for level, zeros in zip(self._levels, self._zeros):
+            shift -= 1
+            start_ones = level.rank(start)
+            end_ones = level.rank(end)
+            if (code >> shift) & 1:
+                # All the codes with a 0 at this bit are smaller.
+                count += (end - start) - (end_ones - start_ones)
+                start = zeros + start_ones
+                end = zeros + end_ones
+            else:
+                start -= start_ones
+                end -= end_ones
+        return count
+
+    def _check_range(self, start, end):
+        if not 0 <= start <= end:
+            raise IndexError("Invalid start index:" + str(start))
+
+        if not start <= end < self._size:
+            raise IndexError("Invalid end index: " + str(end))
+
+
+if __name__ == '__main__':
+    # Benchmark the queries against sorting the slice of every range. The no.
+    # of elements can be passed as an argument.
+    import random
+    import sys
+    import time
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    elements = [random.randint(0, size) for _ in xrange(size)]
+    queries = []
+    for _ in xrange(1000):
+        start, end = sorted((random.randrange(size), random.randrange(size)))
+        queries.append((start, end, random.randint(1, end - start + 1)))
+
+    start = time.time()
+    wt = WaveletTree(elements)
+    print 'WaveletTree build {0:.2f}s'.format(time.time() - start)
+
+    def naive_kth_smallest(start, end, k):
+        return sorted(elements[start:end + 1])[k - 1]
+
+    def naive_count_less(start, end, value):
+        return bisect_left(sorted(elements[start:end + 1]), value)
+
+    for name, function, naive in [
+            ('kth_smallest', wt.kth_smallest, naive_kth_smallest),
+            ('count_less', wt.count_less, naive_count_less)]:
+        timings = []
+        for query in [function, naive]:
+            start = time.time()
+            for left, right, k in queries:
+                query(left, right, k)
+            timings.append(len(queries) / (time.time() - start))
+        print '{0:<14} {1:.0f} queries/s, sorted slice {2:.0f} ' \
+            'queries/s'.format(name, timings[0], timings[1])
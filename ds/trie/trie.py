@@ -24,6 +24,67 @@ class Trie(object):
     def __init__(self):
         self._root = Vertex('')
 
+    @classmethod
+    def from_sorted(cls, words):
+        """Build a trie from an iterable of words in sorted order.
+
+        Consecutive sorted words share their common prefix, so the vertices on
+        the path of the previous word are kept on a stack and only the
+        remaining characters of a word create new vertices. The prefix counts
+        of the shared vertices are deferred and pushed down the stack when the
+        path is unwound, which makes the construction linear in the size of the
+        input. The words are consumed one at a time and never held in memory.
+
+        :param words: iterable of words sorted in ascending order
+        """
+
+        trie = cls()
+        path = [trie._root]     # Vertices on the path of the previous word.
+        pending = [0]           # Deferred prefix counts for the path vertices.
+        previous = ''
+
+        for word in words:
+            if word < previous:
+                raise ValueError('Words are not sorted: {0!r} follows {1!r}'
+                                 .format(word, previous))
+            if not word:
+                continue
+
+            common = 0
+            limit = min(len(word), len(previous))
+            while common < limit and word[common] == previous[common]:
+                common += 1
+
+            trie._unwind(path, pending, common + 1)
+
+            vertex = path[-1]
+            for index in xrange(common, len(word)):
+                key = word[index]
+                next_vertex = Vertex(key)
+                vertex.edges[key] = next_vertex
+                path.append(next_vertex)
+                pending.append(0)
+                vertex = next_vertex
+
+            vertex.word_count += 1
+            pending[-1] += 1
+            previous = word
+
+        trie._unwind(path, pending, 1)
+        return trie
+
+    @staticmethod
+    def _unwind(path, pending, depth):
+        """Pop vertices from the path until ``depth`` vertices remain, adding
+        the deferred prefix counts to every popped vertex.
+        """
+
+        carry = 0
+        while len(path) > depth:
+            carry += pending.pop()
+            path.pop().prefix_count += carry
+        pending[-1] += carry
+
     def add_word(self, word, vertex=None):
         """Add a word to the trie."""
 
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.heap.min_max_median_heap
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.heap.min_max_median_heap import (MinMaxMedianHeap,
+                                                SlidingWindowMedian)
+
+from collections import deque
+import random
+import unittest
+
+
+def nearest_rank(values, percentile=50):
+    values = sorted(values)
+    k = -(-percentile * len(values) // 100)
+    return values[max(1, int(k)) - 1]
+
+
+class TestMinMaxMedianHeap(unittest.TestCase):
+    def test_min_median_max(self):
+        mmmh = MinMaxMedianHeap([5, 1, 4])
+        self.assertEqual(len(mmmh), 3)
+        self.assertEqual(mmmh.min(), 1)
+        self.assertEqual(mmmh.median(), 4)
+        self.assertEqual(mmmh.max(), 5)
+
+        # The smaller of the two mid values.
+        mmmh.insert(3)
+        self.assertEqual(mmmh.median(), 3)
+
+    def test_single_value(self):
+        mmmh = MinMaxMedianHeap()
+        mmmh.insert(7)
+        self.assertEqual((mmmh.min(), mmmh.median(), mmmh.max()), (7, 7, 7))
+        self.assertEqual(mmmh.delete_max(), 7)
+        self.assertEqual(len(mmmh), 0)
+
+    def test_empty_heap(self):
+        mmmh = MinMaxMedianHeap()
+        self.assertRaises(ValueError, mmmh.median)
+        self.assertRaises(ValueError, mmmh.delete_min)
+        self.assertRaises(KeyError, mmmh.delete, 1)
+
+    def test_invalid_percentile(self):
+        self.assertRaises(ValueError, MinMaxMedianHeap, percentile=101)
+
+    def test_delete_min_median_max(self):
+        rand = random.Random(73)
+        values = [rand.randrange(100) for _ in xrange(200)]
+        mmmh = MinMaxMedianHeap(values)
+        while values:
+            values.sort()
+            operation = rand.randrange(3)
+            if operation == 0:
+                self.assertEqual(mmmh.delete_min(), values.pop(0))
+            elif operation == 1:
+                self.assertEqual(mmmh.delete_median(),
+                                 values.pop((len(values) - 1) // 2))
+            else:
+                self.assertEqual(mmmh.delete_max(), values.pop())
+            self.assertEqual(len(mmmh), len(values))
+            if values:
+                self.assertEqual(mmmh.median(), nearest_rank(values))
+
+    def test_delete(self):
+        rand = random.Random(79)
+        for percentile in [0, 25, 50, 90, 100]:
+            values = [rand.randrange(50) for _ in xrange(300)]
+            mmmh = MinMaxMedianHeap(values, percentile=percentile)
+            rand.shuffle(values)
+            while values:
+                mmmh.delete(values.pop())
+                self.assertEqual(len(mmmh), len(values))
+                if values:
+                    self.assertEqual(mmmh.min(), min(values))
+                    self.assertEqual(mmmh.max(), max(values))
+                    self.assertEqual(mmmh.median(),
+                                     nearest_rank(values, percentile))
+                if rand.random() < 0.3:
+                    value = rand.randrange(50)
+                    mmmh.insert(value)
+                    values.append(value)
+
+    def test_delete_missing_value(self):
+        mmmh = MinMaxMedianHeap([1, 2, 8, 9])
+        self.assertRaises(KeyError, mmmh.delete, 0)
+        self.assertRaises(KeyError, mmmh.delete, 5)
+        self.assertRaises(KeyError, mmmh.delete, 10)
+
+
+class TestSlidingWindowMedian(unittest.TestCase):
+    def test_expire(self):
+        swm = SlidingWindowMedian(60)
+        swm.insert(0, 12.5)
+        swm.insert(30, 10.0)
+        self.assertEqual(swm.median(), 10.0)
+        self.assertEqual(swm.max(), 12.5)
+
+        swm.insert(60, 11.0)
+        self.assertEqual(len(swm), 2)
+        self.assertEqual(swm.median(), 10.0)
+        self.assertEqual(swm.min(), 10.0)
+        self.assertEqual(swm.max(), 11.0)
+
+        swm.expire(120)
+        self.assertEqual(len(swm), 0)
+
+    def test_stream(self):
+        rand = random.Random(83)
+        for window, percentile in [(1, 50), (20, 50), (50, 95), (50, 5)]:
+            swm = SlidingWindowMedian(window, percentile)
+            events = deque()
+            timestamp = 0
+            for _ in xrange(1000):
+                timestamp += rand.randrange(3)
+                value = rand.randrange(100)
+                swm.insert(timestamp, value)
+
+                events.append((timestamp, value))
+                while events[0][0] <= timestamp - window:
+                    events.popleft()
+                self.assertEqual(len(swm), len(events))
+                self.assertEqual(swm.median(), nearest_rank(
+                    [value for _, value in events], percentile))
+
+    def test_invalid_events(self):
+        self.assertRaises(ValueError, SlidingWindowMedian, 0)
+        swm = SlidingWindowMedian(10)
+        swm.insert(5, 1)
+        self.assertRaises(ValueError, swm.insert, 4, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.array_avl_tree
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.array_avl_tree import (ArrayAVLTree,
+                                           ArrayOrderStatisticsTree,
+                                           NodePool)
+from test_avl_tree import get_avl
+
+import random
+import unittest
+
+
+class TestNodePool(unittest.TestCase):
+    def test_free_list(self):
+        pool = NodePool()
+        nodes = [pool.allocate(key) for key in 'abc']
+        self.assertEqual(nodes, [0, 1, 2])
+        pool.release(1)
+        pool.release(0)
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(pool.allocate('d'), 0)
+        self.assertEqual(pool.allocate('e'), 1)
+        self.assertEqual(pool.allocate('f'), 3)
+        self.assertEqual(pool.keys, ['d', 'e', 'c', 'f'])
+        self.assertEqual(pool.left[1], -1)
+        self.assertIsNone(pool.weight)
+
+
+class TestArrayAVLTree(unittest.TestCase):
+    def assert_same_shape(self, tree, avl):
+        pool = tree._pool
+
+        def walk(node, expected):
+            if node == -1:
+                self.assertIsNone(expected)
+                return
+            self.assertEqual(pool.keys[node], expected.key)
+            self.assertEqual(pool.height[node], expected.height)
+            walk(pool.left[node], expected.left)
+            walk(pool.right[node], expected.right)
+
+        walk(tree._root, avl.root)
+
+    def test_same_shape_as_avl_tree(self):
+        keys = random.sample(xrange(1000), 300)
+        tree = ArrayAVLTree('l')
+        avl = get_avl(keys)
+        for key in keys:
+            tree.insert(key)
+        self.assert_same_shape(tree, avl)
+
+        random.shuffle(keys)
+        for key in keys[:200]:
+            tree.delete(key)
+            avl.delete(key)
+        self.assert_same_shape(tree, avl)
+        self.assertTrue(tree.is_balanced())
+        self.assertEqual(tree.sorted_keys(), sorted(keys[200:]))
+        self.assertEqual(len(tree), 100)
+
+    def test_reuse_deleted_nodes(self):
+        tree = ArrayAVLTree()
+        for key in xrange(100):
+            tree.insert(key)
+        for key in xrange(0, 100, 2):
+            tree.delete(key)
+        for key in xrange(100, 150):
+            tree.insert(key)
+        self.assertEqual(len(tree._pool.left), 100)
+        self.assertTrue(tree.is_balanced())
+        self.assertEqual(tree.sorted_keys(),
+                         range(1, 100, 2) + range(100, 150))
+
+    def test_search_and_delete_all(self):
+        tree = ArrayAVLTree()
+        self.assertEqual(tree.height, -1)
+        self.assertEqual(list(tree), [])
+        for key in 'zahlen':
+            tree.insert(key)
+        self.assertTrue(tree.search('h'))
+        self.assertFalse(tree.search('x'))
+        self.assertRaises(KeyError, tree.delete, 'x')
+        for key in 'zahlen':
+            tree.delete(key)
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(tree.sorted_keys(), [])
+
+
+class TestArrayOrderStatisticsTree(unittest.TestCase):
+    def test_order_statistics(self):
+        keys = random.sample(xrange(1000), 200)
+        tree = ArrayOrderStatisticsTree()
+        for key in keys:
+            tree.insert(key)
+        for key in keys[:50]:
+            tree.delete(key)
+
+        remaining = sorted(keys[50:])
+        for k, key in enumerate(remaining, 1):
+            self.assertEqual(tree.kth_smallest_key(k), key)
+            self.assertEqual(tree.rank(key), k - 1)
+        self.assertEqual(tree.rank(-1), 0)
+        self.assertEqual(tree.rank(1000), 150)
+        self.assertRaises(IndexError, tree.kth_smallest_key, 0)
+        self.assertRaises(IndexError, tree.kth_smallest_key, 151)
+        self.assertRaises(Exception, ArrayOrderStatisticsTree().
+                          kth_smallest_key, 1)
+
+    def test_memory_per_node(self):
+        tree = ArrayOrderStatisticsTree('l')
+        for key in xrange(10000):
+            tree.insert(key)
+        self.assertLess(tree.memory_per_node(), 40)
@@ -10,6 +10,8 @@
 from zahlen.ds.tree.avl_tree import AVLTree, Node
 from test_binary_search_tree import BSTTestCase
 
+import random
+
 
 def get_avl(keys):
     avl = AVLTree(Node)
@@ -117,4 +119,154 @@ class TestDelete(AVLTestCase):
         actual = get_avl([16, 10, 25, 6, 14, 18, 28, 15, 17, 27, 29, 30])
         actual.delete(10)
         expected = get_balanced_bst([25, 16, 28, 14, 18, 27, 29, 6, 15, 17, 30])
-        self.assert_tree(actual, expected)
\ No newline at end of file
+        self.assert_tree(actual, expected)
+
+
+class TestFromSorted(AVLTestCase):
+    def test_same_structure_as_inserts(self):
+        actual = AVLTree.from_sorted(xrange(1, 8), Node)
+        expected = get_balanced_bst([4, 2, 6, 1, 3, 5, 7])
+        self.assert_tree(actual, expected)
+
+    def test_balanced(self):
+        for size in xrange(1, 40):
+            avl = AVLTree.from_sorted(xrange(size), Node)
+            self.assertTrue(avl.is_balanced())
+            self.assertEqual(avl.root.height, size.bit_length() - 1)
+
+    def test_insert_and_delete_after_build(self):
+        avl = AVLTree.from_sorted(xrange(0, 100, 2), Node)
+        for key in xrange(1, 100, 2):
+            avl.insert(key)
+        for key in xrange(0, 60):
+            avl.delete(key)
+        self.assertTrue(avl.is_balanced())
+        self.assertListEqual(avl.sorted_keys(), range(60, 100))
+
+
+def assert_valid_avl(test, avl):
+    """Recomputes the height (and the weight, if any) of every node and
+    checks the parent pointers, the key order and the balance.
+    """
+    def check(node, parent):
+        if not node:
+            return -1, 0
+        test.assertIs(node.parent, parent)
+        if node.left:
+            test.assertLess(node.left.key, node.key)
+        if node.right:
+            test.assertLess(node.key, node.right.key)
+
+        left_height, left_weight = check(node.left, node)
+        right_height, right_weight = check(node.right, node)
+        test.assertLessEqual(abs(left_height - right_height), 1)
+        test.assertEqual(node.height, 1 + max(left_height, right_height))
+        weight = 1 + left_weight + right_weight
+        if hasattr(node, 'weight'):
+            test.assertEqual(node.weight, weight)
+        return node.height, weight
+
+    check(avl.root, None)
+
+
+def assert_valid_weights(test, root):
+    """Checks the parent pointers and recomputes the weight of every node of
+    a subtree.
+    """
+    def check(node, parent):
+        if not node:
+            return 0
+        test.assertIs(node.parent, parent)
+        weight = 1 + check(node.left, node) + check(node.right, node)
+        test.assertEqual(node.weight, weight)
+        return weight
+
+    check(root, None)
+
+
+class TestJoinSplit(AVLTestCase):
+    def test_join(self):
+        for left_size, right_size in [(0, 5), (5, 0), (1, 1), (1, 30),
+                                      (30, 1), (100, 7), (7, 100)]:
+            left = AVLTree.from_sorted(xrange(left_size), Node)
+            right = get_avl(xrange(left_size, left_size + right_size))
+            left.join(right)
+            assert_valid_avl(self, left)
+            self.assertListEqual(left.sorted_keys(),
+                                 range(left_size + right_size))
+            self.assertIsNone(right.root)
+
+    def test_join_overlapping_keys(self):
+        left = get_avl([1, 5, 9])
+        self.assertRaises(ValueError, left.join, get_avl([9, 10]))
+
+    def test_split(self):
+        keys = range(0, 200, 2)
+        for key in [-1, 0, 1, 50, 51, 198, 199, 500]:
+            avl = get_avl(keys)
+            larger = avl.split(key)
+            assert_valid_avl(self, avl)
+            assert_valid_avl(self, larger)
+            self.assertListEqual(avl.sorted_keys(),
+                                 [k for k in keys if k < key])
+            self.assertListEqual(larger.sorted_keys(),
+                                 [k for k in keys if k >= key])
+            self.assertIsInstance(larger, AVLTree)
+
+    def test_split_then_join(self):
+        avl = AVLTree.from_sorted(xrange(100), Node)
+        larger = avl.split(37)
+        larger.insert(1000)
+        avl.insert(-5)
+        avl.join(larger)
+        assert_valid_avl(self, avl)
+        self.assertListEqual(avl.sorted_keys(), [-5] + range(100) + [1000])
+
+
+class TestSetOperations(AVLTestCase):
+    def setUp(self):
+        self.first = set(random.sample(xrange(500), 200))
+        self.second = set(random.sample(xrange(500), 150))
+
+    def test_union(self):
+        avl = get_avl(self.first)
+        avl.union(get_avl(self.second))
+        assert_valid_avl(self, avl)
+        self.assertListEqual(avl.sorted_keys(),
+                             sorted(self.first | self.second))
+
+    def test_intersection(self):
+        avl = get_avl(self.first)
+        avl.intersection(get_avl(self.second))
+        assert_valid_avl(self, avl)
+        self.assertListEqual(avl.sorted_keys(),
+                             sorted(self.first & self.second))
+
+    def test_difference(self):
+        avl = get_avl(self.first)
+        avl.difference(get_avl(self.second))
+        assert_valid_avl(self, avl)
+        self.assertListEqual(avl.sorted_keys(),
+                             sorted(self.first - self.second))
+
+    def test_empty_trees(self):
+        avl = get_avl([1, 2, 3])
+        avl.union(AVLTree(Node))
+        self.assertListEqual(avl.sorted_keys(), [1, 2, 3])
+        avl.difference(AVLTree(Node))
+        self.assertListEqual(avl.sorted_keys(), [1, 2, 3])
+        avl.intersection(AVLTree(Node))
+        self.assertIsNone(avl.root)
+
+
+class TestIteration(AVLTestCase):
+    def test_iteration_after_rotations(self):
+        keys = random.sample(xrange(1000), 300)
+        avl = get_avl(keys)
+        for key in keys[:100]:
+            avl.delete(key)
+        remaining = sorted(keys[100:])
+        self.assertListEqual(list(avl), remaining)
+        self.assertListEqual(list(reversed(avl)), remaining[::-1])
+        self.assertListEqual(list(avl.irange(250, 750)),
+                             [key for key in remaining if 250 <= key <= 750])
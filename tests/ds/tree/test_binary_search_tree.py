@@ -224,4 +224,89 @@ class TestSort(unittest.TestCase):
 
     def test_tree_with_multiple_elements(self):
         bst = create_bst([2, 1, 4, 5, 3])
-        self.assertListEqual(bst.sorted_keys(), [1, 2, 3, 4, 5])
\ No newline at end of file
+        self.assertListEqual(bst.sorted_keys(), [1, 2, 3, 4, 5])
+
+
+class TestFromSorted(BSTTestCase):
+    def test_empty_tree(self):
+        bst = BinarySearchTree.from_sorted([], Node)
+        self.assertIsNone(bst.root)
+
+    def test_balanced_structure(self):
+        actual = BinarySearchTree.from_sorted(xrange(1, 8), Node)
+        expected = create_bst([4, 2, 6, 1, 3, 5, 7])
+        self.assert_tree(actual, expected)
+        self.assertListEqual(actual.sorted_keys(), range(1, 8))
+
+    def test_insert_and_delete_after_build(self):
+        bst = BinarySearchTree.from_sorted([2, 4, 6, 8], Node)
+        bst.insert(5)
+        bst.delete(4)
+        self.assertListEqual(bst.sorted_keys(), [2, 5, 6, 8])
+
+    def test_unsorted_keys(self):
+        self.assertRaises(ValueError, BinarySearchTree.from_sorted,
+                          [1, 3, 2], Node)
+        self.assertRaises(ValueError, BinarySearchTree.from_sorted,
+                          [1, 2, 2], Node)
+
+
+class TestIteration(unittest.TestCase):
+    def setUp(self):
+        self.keys = [8, 3, 2, 5, 4, 6, 1, 12, 13, 10, 11]
+        self.bst = create_bst(self.keys)
+
+    def test_iter(self):
+        self.assertListEqual(list(self.bst), sorted(self.keys))
+        self.assertListEqual(list(reversed(self.bst)),
+                             sorted(self.keys, reverse=True))
+        self.assertListEqual(list(create_bst([])), [])
+        self.assertListEqual(list(reversed(create_bst([]))), [])
+
+    def test_degenerate_tree(self):
+        keys = range(5000)
+        bst = create_bst(keys)
+        self.assertListEqual(bst.sorted_keys(), keys)
+        self.assertListEqual(list(reversed(bst)), keys[::-1])
+
+    def test_iter_after_delete(self):
+        self.bst.delete(8)
+        self.bst.delete(1)
+        self.bst.delete(12)
+        self.assertListEqual(list(self.bst), [2, 3, 4, 5, 6, 10, 11, 13])
+
+    def test_irange(self):
+        irange = self.bst.irange
+        self.assertListEqual(list(irange(4, 10)), [4, 5, 6, 8, 10])
+        self.assertListEqual(list(irange(4, 10, (False, False))),
+                             [5, 6, 8])
+        self.assertListEqual(list(irange(7, 9)), [8])
+        self.assertListEqual(list(irange(7, 7)), [])
+        self.assertListEqual(list(irange(high=3)), [1, 2, 3])
+        self.assertListEqual(list(irange(low=11)), [11, 12, 13])
+        self.assertListEqual(list(irange()), sorted(self.keys))
+        self.assertListEqual(list(irange(4, 10, reverse=True)),
+                             [10, 8, 6, 5, 4])
+        self.assertListEqual(list(irange(4, 10, (False, False), True)),
+                             [8, 6, 5])
+        self.assertListEqual(list(irange(high=2, reverse=True)), [2, 1])
+        self.assertListEqual(list(create_bst([]).irange(1, 5)), [])
+
+    def test_irange_is_lazy(self):
+        keys = self.bst.irange(2)
+        self.assertEqual(next(keys), 2)
+        self.assertEqual(next(keys), 3)
+
+    def test_neighbours(self):
+        bst = self.bst
+        self.assertEqual(bst.floor(7), 6)
+        self.assertEqual(bst.floor(8), 8)
+        self.assertIsNone(bst.floor(0))
+        self.assertEqual(bst.ceiling(7), 8)
+        self.assertEqual(bst.ceiling(8), 8)
+        self.assertIsNone(bst.ceiling(14))
+        self.assertEqual(bst.predecessor(8), 6)
+        self.assertIsNone(bst.predecessor(1))
+        self.assertEqual(bst.successor(8), 10)
+        self.assertEqual(bst.successor(9), 10)
+        self.assertIsNone(bst.successor(13))
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.binary_search_tree_with_dup
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.binary_search_tree_with_dup import (
+    BinarySearchTreeDupKeys, Node)
+
+import unittest
+
+
+def create_bst(keys):
+    bst = BinarySearchTreeDupKeys(Node)
+    for key in keys:
+        bst.insert(key)
+    return bst
+
+
+class TestBinarySearchTreeDupKeys(unittest.TestCase):
+    def test_insert(self):
+        bst = create_bst([5, 3, 5, 8, 3, 5])
+        self.assertListEqual(bst.sorted_keys(), [3, 5, 8])
+        self.assertEqual(bst.count(5), 3)
+        self.assertEqual(bst.count(3), 2)
+        self.assertEqual(bst.count(4), 0)
+        self.assertEqual(str(bst.root), 'key:5,count:3,parent:-1')
+
+    def test_insert_many(self):
+        bst = create_bst([5])
+        bst.insert_many(5, 4)
+        bst.insert_many(7, 2)
+        self.assertEqual(bst.count(5), 5)
+        self.assertEqual(bst.count(7), 2)
+        self.assertRaises(ValueError, bst.insert_many, 1, 0)
+
+    def test_delete(self):
+        bst = create_bst([5, 3, 5, 8, 3, 8, 8, 9])
+        bst.delete(5)
+        self.assertEqual(bst.count(5), 1)
+        bst.delete(8, delete_all=True)
+        self.assertListEqual(bst.sorted_keys(), [3, 5, 9])
+
+        # The successor of the root moves with its count.
+        bst.insert_many(7, 3)
+        bst.delete(5)
+        self.assertEqual(bst.root.key, 7)
+        self.assertEqual(bst.count(7), 3)
+        self.assertRaises(KeyError, bst.delete, 5)
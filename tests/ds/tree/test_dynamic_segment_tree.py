@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.dynamic_segment_tree
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.dynamic_segment_tree import DynamicSegmentTree
+from zahlen.ds.tree.lazy_segment_tree import MAX, Monoid, SUM
+
+import random
+import unittest
+
+
+class TestDynamicSegmentTree(unittest.TestCase):
+    def test_exceptions(self):
+        self.assertRaises(ValueError, DynamicSegmentTree, 5, 4)
+        st = DynamicSegmentTree(0, 100)
+        self.assertRaises(IndexError, st.update, 101, 1)
+        self.assertRaises(IndexError, st.update, -1, 1)
+        self.assertRaises(IndexError, st.query, -1, 5)
+        self.assertRaises(IndexError, st.query, 6, 5)
+        self.assertRaises(IndexError, st.query, 5, 101)
+
+    def test_empty_tree(self):
+        st = DynamicSegmentTree(0, 2 ** 62)
+        self.assertEqual(st.query(0, 2 ** 62), 0)
+        self.assertEqual(len(st), 1)
+
+    def test_huge_range(self):
+        st = DynamicSegmentTree(0, 2 ** 62)
+        st.update(1400000000, 5)
+        st.update(2 ** 61, 7)
+        st.update(3, 1)
+        self.assertEqual(st.query(0, 2 ** 62), 13)
+        self.assertEqual(st.query(4, 2 ** 61 - 1), 5)
+        self.assertEqual(st.query(1400000001, 2 ** 62), 7)
+        self.assertLessEqual(len(st), 1 + 3 * 62)
+
+    def test_negative_coordinates(self):
+        st = DynamicSegmentTree(-1000, 1000, MAX)
+        st.update(-999, 4)
+        st.update(500, 2)
+        self.assertEqual(st.query(-1000, 1000), 4)
+        self.assertEqual(st.query(-998, 1000), 2)
+
+    def test_non_commutative_order(self):
+        st = DynamicSegmentTree(0, 10 ** 9, Monoid(lambda a, b: a + b, ''))
+        for index, char in [(70, 'c'), (5, 'a'), (10 ** 9, 'd'), (6, 'b')]:
+            st.update(index, char)
+        self.assertEqual(st.query(0, 10 ** 9), 'abcd')
+        self.assertEqual(st.query(6, 100), 'bc')
+
+    def test_random_operations(self):
+        rand = random.Random(59)
+        st = DynamicSegmentTree(0, 10 ** 12, SUM)
+        values = {}
+        for _ in xrange(300):
+            index = rand.randint(0, 10 ** 12)
+            if values and rand.random() < 0.3:
+                index = rand.choice(values.keys())
+            values[index] = rand.randint(-9, 9)
+            st.update(index, values[index])
+
+            start = rand.randint(0, 10 ** 12)
+            end = rand.randint(start, 10 ** 12)
+            self.assertEqual(st.query(start, end),
+                             sum(value for key, value in values.iteritems()
+                                 if start <= key <= end))
@@ -1,5 +1,6 @@
-from zahlen.ds.tree.fenwick_tree import FenwickTree
+from zahlen.ds.tree.fenwick_tree import FenwickTree, RangeFenwickTree
 
+import random
 import unittest
 
 
@@ -67,3 +68,161 @@ class TestFenwickTree(unittest.TestCase):
         self.assertEqual(self.ft.read(6), 8)
         self.assertEqual(self.ft.read(8), 14)
         self.assertEqual(self.ft.read(10), 21)
+
+
+class TestFenwickTreeBatches(unittest.TestCase):
+    def setUp(self):
+        self.values = [1, 0, 2, 1, 1, 3, 0, 4, 2, 5, 2, 2, 3]
+        self.ft = FenwickTree(len(self.values))
+        self.ft.update_many(range(len(self.values)), self.values)
+
+    def test_read_many(self):
+        expected = [sum(self.values[:i + 1]) for i in xrange(13)]
+        self.assertListEqual(list(self.ft.read_many(range(13))), expected)
+        self.assertListEqual(list(self.ft.read_many([12, 0, 5])), [26, 1, 8])
+
+    def test_read_many_typecode(self):
+        ft = FenwickTree(3)
+        ft.update_many([0, 2], [0.5, 0.25])
+        self.assertListEqual(list(ft.read_many([0, 2], typecode='d')),
+                             [0.5, 0.75])
+
+    def test_read_many_float_values(self):
+        ft = FenwickTree.from_values([0.5, 1, 0.25])
+        values = ft.read_many([0, 1, 2])
+        self.assertEqual(values.typecode, 'd')
+        self.assertListEqual(list(values), [0.5, 1.5, 1.75])
+        self.assertEqual(self.ft.read_many([0, 1]).typecode, 'l')
+
+    def test_small_update_many(self):
+        self.ft.update_many([3], [10])
+        self.assertEqual(self.ft.read(2), 3)
+        self.assertEqual(self.ft.read(3), 14)
+        self.assertEqual(self.ft.read(12), 36)
+
+    def test_large_update_many_with_duplicates(self):
+        self.ft.update_many([0, 0, 5, 12] * 4, [1, 1, 2, 3] * 4)
+        self.assertEqual(self.ft.read(0), 9)
+        self.assertEqual(self.ft.read(5), 24)
+        self.assertEqual(self.ft.read(12), 54)
+
+    def test_empty_batches(self):
+        self.ft.update_many([], [])
+        self.assertEqual(len(self.ft.read_many([])), 0)
+
+    def test_batch_exceptions(self):
+        self.assertRaises(IndexError, self.ft.read_many, [0, 13])
+        self.assertRaises(IndexError, self.ft.read_many, [-1, 2])
+        self.assertRaises(IndexError, self.ft.update_many, [13], [1])
+        self.assertRaises(ValueError, self.ft.update_many, [1, 2], [1])
+
+
+class TestFromValues(TestFenwickTree):
+    def setUp(self):
+        self.ft = FenwickTree.from_values(
+            [1, 0, 2, 1, 1, 3, 0, 4, 2, 5, 2, 2, 3])
+
+    def test_empty_values_exception(self):
+        self.assertRaises(ValueError, FenwickTree.from_values, [])
+
+    def test_same_as_updates(self):
+        values = [random.randint(-10, 10) for _ in xrange(100)]
+        ft = FenwickTree(100)
+        for index, value in enumerate(values):
+            ft.update(index, value)
+        self.assertListEqual(FenwickTree.from_values(values)._tree, ft._tree)
+
+
+class TestRangeSum(unittest.TestCase):
+    def setUp(self):
+        self.values = [1, 0, 2, 1, 1, 3, 0, 4, 2, 5, 2, 2, 3]
+        self.ft = FenwickTree.from_values(self.values)
+
+    def test_range_sum(self):
+        for start in xrange(13):
+            for end in xrange(start, 13):
+                self.assertEqual(self.ft.range_sum(start, end),
+                                 sum(self.values[start:end + 1]))
+
+    def test_range_sum_exceptions(self):
+        self.assertRaises(IndexError, self.ft.range_sum, -1, 2)
+        self.assertRaises(IndexError, self.ft.range_sum, 3, 2)
+        self.assertRaises(IndexError, self.ft.range_sum, 3, 13)
+
+
+class TestLowerBound(unittest.TestCase):
+    def setUp(self):
+        self.ft = FenwickTree.from_values([1, 0, 2, 1, 1, 3, 0, 4, 2, 5, 2, 2,
+                                           3])
+
+    def test_lower_bound(self):
+        self.assertEqual(self.ft.lower_bound(0), 0)
+        self.assertEqual(self.ft.lower_bound(1), 0)
+        self.assertEqual(self.ft.lower_bound(2), 2)
+        self.assertEqual(self.ft.lower_bound(3), 2)
+        self.assertEqual(self.ft.lower_bound(4), 3)
+        self.assertEqual(self.ft.lower_bound(9), 7)
+        self.assertEqual(self.ft.lower_bound(26), 12)
+
+    def test_prefix_greater_than_total(self):
+        self.assertEqual(self.ft.lower_bound(27), 13)
+
+    def test_same_as_linear_search(self):
+        rand = random.Random(37)
+        for size in [1, 2, 7, 8, 33]:
+            values = [rand.randint(0, 4) for _ in xrange(size)]
+            ft = FenwickTree.from_values(values)
+            for prefix in xrange(sum(values) + 2):
+                running, expected = 0, size
+                for index, value in enumerate(values):
+                    running += value
+                    if running >= prefix:
+                        expected = index
+                        break
+                self.assertEqual(ft.lower_bound(prefix), expected)
+
+
+class TestRangeFenwickTree(unittest.TestCase):
+    def test_exceptions(self):
+        self.assertRaises(ValueError, RangeFenwickTree, 0)
+        ft = RangeFenwickTree(10)
+        self.assertRaises(IndexError, ft.range_add, -1, 2, 1)
+        self.assertRaises(IndexError, ft.range_add, 3, 10, 1)
+        self.assertRaises(IndexError, ft.range_sum, 3, 2)
+
+    def test_range_add_range_sum(self):
+        rand = random.Random(41)
+        for size in [1, 2, 9, 16]:
+            values = [0] * size
+            ft = RangeFenwickTree(size)
+            for _ in xrange(200):
+                start = rand.randrange(size)
+                end = rand.randint(start, size - 1)
+                if rand.random() < 0.5:
+                    value = rand.randint(-5, 5)
+                    ft.range_add(start, end, value)
+                    for index in xrange(start, end + 1):
+                        values[index] += value
+                else:
+                    self.assertEqual(ft.range_sum(start, end),
+                                     sum(values[start:end + 1]))
+
+
+class TestAppend(unittest.TestCase):
+    def test_append_to_tree(self):
+        values = [1, 0, 2, 1, 1, 3, 0, 4, 2, 5, 2, 2, 3]
+        ft = FenwickTree(1)
+        ft.update(0, values[0])
+        for value in values[1:]:
+            ft.append(value)
+        self.assertEqual(ft.size, len(values))
+        self.assertListEqual(ft._tree, FenwickTree.from_values(values)._tree)
+
+    def test_update_after_append(self):
+        ft = FenwickTree.from_values([1, 2, 3])
+        for value in xrange(4, 40):
+            ft.append(value)
+            ft.update(0, 1)
+        self.assertEqual(ft.read(0), 37)
+        self.assertEqual(ft.read(38), sum(xrange(1, 40)) + 36)
+        self.assertEqual(ft.range_sum(3, 9), sum(xrange(4, 11)))
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.fenwick_tree_2d
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.fenwick_tree_2d import FenwickTree2D, SparseFenwickTree2D
+
+import random
+import unittest
+
+
+def rectangle_sum(cells, top, left, bottom, right):
+    return sum(value for (row, column), value in cells.iteritems()
+               if top <= row <= bottom and left <= column <= right)
+
+
+class TestFenwickTree2D(unittest.TestCase):
+    def test_exceptions(self):
+        self.assertRaises(ValueError, FenwickTree2D, 0, 3)
+        self.assertRaises(ValueError, FenwickTree2D, 3, 0)
+        ft = FenwickTree2D(3, 4)
+        self.assertRaises(IndexError, ft.update, 3, 0, 1)
+        self.assertRaises(IndexError, ft.update, 0, -1, 1)
+        self.assertRaises(IndexError, ft.read, 0, 4)
+        self.assertRaises(IndexError, ft.range_sum, 2, 0, 1, 3)
+        self.assertRaises(IndexError, ft.range_sum, 0, 0, 1, 4)
+
+    def test_read_and_range_sum(self):
+        ft = FenwickTree2D(2, 3)
+        for row, values in enumerate([[1, 2, 3], [4, 5, 6]]):
+            for column, value in enumerate(values):
+                ft.update(row, column, value)
+        self.assertEqual(ft.read(0, 0), 1)
+        self.assertEqual(ft.read(0, 2), 6)
+        self.assertEqual(ft.read(1, 1), 12)
+        self.assertEqual(ft.range_sum(1, 1, 1, 2), 11)
+        self.assertEqual(ft.range_sum(0, 2, 1, 2), 9)
+
+    def test_random_operations(self):
+        rand = random.Random(43)
+        for rows, columns in [(1, 1), (3, 7), (8, 8), (13, 5)]:
+            cells = {}
+            ft = FenwickTree2D(rows, columns)
+            for _ in xrange(200):
+                row, column = rand.randrange(rows), rand.randrange(columns)
+                value = rand.randint(-5, 5)
+                ft.update(row, column, value)
+                cells[row, column] = cells.get((row, column), 0) + value
+
+                top, left = rand.randrange(rows), rand.randrange(columns)
+                bottom = rand.randint(top, rows - 1)
+                right = rand.randint(left, columns - 1)
+                self.assertEqual(ft.range_sum(top, left, bottom, right),
+                                 rectangle_sum(cells, top, left, bottom,
+                                               right))
+
+
+class TestSparseFenwickTree2D(unittest.TestCase):
+    def test_exceptions(self):
+        self.assertRaises(ValueError, SparseFenwickTree2D, [])
+        ft = SparseFenwickTree2D([(1, 1), (10 ** 12, 5)])
+        self.assertRaises(KeyError, ft.update, 2, 1, 1)
+        self.assertRaises(KeyError, ft.update, 1, 5, 1)
+        self.assertRaises(IndexError, ft.range_sum, 2, 0, 1, 3)
+
+    def test_huge_coordinates(self):
+        ft = SparseFenwickTree2D([(1, 1), (10 ** 12, 5), (10 ** 9, 10 ** 15)])
+        ft.update(1, 1, 3)
+        ft.update(10 ** 12, 5, 4)
+        ft.update(10 ** 9, 10 ** 15, 5)
+        self.assertEqual(ft.read(10 ** 12, 5), 7)
+        self.assertEqual(ft.read(10 ** 13, 10 ** 16), 12)
+        self.assertEqual(ft.range_sum(2, 0, 10 ** 12, 10 ** 15), 9)
+        self.assertEqual(ft.range_sum(2, 6, 10 ** 12, 10 ** 14), 0)
+
+    def test_random_operations(self):
+        rand = random.Random(47)
+        points = [(rand.randint(0, 10 ** 6), rand.randint(0, 30))
+                  for _ in xrange(100)]
+        ft = SparseFenwickTree2D(points)
+        cells = {}
+        for _ in xrange(300):
+            row, column = rand.choice(points)
+            value = rand.randint(-5, 5)
+            ft.update(row, column, value)
+            cells[row, column] = cells.get((row, column), 0) + value
+
+            top = rand.randint(-1, 10 ** 6)
+            bottom = rand.randint(top, 10 ** 6 + 1)
+            left = rand.randint(-1, 30)
+            right = rand.randint(left, 31)
+            self.assertEqual(ft.range_sum(top, left, bottom, right),
+                             rectangle_sum(cells, top, left, bottom, right))
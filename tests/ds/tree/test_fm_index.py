@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.fm_index
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.fm_index import FMIndex
+
+import random
+import unittest
+
+
+def occurrences(text, pattern):
+    return [i for i in xrange(len(text) - len(pattern) + 1)
+            if text.startswith(pattern, i)]
+
+
+class TestFMIndex(unittest.TestCase):
+    def test_sentinel_in_text_exception(self):
+        self.assertRaises(ValueError, FMIndex, 'ab$c', sentinel='$')
+
+    def test_sentinel_not_smallest_exception(self):
+        self.assertRaises(ValueError, FMIndex, 'banana', sentinel='~')
+        self.assertRaises(ValueError, FMIndex, 'AbC', sentinel='B')
+
+    def test_invalid_sample_rate_exception(self):
+        self.assertRaises(ValueError, FMIndex, 'abc', occ_sample_rate=0)
+        self.assertRaises(ValueError, FMIndex, 'abc', sa_sample_rate=0)
+
+    def test_bwt(self):
+        fm = FMIndex('banana', sentinel='$')
+        self.assertEqual(fm.bwt, 'annb$aa')
+
+    def test_empty_text(self):
+        fm = FMIndex('')
+        self.assertEqual(len(fm), 0)
+        self.assertEqual(fm.count('a'), 0)
+        self.assertListEqual(list(fm.locate('a')), [])
+
+    def test_count(self):
+        text = 'mississippi'
+        fm = FMIndex(text)
+        for pattern in ['i', 's', 'ss', 'issi', 'sis', 'mississippi', 'x',
+                        'sss', 'ippis']:
+            self.assertEqual(fm.count(pattern),
+                             len(occurrences(text, pattern)))
+
+    def test_locate(self):
+        text = 'abracadabra'
+        fm = FMIndex(text, sa_sample_rate=4)
+        for pattern in ['a', 'abra', 'cad', 'ra', 'x', 'abracadabra']:
+            self.assertListEqual(sorted(fm.locate(pattern)),
+                                 occurrences(text, pattern))
+
+    def test_sentinel_in_pattern(self):
+        fm = FMIndex('banana')
+        self.assertEqual(fm.count('a\0'), 0)
+
+    def test_random_texts(self):
+        rand = random.Random(5)
+        for occ_rate, sa_rate in [(1, 1), (3, 5), (16, 8), (128, 32)]:
+            text = ''.join(rand.choice('acgt') for _ in xrange(300))
+            fm = FMIndex(text, occ_sample_rate=occ_rate,
+                         sa_sample_rate=sa_rate)
+            for length in xrange(1, 6):
+                start = rand.randint(0, len(text) - length)
+                pattern = text[start:start + length]
+                expected = occurrences(text, pattern)
+                self.assertEqual(fm.count(pattern), len(expected))
+                self.assertListEqual(sorted(fm.locate(pattern)), expected)
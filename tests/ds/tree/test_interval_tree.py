@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.interval_tree
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.interval_tree import IntervalTree, Node
+
+import random
+import unittest
+
+
+def random_intervals(rand, size, span=1000, length=50):
+    intervals = set()
+    while len(intervals) < size:
+        start = rand.randrange(span)
+        intervals.add((start, start + rand.randrange(length)))
+    intervals = sorted(intervals)
+    rand.shuffle(intervals)
+    return intervals
+
+
+def overlapping(intervals, start, end):
+    return sorted(interval for interval in intervals
+                  if interval[0] <= end and interval[1] >= start)
+
+
+def assert_valid_max_ends(test, node):
+    """Asserts that the largest end of every node in a subtree is correct and
+    returns the largest end of the subtree.
+    """
+    if not node:
+        return None
+    max_end = max(node.key[1], assert_valid_max_ends(test, node.left),
+                  assert_valid_max_ends(test, node.right))
+    test.assertEqual(node.max_end, max_end)
+    return max_end
+
+
+class TestIntervalTree(unittest.TestCase):
+    def setUp(self):
+        self.rand = random.Random(29)
+        self.intervals = random_intervals(self.rand, 300)
+        self.it = IntervalTree(Node)
+        for interval in self.intervals:
+            self.it.insert(interval)
+
+    def test_insert(self):
+        self.assertTrue(self.it.is_balanced())
+        self.assertListEqual(self.it.sorted_keys(), sorted(self.intervals))
+        assert_valid_max_ends(self, self.it.root)
+
+    def test_insert_invalid_interval(self):
+        self.assertRaises(ValueError, self.it.insert, (5, 4))
+
+    def test_overlap(self):
+        for _ in xrange(200):
+            start = self.rand.randrange(-100, 1100)
+            end = start + self.rand.randrange(100)
+            self.assertListEqual(list(self.it.overlap(start, end)),
+                                 overlapping(self.intervals, start, end))
+
+    def test_overlap_closed_intervals(self):
+        it = IntervalTree(Node)
+        it.insert((1, 3))
+        it.insert((5, 7))
+        self.assertListEqual(list(it.overlap(3, 5)), [(1, 3), (5, 7)])
+        self.assertListEqual(list(it.overlap(4, 4)), [])
+        self.assertRaises(ValueError, list, it.overlap(5, 4))
+
+    def test_overlap_is_lazy(self):
+        it = IntervalTree.from_sorted([(key, key + 10)
+                                       for key in xrange(100)], Node)
+        overlaps = it.overlap(0, 1000)
+        self.assertEqual(next(overlaps), (0, 10))
+        self.assertEqual(next(overlaps), (1, 11))
+
+    def test_stab(self):
+        for point in xrange(-10, 1060, 7):
+            self.assertListEqual(list(self.it.stab(point)),
+                                 overlapping(self.intervals, point, point))
+
+    def test_empty_tree(self):
+        self.assertListEqual(list(IntervalTree(Node).stab(1)), [])
+
+    def test_delete(self):
+        self.rand.shuffle(self.intervals)
+        while self.intervals:
+            self.it.delete(self.intervals.pop())
+            assert_valid_max_ends(self, self.it.root)
+            point = self.rand.randrange(1000)
+            self.assertListEqual(list(self.it.stab(point)),
+                                 overlapping(self.intervals, point, point))
+        self.assertIsNone(self.it.root)
+
+    def test_duplicate_intervals(self):
+        for _ in xrange(100):
+            it = IntervalTree(Node)
+            intervals = []
+            for _ in xrange(30):
+                start = self.rand.randrange(5)
+                interval = (start, start + self.rand.randrange(3))
+                it.insert(interval)
+                intervals.append(interval)
+            self.assertTrue(it.is_balanced())
+            self.assertEqual(it.count(intervals[0]),
+                             intervals.count(intervals[0]))
+
+            self.rand.shuffle(intervals)
+            for _ in xrange(20):
+                it.delete(intervals.pop())
+                assert_valid_max_ends(self, it.root)
+            for point in xrange(8):
+                self.assertListEqual(list(it.stab(point)),
+                                     overlapping(intervals, point, point))
+
+    def test_from_sorted(self):
+        intervals = sorted(self.intervals)
+        it = IntervalTree.from_sorted(intervals, Node)
+        self.assertTrue(it.is_balanced())
+        assert_valid_max_ends(self, it.root)
+        self.assertListEqual(list(it.overlap(100, 200)),
+                             overlapping(intervals, 100, 200))
+
+        it.insert((2000, 2001))
+        self.assertListEqual(list(it.stab(2000)), [(2000, 2001)])
+        self.assertRaises(ValueError, IntervalTree.from_sorted,
+                          intervals[::-1], Node)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.iterative_avl_tree
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.iterative_avl_tree import IterativeAVLTree
+from test_avl_tree import get_avl, get_balanced_bst
+from test_binary_search_tree import BSTTestCase
+
+import random
+
+
+def get_iterative_avl(keys):
+    avl = IterativeAVLTree()
+    for key in keys:
+        avl.insert(key)
+    return avl
+
+
+class TestIterativeAVLTree(BSTTestCase):
+    def test_insert_rotations(self):
+        for keys, expected in [
+                ([9, 10, 11], [10, 9, 11]),
+                ([8, 7, 6], [7, 6, 8]),
+                ([10, 6, 20, 15, 25, 17], [15, 10, 20, 6, 17, 25]),
+                ([20, 10, 25, 8, 15, 12], [15, 10, 20, 8, 12, 25])]:
+            actual = get_iterative_avl(keys)
+            self.assert_tree(actual, get_balanced_bst(expected))
+            self.assertTrue(actual.is_balanced())
+
+    def test_delete_rotations(self):
+        actual = get_iterative_avl([16, 10, 25, 6, 14, 18, 28, 15, 17, 27,
+                                    29, 30])
+        actual.delete(10)
+        expected = get_balanced_bst([25, 16, 28, 14, 18, 27, 29, 6, 15, 17,
+                                     30])
+        self.assert_tree(actual, expected)
+        self.assertTrue(actual.is_balanced())
+
+    def test_same_shape_as_avl_tree(self):
+        keys = random.sample(xrange(1000), 300)
+        actual = get_iterative_avl(keys)
+        expected = get_avl(keys)
+        self.assert_tree(actual, expected)
+
+        random.shuffle(keys)
+        for key in keys[:200]:
+            actual.delete(key)
+            expected.delete(key)
+            self.assertTrue(actual.is_balanced())
+        self.assert_tree(actual, expected)
+        self.assertEqual(actual.sorted_keys(), sorted(keys[200:]))
+        self.assertEqual(len(actual), 100)
+
+    def test_search_and_delete_all(self):
+        keys = range(50)
+        avl = get_iterative_avl(keys)
+        self.assertTrue(avl.search(25))
+        self.assertFalse(avl.search(50))
+        self.assertRaises(KeyError, avl.delete, 50)
+        for key in keys:
+            avl.delete(key)
+        self.assertIsNone(avl.root)
+        self.assertEqual(len(avl), 0)
+        self.assertEqual(avl.sorted_keys(), [])
+
+    def test_from_sorted(self):
+        for size in xrange(40):
+            avl = IterativeAVLTree.from_sorted(xrange(size))
+            self.assertTrue(avl.is_balanced())
+            self.assertEqual(len(avl), size)
+            self.assertEqual(avl.sorted_keys(), range(size))
+
+        actual = IterativeAVLTree.from_sorted(xrange(1, 8))
+        self.assert_tree(actual, get_balanced_bst([4, 2, 6, 1, 3, 5, 7]))
+        actual.insert(8)
+        actual.delete(1)
+        self.assertTrue(actual.is_balanced())
+        self.assertRaises(ValueError, IterativeAVLTree.from_sorted, [2, 1])
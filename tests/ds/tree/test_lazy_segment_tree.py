@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.lazy_segment_tree
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from fractions import gcd
+from zahlen.ds.tree.lazy_segment_tree import LazySegmentTree, Monoid, SUM, \
+    MIN, MAX, GCD
+
+import random
+import unittest
+
+
+class TestLazySegmentTreeExceptions(unittest.TestCase):
+    def test_empty_list_exception(self):
+        self.assertRaises(ValueError, LazySegmentTree, [])
+
+    def test_invalid_range_exception(self):
+        st = LazySegmentTree([2, 1, 0, 3])
+        self.assertRaises(IndexError, st.query, -1, 2)
+        self.assertRaises(IndexError, st.query, 3, 1)
+        self.assertRaises(IndexError, st.query, 1, 4)
+        self.assertRaises(IndexError, st.range_add, 1, 4, 1)
+        self.assertRaises(IndexError, st.range_assign, -1, 2, 1)
+        self.assertRaises(IndexError, st.update, 4, 1)
+
+    def test_range_add_unsupported_exception(self):
+        st = LazySegmentTree([4, 6, 8], GCD)
+        self.assertRaises(ValueError, st.range_add, 0, 2, 1)
+
+
+class TestLazySegmentTree(unittest.TestCase):
+    def test_sum(self):
+        st = LazySegmentTree([2, 1, 3, 6, 0, -1, -2])
+        self.assertEqual(st.query(0, 6), 9)
+        st.range_add(1, 4, 5)
+        self.assertEqual(st.query(0, 6), 29)
+        self.assertEqual(st.query(4, 4), 5)
+        st.range_assign(3, 6, 1)
+        self.assertEqual(st.query(0, 6), 20)
+        self.assertEqual(st.query(2, 3), 9)
+
+    def test_min_max(self):
+        elements = [3, -1, 1, -2, 6, 5, 0, 2]
+        st_min = LazySegmentTree(elements, MIN)
+        st_max = LazySegmentTree(elements, MAX)
+        self.assertEqual(st_min.query(0, 7), -2)
+        self.assertEqual(st_max.query(0, 7), 6)
+        for st in [st_min, st_max]:
+            st.range_add(0, 3, 10)
+            st.range_assign(4, 5, 7)
+        self.assertEqual(st_min.query(0, 7), 0)
+        self.assertEqual(st_max.query(0, 7), 13)
+        self.assertEqual(st_min.query(2, 5), 7)
+
+    def test_gcd(self):
+        st = LazySegmentTree([12, 18, 24, 9], GCD)
+        self.assertEqual(st.query(0, 2), 6)
+        self.assertEqual(st.query(0, 3), 3)
+        st.range_assign(3, 3, 30)
+        self.assertEqual(st.query(0, 3), 6)
+
+    def test_custom_monoid(self):
+        concat = Monoid(lambda a, b: a + b, '')
+        st = LazySegmentTree(list('abcdefg'), concat)
+        st.range_assign(2, 4, 'x')
+        self.assertEqual(st.query(0, 6), 'abxxxfg')
+        self.assertEqual(st.query(3, 5), 'xxf')
+
+    def test_random_operations(self):
+        rand = random.Random(17)
+        monoids = [(SUM, sum), (MIN, min), (MAX, max),
+                   (GCD, lambda values: reduce(gcd, values, 0))]
+        for monoid, aggregate in monoids:
+            for length in [1, 2, 7, 16, 33]:
+                elements = [rand.randint(1, 50) for _ in xrange(length)]
+                st = LazySegmentTree(elements, monoid)
+                for _ in xrange(200):
+                    start = rand.randint(0, length - 1)
+                    end = rand.randint(start, length - 1)
+                    operation = rand.randint(0, 2)
+                    value = rand.randint(1, 20)
+                    if operation == 0:
+                        self.assertEqual(st.query(start, end),
+                                         aggregate(elements[start:end + 1]))
+                    elif operation == 1:
+                        st.range_assign(start, end, value)
+                        elements[start:end + 1] = [value] * (end - start + 1)
+                    elif monoid.add:
+                        st.range_add(start, end, value)
+                        for index in xrange(start, end + 1):
+                            elements[index] += value
@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 
 """
-    Test case module for zahlen.ds.tree.min_max_heap
+    Test case module for zahlen.ds.heap.min_max_heap
 
     :copyright: (c) 2014 by Subhajit Ghosh.
     :license: MIT, see LICENSE for more details.
 """
 
-from zahlen.ds.tree.min_max_heap import MinMaxHeap
+from zahlen.ds.heap.min_max_heap import MinMaxHeap
 
+import random
 import unittest
 
 
@@ -84,5 +85,34 @@ class TestBuildMinMaxHeap(unittest.TestCase):
                                             4, 4, 3, 5, 4, 3, 2])
 
 
+class TestDeleteMinMaxHeap(unittest.TestCase):
+    def test_delete_from_empty_heap(self):
+        mmh = MinMaxHeap([])
+        self.assertRaises(ValueError, mmh.delete_min)
+        self.assertRaises(ValueError, mmh.delete_max)
+
+    def test_delete_min_and_max(self):
+        rand = random.Random(89)
+        for min_at_root in [True, False]:
+            values = [rand.randrange(50) for _ in xrange(200)]
+            mmh = MinMaxHeap(values, min_at_root=min_at_root)
+            values.sort()
+            while values:
+                if rand.random() < 0.5:
+                    self.assertEqual(mmh.delete_min(), values.pop(0))
+                else:
+                    self.assertEqual(mmh.delete_max(), values.pop())
+                self.assertEqual(len(mmh), len(values))
+
+                if rand.random() < 0.3:
+                    value = rand.randrange(50)
+                    mmh.insert(value)
+                    values.append(value)
+                    values.sort()
+                if values:
+                    self.assertEqual(mmh.minimum(), values[0])
+                    self.assertEqual(mmh.maximum(), values[-1])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -7,7 +7,9 @@
     :license: MIT, see LICENSE for more details.
 """
 
-from zahlen.ds.tree.order_statistics_tree import Node, OrderStatisticsTree
+from zahlen.ds.tree.order_statistics_tree import (DupKeysNode, Node,
+                                                OrderStatisticsTree,
+                                                OrderStatisticsTreeDupKeys)
 
 import unittest
 
@@ -115,4 +117,127 @@ class TestKthSuccessor(unittest.TestCase):
         self.assertEqual(self.ost.kth_successor(6, 2), 8)
         self.assertEqual(self.ost.kth_successor(7, 3), 12)
         self.assertEqual(self.ost.kth_successor(5, 4), 10)
-        self.assertEqual(self.ost.kth_successor(7, 4), 13)
\ No newline at end of file
+        self.assertEqual(self.ost.kth_successor(7, 4), 13)
+
+
+class TestFromSorted(unittest.TestCase):
+    def test_weights(self):
+        keys = range(0, 200, 3)
+        ost = OrderStatisticsTree.from_sorted(keys, Node)
+        self.assertEqual(ost.root.weight, len(keys))
+        for k, key in enumerate(keys, 1):
+            self.assertEqual(ost.kth_smallest_key(k), key)
+
+        ost.insert(1)
+        ost.delete(0)
+        self.assertEqual(ost.root.weight, len(keys))
+        self.assertEqual(ost.kth_smallest_key(1), 1)
+
+
+class TestJoinSplit(unittest.TestCase):
+    def test_weights_after_split_and_union(self):
+        ost = get_ost(range(0, 100, 2))
+        larger = ost.split(50)
+        self.assertEqual(ost.root.weight, 25)
+        self.assertEqual(larger.root.weight, 25)
+        self.assertEqual(larger.kth_smallest_key(1), 50)
+
+        larger.union(get_ost(range(51, 100, 2)))
+        self.assertEqual(larger.root.weight, 50)
+        self.assertEqual(larger.kth_smallest_key(2), 51)
+
+        ost.join(larger)
+        self.assertEqual(ost.root.weight, 75)
+        for k in xrange(1, 76):
+            self.assertEqual(ost.kth_smallest_key(k),
+                             k + 24 if k > 25 else 2 * (k - 1))
+
+
+class TestRank(unittest.TestCase):
+    def setUp(self):
+        self.keys = [8, 3, 2, 5, 4, 6, 12, 13, 10, 7]
+        self.ost = get_ost(self.keys)
+
+    def test_rank(self):
+        for rank, key in enumerate(sorted(self.keys)):
+            self.assertEqual(self.ost.rank(key), rank)
+        self.assertEqual(self.ost.rank(1), 0)
+        self.assertEqual(self.ost.rank(9), 7)
+        self.assertEqual(self.ost.rank(100), 10)
+        self.assertEqual(OrderStatisticsTree(Node).rank(1), 0)
+
+    def test_count_range(self):
+        self.assertEqual(self.ost.count_range(2, 13), 10)
+        self.assertEqual(self.ost.count_range(4, 8), 5)
+        self.assertEqual(self.ost.count_range(8.5, 9.5), 0)
+        self.assertEqual(self.ost.count_range(9, 12), 2)
+        self.assertEqual(self.ost.count_range(12, 9), 0)
+        self.assertEqual(self.ost.count_range(-5, 100), 10)
+
+    def test_kth_largest_key(self):
+        self.assertEqual(self.ost.kth_largest_key(1), 13)
+        self.assertEqual(self.ost.kth_largest_key(3), 10)
+        self.assertEqual(self.ost.kth_largest_key(10), 2)
+        self.assertRaises(IndexError, self.ost.kth_largest_key, 0)
+        self.assertRaises(IndexError, self.ost.kth_largest_key, 11)
+        self.assertRaises(Exception, OrderStatisticsTree(Node).kth_largest_key,
+                          1)
+
+    def test_kth_successor_missing_key(self):
+        self.assertRaises(KeyError, self.ost.kth_successor, 1, 9)
+
+    def test_percentile(self):
+        ost = get_ost(range(1, 101))
+        self.assertEqual(ost.percentile(0), 1)
+        self.assertEqual(ost.percentile(50), 50)
+        self.assertEqual(ost.percentile(99), 99)
+        self.assertEqual(ost.percentile(99.5), 100)
+        self.assertEqual(ost.percentile(100), 100)
+        self.assertEqual(self.ost.percentile(25), 4)
+        self.assertRaises(ValueError, ost.percentile, 101)
+        self.assertRaises(ValueError, ost.percentile, -1)
+        self.assertRaises(Exception, OrderStatisticsTree(Node).percentile, 50)
+
+
+class TestDupKeys(unittest.TestCase):
+    def setUp(self):
+        self.keys = [5, 1, 5, 3, 9, 1, 5, 7, 3, 3, 3]
+        self.ost = OrderStatisticsTreeDupKeys(DupKeysNode)
+        for key in self.keys:
+            self.ost.insert(key)
+
+    def test_order_statistics_over_occurrences(self):
+        ordered = sorted(self.keys)
+        self.assertEqual(len(self.ost), len(self.keys))
+        for k, key in enumerate(ordered, 1):
+            self.assertEqual(self.ost.kth_smallest_key(k), key)
+            self.assertEqual(self.ost.kth_largest_key(k), ordered[-k])
+        self.assertEqual(self.ost.rank(3), 2)
+        self.assertEqual(self.ost.rank(5), 6)
+        self.assertEqual(self.ost.count_range(3, 5), 7)
+        self.assertEqual(self.ost.kth_successor(1, 5), 5)
+        self.assertEqual(self.ost.kth_successor(3, 5), 7)
+        self.assertEqual(self.ost.percentile(50), 3)
+
+    def test_insert_many_and_delete(self):
+        self.ost.insert_many(4, 1000)
+        self.assertEqual(len(self.ost), 1011)
+        self.assertEqual(self.ost.kth_smallest_key(7), 4)
+        self.assertEqual(self.ost.kth_smallest_key(1006), 4)
+        self.assertEqual(self.ost.kth_smallest_key(1007), 5)
+
+        self.ost.delete(4)
+        self.ost.delete(3, delete_all=True)
+        self.assertEqual(len(self.ost), 1006)
+        self.assertEqual(self.ost.rank(5), 1001)
+        for key in [1, 4, 5, 7, 9]:
+            self.ost.delete(key, delete_all=True)
+        self.assertEqual(len(self.ost), 0)
+
+    def test_balanced(self):
+        ost = OrderStatisticsTreeDupKeys(DupKeysNode)
+        for key in xrange(200):
+            ost.insert_many(key, 2)
+        self.assertTrue(ost.is_balanced())
+        self.assertEqual(ost.root.height, 7)
+        self.assertEqual(ost.kth_smallest_key(400), 199)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.persistent_segment_tree
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.persistent_segment_tree import PersistentSegmentTree
+from zahlen.ds.tree.segment_tree import SegmentTree
+
+import random
+import unittest
+
+
+class TestPersistentSegmentTree(unittest.TestCase):
+    def test_exceptions(self):
+        self.assertRaises(ValueError, PersistentSegmentTree, [])
+        st = PersistentSegmentTree([2, 1, 3])
+        self.assertRaises(IndexError, st.update, 3, 1)
+        self.assertRaises(IndexError, st.update, -1, 1)
+        self.assertRaises(IndexError, st.query, -1, 1)
+        self.assertRaises(IndexError, st.query, 2, 1)
+        self.assertRaises(IndexError, st.query, 0, 3)
+        self.assertRaises(KeyError, st.query, 0, 1, 1)
+        self.assertRaises(KeyError, st.update, 0, 1, 1)
+
+    def test_query_versions(self):
+        st = PersistentSegmentTree([2, 1, 3, 6, 0, -1, -2])
+        self.assertEqual(st.query(0, 6), 6)
+        self.assertEqual(st.update(6, 5), 1)
+        self.assertEqual(st.update(0, -3, 0), 2)
+        self.assertEqual(st.latest_version, 2)
+
+        self.assertEqual(st.query(0, 6, 0), 6)
+        self.assertEqual(st.query(0, 6, 1), 5)
+        self.assertEqual(st.query(0, 6, 2), 0)
+        self.assertEqual(st.query(0, 6), 0)
+        self.assertEqual(st.element(6, 2), -2)
+        self.assertEqual(st.element(6, 1), 5)
+
+    def test_ties(self):
+        st = PersistentSegmentTree([1, 1, 1, 1, 1])
+        self.assertEqual(st.query(0, 4), 4)
+        self.assertEqual(st.query(0, 2), 2)
+        st.update(4, 2)
+        self.assertEqual(st.query(0, 4), 3)
+        self.assertEqual(st.query(0, 4, 0), 4)
+
+    def test_against_segment_tree(self):
+        size = 37
+        history = [[random.randint(0, 10) for _ in xrange(size)]]
+        st = PersistentSegmentTree(history[0])
+        for _ in xrange(100):
+            version = random.randrange(len(history))
+            index = random.randrange(size)
+            elements = list(history[version])
+            elements[index] = random.randint(0, 10)
+            history.append(elements)
+            self.assertEqual(st.update(index, elements[index], version),
+                             len(history) - 1)
+
+        for version, elements in enumerate(history):
+            expected = SegmentTree(elements)
+            for _ in xrange(10):
+                start = random.randrange(size)
+                end = random.randrange(start, size)
+                self.assertEqual(st.query(start, end, version),
+                                 expected.query(start, end))
+
+    def test_drop(self):
+        size = 64
+        st = PersistentSegmentTree(range(size))
+        base = st.node_count
+        self.assertEqual(base, 2 * size - 1)
+        for index in xrange(size):
+            st.update(index, -index)
+        self.assertEqual(st.node_count, base + size * 7)
+
+        # Only the latest version remains.
+        for version in xrange(size):
+            st.drop(version)
+        self.assertEqual(st.versions, [size])
+        self.assertEqual(st.node_count, base)
+        self.assertEqual(st.query(0, size - 1), size - 1)
+        self.assertRaises(KeyError, st.drop, 0)
+        self.assertRaises(KeyError, st.query, 0, 1, 0)
+
+        # The released nodes are reused.
+        allocated = len(st._left)
+        st.update(0, -100)
+        self.assertEqual(len(st._left), allocated)
+        self.assertEqual(st.query(0, size - 1), 0)
+        st.drop(size)
+        self.assertEqual(st.node_count, base)
+        self.assertEqual(st.element(5), -5)
+
+
+if __name__ == '__main__':
+    unittest.main()
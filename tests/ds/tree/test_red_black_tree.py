@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.red_black_tree
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.red_black_tree import (Node, OrderStatisticsRedBlackTree,
+                                           RedBlackTree, WeightedNode)
+from test_avl_tree import assert_valid_weights
+
+import random
+import unittest
+
+
+def get_rbt(keys, tree_type=RedBlackTree, node_type=Node):
+    rbt = tree_type(node_type)
+    for key in keys:
+        rbt.insert(key)
+    return rbt
+
+
+class TestRedBlackTree(unittest.TestCase):
+    def test_insert_ascending(self):
+        rbt = get_rbt(xrange(100))
+        self.assertTrue(rbt.is_balanced())
+        self.assertFalse(rbt.root.red)
+        self.assertListEqual(rbt.sorted_keys(), range(100))
+
+    def test_insert_and_delete(self):
+        rand = random.Random(43)
+        keys = rand.sample(xrange(1000), 300)
+        rbt = get_rbt(keys)
+        self.assertTrue(rbt.is_balanced())
+
+        rand.shuffle(keys)
+        for index, key in enumerate(keys):
+            rbt.delete(key)
+            self.assertTrue(rbt.is_balanced())
+            self.assertFalse(rbt.search(key))
+            if index % 50 == 0:
+                self.assertListEqual(rbt.sorted_keys(),
+                                     sorted(keys[index + 1:]))
+        self.assertIsNone(rbt.root)
+
+    def test_from_sorted(self):
+        rand = random.Random(97)
+        for size in [0, 1, 2, 3, 7, 8, 15, 16, 100]:
+            rbt = RedBlackTree.from_sorted(xrange(size), Node)
+            self.assertTrue(rbt.is_balanced())
+            self.assertListEqual(rbt.sorted_keys(), range(size))
+
+            keys = range(size, size + 50)
+            for key in keys:
+                rbt.insert(key)
+            rand.shuffle(keys)
+            for key in keys[:25] + range(size // 2):
+                rbt.delete(key)
+            self.assertTrue(rbt.is_balanced())
+
+        rbt = OrderStatisticsRedBlackTree.from_sorted(xrange(20), WeightedNode)
+        self.assertTrue(rbt.is_balanced())
+        assert_valid_weights(self, rbt.root)
+
+    def test_delete_missing_key(self):
+        rbt = get_rbt([1, 2, 3])
+        self.assertRaises(KeyError, rbt.delete, 4)
+
+    def test_inherited_queries(self):
+        rbt = get_rbt([8, 3, 2, 5, 4, 6, 12, 13, 10, 7])
+        self.assertEqual(rbt.floor(9), 8)
+        self.assertEqual(list(rbt.irange(5, 8)), [5, 6, 7, 8])
+
+
+class TestOrderStatisticsRedBlackTree(unittest.TestCase):
+    def test_weights(self):
+        keys = random.Random(47).sample(xrange(1000), 200)
+        rbt = get_rbt(keys, OrderStatisticsRedBlackTree, WeightedNode)
+        for key in keys[:100]:
+            rbt.delete(key)
+        assert_valid_weights(self, rbt.root)
+        self.assertTrue(rbt.is_balanced())
+
+        remaining = sorted(keys[100:])
+        for k, key in enumerate(remaining, 1):
+            self.assertEqual(rbt.kth_smallest_key(k), key)
+            self.assertEqual(rbt.rank(key), k - 1)
+        self.assertEqual(rbt.kth_successor(3, remaining[0]), remaining[3])
@@ -5,8 +5,9 @@
     :license: MIT, see LICENSE for more details.
 """
 
-from zahlen.ds.tree.segment_tree import SegmentTree
+from zahlen.ds.tree.segment_tree import BottomUpSegmentTree, SegmentTree
 
+import random
 import unittest
 
 
@@ -331,4 +332,127 @@ class TestUpdate(unittest.TestCase):
         sg = SegmentTree([2, 1, 3, 6, -2, 1, 0, -2, -1])
         sg.update(5, -3)
         self.assertEqual(sg.query(5, 8), 5)
-        self.assertEqual(sg.query(0, 8), 5)
\ No newline at end of file
+        self.assertEqual(sg.query(0, 8), 5)
+
+    def test_update_increase_min(self):
+        sg = SegmentTree([1, 2, 3, 0, 4])
+        sg.update(3, 5)
+        self.assertEqual(sg.query(0, 4), 0)
+        self.assertEqual(sg.query(2, 4), 2)
+        sg.update(0, 6)
+        self.assertEqual(sg.query(0, 4), 1)
+
+
+class TestBottomUpSegmentTree(unittest.TestCase):
+    """Test cases to assert that BottomUpSegmentTree returns the same indices
+    as SegmentTree.
+    """
+
+    def test_empty_list_exception(self):
+        self.assertRaises(ValueError, BottomUpSegmentTree, [])
+
+    def test_invalid_range_exception(self):
+        sg = BottomUpSegmentTree([2, 1, 0, 3])
+        self.assertRaises(IndexError, sg.query, -1, 2)
+        self.assertRaises(IndexError, sg.query, 3, 1)
+        self.assertRaises(IndexError, sg.query, 1, 6)
+        self.assertRaises(IndexError, sg.update, -1, 10)
+        self.assertRaises(IndexError, sg.update, 4, 10)
+
+    def test_all_equal_elements(self):
+        sg = BottomUpSegmentTree([1] * 11)
+        self.assertEqual(sg.query(0, 9), 9)
+        self.assertEqual(sg.query(2, 7), 7)
+        self.assertEqual(sg.query(5, 5), 5)
+
+    def test_append(self):
+        sg = BottomUpSegmentTree([3])
+        for element in [2, 4, 1, 5, 1, 6, 7, 8]:
+            sg.append(element)
+        self.assertEqual(len(sg), 9)
+        self.assertEqual(sg.query(0, 8), 5)
+        self.assertEqual(sg.query(0, 2), 1)
+        self.assertEqual(sg.query(6, 8), 6)
+        sg.update(8, 0)
+        self.assertEqual(sg.query(0, 8), 8)
+
+    def test_append_same_as_segment_tree(self):
+        rand = random.Random(19)
+        elements = [rand.randint(-5, 5)]
+        sg = BottomUpSegmentTree(elements)
+        for _ in xrange(70):
+            elements.append(rand.randint(-5, 5))
+            sg.append(elements[-1])
+            expected = SegmentTree(elements[:])
+            for _ in xrange(10):
+                start = rand.randrange(len(elements))
+                end = rand.randint(start, len(elements) - 1)
+                self.assertEqual(sg.query(start, end),
+                                 expected.query(start, end))
+
+    def test_same_as_segment_tree(self):
+        rand = random.Random(23)
+        for size in [1, 2, 3, 7, 8, 9, 16, 31]:
+            elements = [rand.randint(-5, 5) for _ in xrange(size)]
+            expected = SegmentTree(elements[:])
+            actual = BottomUpSegmentTree(elements)
+            for _ in xrange(300):
+                if rand.random() < 0.3:
+                    index, value = rand.randrange(size), rand.randint(-5, 5)
+                    expected.update(index, value)
+                    actual.update(index, value)
+                else:
+                    start = rand.randrange(size)
+                    end = rand.randint(start, size - 1)
+                    self.assertEqual(actual.query(start, end),
+                                     expected.query(start, end))
+
+
+class TestBatches(unittest.TestCase):
+    """Test cases to assert that query_many() and update_many() behave as
+    a sequence of query() and update() calls.
+    """
+
+    def test_query_many(self):
+        for cls in [SegmentTree, BottomUpSegmentTree]:
+            sg = cls([2, 1, 3, 6, -2, 1, 0, -2, -1])
+            self.assertListEqual(
+                list(sg.query_many([0, 0, 5, 2, 8], [8, 3, 6, 2, 8])),
+                [7, 1, 6, 2, 8])
+
+    def test_empty_batches(self):
+        for cls in [SegmentTree, BottomUpSegmentTree]:
+            sg = cls([2, 1, 3])
+            sg.update_many([], [])
+            self.assertEqual(len(sg.query_many([], [])), 0)
+
+    def test_batch_exceptions(self):
+        for cls in [SegmentTree, BottomUpSegmentTree]:
+            sg = cls([2, 1, 0, 3])
+            self.assertRaises(IndexError, sg.query_many, [0, -1], [1, 2])
+            self.assertRaises(IndexError, sg.query_many, [0, 3], [1, 1])
+            self.assertRaises(IndexError, sg.query_many, [0, 1], [1, 4])
+            self.assertRaises(ValueError, sg.query_many, [0, 1], [1])
+            self.assertRaises(IndexError, sg.update_many, [4], [1])
+            self.assertRaises(IndexError, sg.update_many, [-1], [1])
+            self.assertRaises(ValueError, sg.update_many, [1, 2], [1])
+
+    def test_same_as_single_operations(self):
+        rand = random.Random(31)
+        for cls in [SegmentTree, BottomUpSegmentTree]:
+            for size in [1, 5, 8, 13]:
+                elements = [rand.randint(-5, 5) for _ in xrange(size)]
+                single = cls(elements[:])
+                batched = cls(elements[:])
+                for _ in xrange(20):
+                    indices = [rand.randrange(size) for _ in xrange(5)]
+                    values = [rand.randint(-5, 5) for _ in xrange(5)]
+                    for index, value in zip(indices, values):
+                        single.update(index, value)
+                    batched.update_many(indices, values)
+
+                    starts = [rand.randrange(size) for _ in xrange(10)]
+                    ends = [rand.randint(start, size - 1) for start in starts]
+                    self.assertListEqual(
+                        list(batched.query_many(starts, ends)),
+                        [single.query(s, e) for s, e in zip(starts, ends)])
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.segment_tree_2d
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.lazy_segment_tree import MAX, MIN, SUM
+from zahlen.ds.tree.segment_tree_2d import SegmentTree2D
+
+import random
+import unittest
+
+
+class TestSegmentTree2D(unittest.TestCase):
+    def test_exceptions(self):
+        self.assertRaises(ValueError, SegmentTree2D, [])
+        self.assertRaises(ValueError, SegmentTree2D, [[]])
+        self.assertRaises(ValueError, SegmentTree2D, [[1, 2], [3]])
+        st = SegmentTree2D([[1, 2], [3, 4]])
+        self.assertRaises(IndexError, st.update, 2, 0, 1)
+        self.assertRaises(IndexError, st.query, 1, 0, 0, 1)
+        self.assertRaises(IndexError, st.query, 0, 0, 1, 2)
+
+    def test_query(self):
+        st = SegmentTree2D([[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(st.query(0, 0, 1, 2), 21)
+        self.assertEqual(st.query(1, 1, 1, 2), 11)
+        st.update(0, 1, 10)
+        self.assertEqual(st.query(0, 0, 0, 2), 14)
+
+    def test_random_operations(self):
+        rand = random.Random(53)
+        for monoid, aggregate in [(SUM, sum), (MIN, min), (MAX, max)]:
+            for rows, columns in [(1, 1), (3, 7), (8, 8), (5, 13)]:
+                grid = [[rand.randint(-9, 9) for _ in xrange(columns)]
+                        for _ in xrange(rows)]
+                st = SegmentTree2D([row[:] for row in grid], monoid)
+                for _ in xrange(100):
+                    row, column = rand.randrange(rows), rand.randrange(columns)
+                    grid[row][column] = rand.randint(-9, 9)
+                    st.update(row, column, grid[row][column])
+
+                    top, left = rand.randrange(rows), rand.randrange(columns)
+                    bottom = rand.randint(top, rows - 1)
+                    right = rand.randint(left, columns - 1)
+                    self.assertEqual(
+                        st.query(top, left, bottom, right),
+                        aggregate(grid[r][c] for r in xrange(top, bottom + 1)
+                                  for c in xrange(left, right + 1)))
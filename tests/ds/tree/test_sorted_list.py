@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.sorted_list
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.sorted_list import SortedList
+
+from bisect import bisect_left, bisect_right
+import random
+import unittest
+
+
+class TestSortedList(unittest.TestCase):
+    def test_exceptions(self):
+        self.assertRaises(ValueError, SortedList, load=1)
+        sl = SortedList()
+        self.assertRaises(KeyError, sl.delete, 1)
+        self.assertRaises(Exception, sl.kth_smallest_key, 1)
+        self.assertRaises(Exception, sl.kth_successor, 1, 1)
+        sl = SortedList([1, 3])
+        self.assertRaises(KeyError, sl.delete, 2)
+        self.assertRaises(KeyError, sl.delete, 4)
+        self.assertRaises(IndexError, sl.kth_smallest_key, 0)
+        self.assertRaises(IndexError, sl.kth_smallest_key, 3)
+        self.assertRaises(IndexError, sl.kth_successor, 1, 3)
+        self.assertRaises(KeyError, sl.kth_successor, 1, 2)
+
+    def test_basic_operations(self):
+        sl = SortedList([8, 3, 2, 5, 4, 6, 12, 13, 10, 7])
+        sl.insert(9)
+        sl.delete(12)
+        self.assertTrue(sl.search(9))
+        self.assertFalse(sl.search(12))
+        self.assertIn(13, sl)
+        self.assertEqual(sl.sorted_keys(), [2, 3, 4, 5, 6, 7, 8, 9, 10, 13])
+        self.assertEqual(list(reversed(sl)), [13, 10, 9, 8, 7, 6, 5, 4, 3, 2])
+        self.assertEqual(len(sl), 10)
+
+    def test_order_statistics(self):
+        sl = SortedList([8, 3, 2, 5, 4, 6, 12, 13, 10, 7])
+        self.assertEqual(sl.kth_smallest_key(1), 2)
+        self.assertEqual(sl.kth_smallest_key(7), 8)
+        self.assertEqual(sl.kth_largest_key(1), 13)
+        self.assertEqual(sl.kth_successor(0, 8), 8)
+        self.assertEqual(sl.kth_successor(3, 5), 8)
+        self.assertEqual(sl.rank(9), 7)
+        self.assertEqual(sl.count_range(4, 8), 5)
+        self.assertEqual(sl.percentile(25), 4)
+
+    def test_against_sorted_list(self):
+        # A small load factor to exercise the splits and merges.
+        sl = SortedList(load=4)
+        expected = []
+        for _ in xrange(2000):
+            key = random.randint(0, 100)
+            if expected and random.random() < 0.45:
+                key = random.choice(expected)
+                sl.delete(key)
+                expected.remove(key)
+            else:
+                sl.insert(key)
+                expected.append(key)
+            expected.sort()
+
+            if random.random() < 0.1:
+                self.assertEqual(sl.sorted_keys(), expected)
+                if expected:
+                    k = random.randint(1, len(expected))
+                    self.assertEqual(sl.kth_smallest_key(k), expected[k - 1])
+                self.assertEqual(sl.rank(key), bisect_left(expected, key))
+                self.assertEqual(sl.count_range(key, key + 10),
+                                 bisect_right(expected, key + 10) -
+                                 bisect_left(expected, key))
+
+        for values in sl._lists:
+            self.assertLessEqual(len(values), 8)
+        self.assertEqual(len(sl), len(expected))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.sparse_table
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.segment_tree import SegmentTree
+from zahlen.ds.tree.sparse_table import BlockSparseTable, SparseTable
+
+import random
+import unittest
+
+
+class SparseTableTestCase(unittest.TestCase):
+    sparse_table = SparseTable
+
+    def test_empty_list_exception(self):
+        self.assertRaises(ValueError, self.sparse_table, [])
+
+    def test_invalid_range_exception(self):
+        st = self.sparse_table([2, 1, 0, 3])
+        self.assertRaises(IndexError, st.query, -1, 2)
+        self.assertRaises(IndexError, st.query, 3, 1)
+        self.assertRaises(IndexError, st.query, 1, 6)
+
+    def test_single_element(self):
+        self.assertEqual(self.sparse_table([10]).query(0, 0), 0)
+
+    def test_all_equal_elements(self):
+        st = self.sparse_table([1] * 100)
+        self.assertEqual(st.query(0, 99), 99)
+        self.assertEqual(st.query(2, 70), 70)
+        self.assertEqual(st.query(31, 32), 32)
+        self.assertEqual(st.query(5, 5), 5)
+
+    def test_sorted_elements(self):
+        st = self.sparse_table(range(100))
+        self.assertEqual(st.query(0, 99), 0)
+        self.assertEqual(st.query(33, 97), 33)
+        st = self.sparse_table(range(100, 0, -1))
+        self.assertEqual(st.query(0, 99), 99)
+        self.assertEqual(st.query(33, 97), 97)
+
+    def test_same_as_segment_tree(self):
+        rand = random.Random(29)
+        for size in [1, 2, 3, 31, 32, 33, 64, 100, 257]:
+            elements = [rand.randint(-10, 10) for _ in xrange(size)]
+            expected = SegmentTree(elements)
+            actual = self.sparse_table(elements)
+            for _ in xrange(300):
+                start = rand.randrange(size)
+                end = rand.randint(start, size - 1)
+                self.assertEqual(actual.query(start, end),
+                                 expected.query(start, end))
+
+
+class TestBlockSparseTable(SparseTableTestCase):
+    sparse_table = BlockSparseTable
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.suffix_array
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.suffix_array import SuffixArray
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+
+def naive_lcp(first, second):
+    common = 0
+    while common < min(len(first), len(second)) and \
+            first[common] == second[common]:
+        common += 1
+    return common
+
+
+class TestBuild(unittest.TestCase):
+    def assert_suffix_array(self, text):
+        sa = SuffixArray(text)
+        expected = sorted(xrange(len(text)), key=lambda i: text[i:])
+        self.assertListEqual(list(sa.suffixes), expected)
+
+        expected_lcp = [0] + [naive_lcp(text[expected[i - 1]:],
+                                        text[expected[i]:])
+                              for i in xrange(1, len(text))]
+        self.assertListEqual(list(sa.lcp), expected_lcp)
+
+    def test_empty_text(self):
+        sa = SuffixArray('')
+        self.assertEqual(len(sa), 0)
+        self.assertEqual(sa.count('a'), 0)
+
+    def test_banana(self):
+        sa = SuffixArray('banana')
+        self.assertListEqual(list(sa.suffixes), [5, 3, 1, 0, 4, 2])
+        self.assertListEqual(list(sa.lcp), [0, 1, 3, 0, 0, 2])
+
+    def test_repeated_characters(self):
+        self.assert_suffix_array('a')
+        self.assert_suffix_array('aaaaaaaaa')
+
+    def test_texts(self):
+        self.assert_suffix_array('mississippi')
+        self.assert_suffix_array('abracadabra')
+        self.assert_suffix_array('dedododeeodo')
+
+    def test_random_texts(self):
+        rand = random.Random(3)
+        for _ in xrange(50):
+            length = rand.randint(1, 80)
+            self.assert_suffix_array(
+                ''.join(rand.choice('abc') for _ in xrange(length)))
+
+
+class TestQueries(unittest.TestCase):
+    def setUp(self):
+        self.text = 'mississippi'
+        self.sa = SuffixArray(self.text)
+
+    def occurrences(self, pattern):
+        return [i for i in xrange(len(self.text) - len(pattern) + 1)
+                if self.text.startswith(pattern, i)]
+
+    def test_contains(self):
+        for pattern in ['m', 'issi', 'sis', 'ppi', 'mississippi']:
+            self.assertTrue(self.sa.contains(pattern))
+        for pattern in ['x', 'sss', 'mississippis', 'pm', 'ia']:
+            self.assertFalse(self.sa.contains(pattern))
+
+    def test_count(self):
+        for pattern in ['i', 's', 'ss', 'issi', 'p', 'mississippi', 'x']:
+            self.assertEqual(self.sa.count(pattern),
+                             len(self.occurrences(pattern)))
+
+    def test_find_all(self):
+        for pattern in ['i', 's', 'ssi', 'issi', 'pp', 'mississippi', 'x']:
+            self.assertListEqual(sorted(self.sa.find_all(pattern)),
+                                 self.occurrences(pattern))
+
+    def test_longest_repeated_substring(self):
+        self.assertEqual(self.sa.longest_repeated_substring(), 'issi')
+        self.assertEqual(SuffixArray('abcd').longest_repeated_substring(), '')
+
+
+class TestPersistence(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'index.sa')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_save_and_load(self):
+        text = 'abracadabra'
+        sa = SuffixArray(text)
+        sa.save(self.path)
+
+        loaded = SuffixArray.load(self.path, text)
+        self.assertListEqual([loaded.suffixes[i] for i in xrange(len(text))],
+                             list(sa.suffixes))
+        self.assertListEqual([loaded.lcp[i] for i in xrange(len(text))],
+                             list(sa.lcp))
+        self.assertEqual(loaded.count('abra'), 2)
+        self.assertListEqual(sorted(loaded.find_all('a')), [0, 3, 5, 7, 10])
+
+    def test_save_loaded(self):
+        text = 'banana'
+        SuffixArray(text).save(self.path)
+        copy = os.path.join(self.directory, 'copy.sa')
+        SuffixArray.load(self.path, text).save(copy)
+        self.assertListEqual(list(SuffixArray.load(copy, text).find_all('an')),
+                             list(SuffixArray(text).find_all('an')))
+
+    def test_load_text_length_mismatch_exception(self):
+        SuffixArray('banana').save(self.path)
+        self.assertRaises(ValueError, SuffixArray.load, self.path, 'bananas')
+
+    def test_load_invalid_file_exception(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'\0' * 64)
+        self.assertRaises(ValueError, SuffixArray.load, self.path, 'banana')
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.suffix_tree
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.suffix_tree import SuffixTree, longest_common_substring
+
+import random
+import unittest
+
+
+def get_suffix_tree(text):
+    st = SuffixTree(text)
+    st.build()
+    return st
+
+
+def leaf_suffixes(st):
+    """Return the suffixes spelled out by the root to leaf paths."""
+    suffixes = []
+    stack = [(st._root, '')]
+    while stack:
+        vertex, prefix = stack.pop()
+        prefix += st.vertex2substring(vertex)
+        if vertex.is_leaf():
+            suffixes.append(prefix)
+        else:
+            for child in vertex.children.itervalues():
+                stack.append((child, prefix))
+    return sorted(suffixes)
+
+
+class TestBuild(unittest.TestCase):
+    def assert_suffixes(self, text):
+        st = get_suffix_tree(text)
+        text += '$'
+        expected = sorted(text[i:] for i in xrange(len(text)))
+        self.assertListEqual(leaf_suffixes(st), expected)
+
+    def test_empty_text(self):
+        self.assert_suffixes('')
+
+    def test_single_character(self):
+        self.assert_suffixes('a')
+
+    def test_distinct_characters(self):
+        self.assert_suffixes('abcdef')
+
+    def test_repeated_characters(self):
+        self.assert_suffixes('cxccc')
+        self.assert_suffixes('aaaaaaa')
+
+    def test_repeated_substrings(self):
+        self.assert_suffixes('banana')
+        self.assert_suffixes('mississippi')
+        self.assert_suffixes('abcabxabcd')
+        self.assert_suffixes('dedododeeodo')
+
+    def test_random_texts(self):
+        rand = random.Random(7)
+        for _ in xrange(50):
+            length = rand.randint(1, 60)
+            self.assert_suffixes(
+                ''.join(rand.choice('ab') for _ in xrange(length)))
+
+    def test_internal_vertices_branch(self):
+        """Every internal vertex, except the root, has at least 2 children."""
+        st = get_suffix_tree('abracadabra')
+        stack = list(st._root.children.values())
+        while stack:
+            vertex = stack.pop()
+            if not vertex.is_leaf():
+                self.assertGreaterEqual(len(vertex.children), 2)
+                stack.extend(vertex.children.values())
+
+    def test_long_repetitive_text(self):
+        """Construction must not recurse on long runs of a character."""
+        st = get_suffix_tree('a' * 5000)
+        self.assertEqual(len(leaf_suffixes(st)), 5001)
+
+
+class TestQueries(unittest.TestCase):
+    def setUp(self):
+        self.text = 'mississippi'
+        self.st = get_suffix_tree(self.text)
+
+    def occurrences(self, pattern):
+        return [i for i in xrange(len(self.text) - len(pattern) + 1)
+                if self.text.startswith(pattern, i)]
+
+    def test_contains(self):
+        for pattern in ['m', 'issi', 'ssippi', 'mississippi', 'pi']:
+            self.assertTrue(self.st.contains(pattern))
+        for pattern in ['x', 'sps', 'ppi$x', 'mississippis', 'pm', 'sss']:
+            self.assertFalse(self.st.contains(pattern))
+
+    def test_contains_0_len(self):
+        self.assertTrue(self.st.contains(''))
+
+    def test_count(self):
+        for pattern in ['i', 's', 'ss', 'issi', 'p', 'ippi', 'mississippi',
+                        'x', 'sis', 'sss']:
+            self.assertEqual(self.st.count(pattern),
+                             len(self.occurrences(pattern)))
+
+    def test_find_all(self):
+        for pattern in ['i', 's', 'ssi', 'issi', 'pp', 'mississippi', 'x']:
+            self.assertListEqual(sorted(self.st.find_all(pattern)),
+                                 self.occurrences(pattern))
+
+    def test_sentinel_is_not_matched(self):
+        for pattern in ['$', 'i$', 'pi$', 'mississippi$']:
+            self.assertFalse(self.st.contains(pattern))
+            self.assertEqual(self.st.count(pattern), 0)
+            self.assertListEqual(list(self.st.find_all(pattern)), [])
+
+    def test_find_all_is_lazy(self):
+        positions = self.st.find_all('s')
+        self.assertIn(next(positions), [2, 3, 5, 6])
+
+    def test_random_texts(self):
+        rand = random.Random(11)
+        for _ in xrange(20):
+            self.text = ''.join(rand.choice('abc') for _ in xrange(40))
+            self.st = get_suffix_tree(self.text)
+            for length in xrange(1, 5):
+                start = rand.randint(0, len(self.text) - length)
+                pattern = self.text[start:start + length]
+                self.assertEqual(self.st.count(pattern),
+                                 len(self.occurrences(pattern)))
+                self.assertListEqual(sorted(self.st.find_all(pattern)),
+                                     self.occurrences(pattern))
+
+
+class TestLongestSubstrings(unittest.TestCase):
+    def test_longest_repeated_substring(self):
+        self.assertEqual(
+            get_suffix_tree('banana').longest_repeated_substring(), 'ana')
+        self.assertEqual(
+            get_suffix_tree('mississippi').longest_repeated_substring(),
+            'issi')
+        self.assertEqual(
+            get_suffix_tree('aaaa').longest_repeated_substring(), 'aaa')
+
+    def test_no_repeated_substring(self):
+        self.assertEqual(
+            get_suffix_tree('abcd').longest_repeated_substring(), '')
+        self.assertEqual(get_suffix_tree('').longest_repeated_substring(), '')
+
+    def test_longest_common_substring(self):
+        self.assertEqual(longest_common_substring('xabxac', 'abcabxabcd'),
+                         'abxa')
+        self.assertEqual(longest_common_substring('banana', 'ananas'),
+                         'anana')
+        self.assertEqual(longest_common_substring('abc', 'abc'), 'abc')
+
+    def test_no_common_substring(self):
+        self.assertEqual(longest_common_substring('abc', 'xyz'), '')
+        self.assertEqual(longest_common_substring('', 'xyz'), '')
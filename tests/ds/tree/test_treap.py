@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.treap
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.treap import (Node, OrderStatisticsTreap, Treap,
+                                  WeightedNode)
+from test_avl_tree import assert_valid_weights
+
+import random
+import unittest
+
+
+def get_treap(keys, tree_type=Treap, node_type=Node):
+    treap = tree_type(node_type)
+    for key in keys:
+        treap.insert(key)
+    return treap
+
+
+class TestTreap(unittest.TestCase):
+    def setUp(self):
+        # The node priorities are drawn from the random module.
+        random.seed(53)
+
+    def test_insert_and_delete(self):
+        rand = random.Random(61)
+        keys = rand.sample(xrange(1000), 300)
+        treap = get_treap(keys)
+        self.assertTrue(treap.is_balanced())
+        self.assertListEqual(treap.sorted_keys(), sorted(keys))
+
+        rand.shuffle(keys)
+        for index, key in enumerate(keys):
+            treap.delete(key)
+            self.assertFalse(treap.search(key))
+            if index % 50 == 0:
+                self.assertTrue(treap.is_balanced())
+                self.assertListEqual(treap.sorted_keys(),
+                                     sorted(keys[index + 1:]))
+        self.assertIsNone(treap.root)
+        self.assertRaises(KeyError, treap.delete, 1)
+
+    def test_from_sorted(self):
+        rand = random.Random(101)
+        for size in [0, 1, 2, 7, 200]:
+            treap = Treap.from_sorted(xrange(size), Node)
+            self.assertTrue(treap.is_balanced())
+            self.assertListEqual(treap.sorted_keys(), range(size))
+
+            keys = range(size, size + 50)
+            for key in keys:
+                treap.insert(key)
+            rand.shuffle(keys)
+            for key in keys[:25] + range(size // 2):
+                treap.delete(key)
+            self.assertTrue(treap.is_balanced())
+
+        treap = OrderStatisticsTreap.from_sorted(xrange(20), WeightedNode)
+        self.assertTrue(treap.is_balanced())
+        assert_valid_weights(self, treap.root)
+
+    def test_duplicate_keys(self):
+        treap = get_treap([5, 3, 5, 5, 1])
+        self.assertListEqual(treap.sorted_keys(), [1, 3, 5, 5, 5])
+        treap.delete(5)
+        self.assertListEqual(treap.sorted_keys(), [1, 3, 5, 5])
+
+    def test_split_and_join(self):
+        treap = get_treap(random.Random(67).sample(xrange(100), 100))
+        larger = treap.split(40)
+        self.assertListEqual(treap.sorted_keys(), range(40))
+        self.assertListEqual(larger.sorted_keys(), range(40, 100))
+        self.assertIsNone(larger.root.parent)
+        self.assertRaises(ValueError, larger.join, treap)
+
+        treap.join(larger)
+        self.assertListEqual(treap.sorted_keys(), range(100))
+        self.assertIsNone(larger.root)
+        self.assertTrue(treap.is_balanced())
+
+
+class TestOrderStatisticsTreap(unittest.TestCase):
+    def setUp(self):
+        random.seed(59)
+
+    def test_weights(self):
+        keys = random.Random(71).sample(xrange(1000), 200)
+        treap = get_treap(keys, OrderStatisticsTreap, WeightedNode)
+        for key in keys[:100]:
+            treap.delete(key)
+        assert_valid_weights(self, treap.root)
+
+        remaining = sorted(keys[100:])
+        for k, key in enumerate(remaining, 1):
+            self.assertEqual(treap.kth_smallest_key(k), key)
+        self.assertEqual(treap.count_range(remaining[10], remaining[19]), 10)
+
+        larger = treap.split(remaining[50])
+        assert_valid_weights(self, treap.root)
+        assert_valid_weights(self, larger.root)
+        self.assertEqual(larger.kth_smallest_key(1), remaining[50])
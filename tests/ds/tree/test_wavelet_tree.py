@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Test case module for zahlen.ds.tree.wavelet_tree
+
+    :copyright: (c) 2014 by Subhajit Ghosh.
+    :license: MIT, see LICENSE for more details.
+"""
+
+from zahlen.ds.tree.wavelet_tree import WaveletTree
+
+from bisect import bisect_left
+import random
+import unittest
+
+
+class TestWaveletTree(unittest.TestCase):
+    def test_exceptions(self):
+        self.assertRaises(ValueError, WaveletTree, [])
+        wt = WaveletTree([5, 1, 4])
+        self.assertRaises(IndexError, wt.kth_smallest, -1, 1, 1)
+        self.assertRaises(IndexError, wt.kth_smallest, 2, 1, 1)
+        self.assertRaises(IndexError, wt.kth_smallest, 0, 3, 1)
+        self.assertRaises(IndexError, wt.kth_smallest, 0, 1, 0)
+        self.assertRaises(IndexError, wt.kth_smallest, 0, 1, 3)
+        self.assertRaises(IndexError, wt.count_less, 0, 3, 1)
+
+    def test_queries(self):
+        wt = WaveletTree([5, 1, 4, 1, 3, 9, 2])
+        self.assertEqual(len(wt), 7)
+        self.assertEqual(wt.kth_smallest(1, 4, 1), 1)
+        self.assertEqual(wt.kth_smallest(1, 4, 2), 1)
+        self.assertEqual(wt.kth_smallest(1, 4, 3), 3)
+        self.assertEqual(wt.kth_smallest(0, 6, 7), 9)
+        self.assertEqual(wt.kth_smallest(5, 5, 1), 9)
+        self.assertEqual(wt.count_less(0, 6, 4), 4)
+        self.assertEqual(wt.count_less(0, 6, 0), 0)
+        self.assertEqual(wt.count_less(0, 6, 10), 7)
+        self.assertEqual(wt.count_less(2, 5, 9), 3)
+        self.assertEqual(wt.count_less(2, 5, 3.5), 2)
+
+    def test_single_value(self):
+        wt = WaveletTree(['a'] * 5)
+        self.assertEqual(wt.kth_smallest(0, 4, 5), 'a')
+        self.assertEqual(wt.count_less(0, 4, 'a'), 0)
+        self.assertEqual(wt.count_less(0, 4, 'b'), 5)
+
+    def test_against_sorted_slices(self):
+        size = 300
+        elements = [random.randint(-50, 50) for _ in xrange(size)]
+        wt = WaveletTree(elements)
+        for _ in xrange(300):
+            start = random.randrange(size)
+            end = random.randrange(start, size)
+            ordered = sorted(elements[start:end + 1])
+            k = random.randint(1, len(ordered))
+            self.assertEqual(wt.kth_smallest(start, end, k), ordered[k - 1])
+            value = random.randint(-55, 55)
+            self.assertEqual(wt.count_less(start, end, value),
+                             bisect_left(ordered, value))
+
+
+if __name__ == '__main__':
+    unittest.main()
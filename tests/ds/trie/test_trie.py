@@ -108,5 +108,31 @@ class TestTrieWithAddWords(TestTrieWithAddWord):
                              'all', 'also', 'abbrev', 'beast', 'beast', 'beast',
                              'z'])
 
+
+class TestTrieFromSorted(TestTrieWithAddWord):
+    def setUp(self):
+        self.trie = Trie.from_sorted(iter(sorted([
+            'tree', 'trees', 'treaty', 'trie', 'algo', 'assoc', 'all', 'also',
+            'abbrev', 'beast', 'beast', 'beast', 'z'])))
+
+    def test_unsorted_words_exception(self):
+        self.assertRaises(ValueError, Trie.from_sorted, ['trees', 'tree'])
+
+    def test_empty_input(self):
+        trie = Trie.from_sorted([])
+        self.assertEqual(trie.prefix_count('a'), 0)
+        self.assertEqual(trie.search('a'), False)
+
+    def test_same_counts_as_add_words(self):
+        words = sorted(['a', 'ab', 'abc', 'abd', 'b', 'ba', 'ba', 'bab'])
+        trie = Trie()
+        trie.add_words(words)
+        bulk = Trie.from_sorted(words)
+        for prefix in ['a', 'ab', 'abc', 'abd', 'b', 'ba', 'bab', 'c']:
+            self.assertEqual(bulk.prefix_count(prefix),
+                             trie.prefix_count(prefix))
+            self.assertEqual(bulk.word_count(prefix), trie.word_count(prefix))
+
+
 if __name__ == '__main__':
     unittest.main()